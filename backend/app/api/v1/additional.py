@@ -1,27 +1,48 @@
 """Additional API endpoints for tournament features."""
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, Body
+from sqlalchemy import select, delete, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
 from datetime import datetime
 from pydantic import BaseModel
 
-from app.core import get_db
+from app.core import get_db, get_read_db
+from app.core.cache import TOTAL_COUNT_HEADER, cached_count, cached_response
+from app.core.expand import EXPAND_DESCRIPTION, embed_teams, parse_expand
+from app.core.fields import (
+    FIELDS_DESCRIPTION, column_options, parse_fields, sparse_response, sparse_schema
+)
+from app.core.invalidation import publish
+from app.core.conditional import latest
+from app.core.pagination import Keyset, keyset_page
+from app.core.reference import reference_data
 from app.models.additional import (
-    MatchScoringDetail, PoolMaster, PoolDetails, YearMaster,
-    Honour, Dedicated, Ticker, ImageOfDay, PositionMaster,
-    MatchReport, Streaming, Timer, CapacityMaster, LevelMaster,
+    MatchScoringDetail, PoolMaster, PoolDetails,
+    Honour, Dedicated, Ticker, ImageOfDay,
+    MatchReport, Streaming, Timer,
     IdentityMaster, TeamPlayerScoringDetail
 )
 from app.schemas.additional import (
     MatchScoringDetailResponse, PoolMasterResponse, PoolDetailsResponse,
-    YearMasterResponse, HonourResponse, DedicatedResponse, TickerResponse,
+    PoolDetailsExpandedResponse, YearMasterResponse, HonourResponse,
+    HonourExpandedResponse, DedicatedResponse, TickerResponse,
     ImageOfDayResponse, PositionMasterResponse, MatchReportResponse,
     StreamingResponse, TimerResponse, CapacityMasterResponse, LevelMasterResponse,
-    IdentityMasterResponse, TeamPlayerScoringDetailResponse, TimerUpdate
+    IdentityMasterResponse, TeamPlayerScoringDetailResponse, TimerUpdate,
+    MatchScoringDetailCreate, MatchScoringDetailUpdate
 )
+from app.schemas.common import CursorPage
+from app.services.leaderboards import apply_detail, revert_detail
+from app.services.standings import rebuild_pool
 
 router = APIRouter()
 
+# Keyset orders; each has a composite index on (filter columns, keys, id)
+SCORING_ORDER = Keyset(MatchScoringDetail.player_id, MatchScoringDetail.id)
+HONOUR_ORDER = Keyset(desc(Honour.year), desc(Honour.id))
+IDENTITY_ORDER = Keyset(IdentityMaster.name, IdentityMaster.id)
+GOAL_ORDER = Keyset(TeamPlayerScoringDetail.time, TeamPlayerScoringDetail.id)
+
 
 class PoolCreate(BaseModel):
     pool_name: str
@@ -39,12 +60,14 @@ class PoolTeamsUpdate(BaseModel):
 
 
 # ===== MATCH SCORING DETAILS =====
-@router.get("/matches/{match_id}/scoring", response_model=List[MatchScoringDetailResponse])
+@router.get("/matches/{match_id}/scoring",
+            response_model=Union[List[MatchScoringDetailResponse], CursorPage[MatchScoringDetailResponse]])
 async def get_match_scoring_details(
     match_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get player statistics for a specific match (goals, cards, fouls).
@@ -53,45 +76,105 @@ async def get_match_scoring_details(
         match_id: Match ID
         skip: Number of records to skip
         limit: Maximum number of records to return
+        cursor: Switches to keyset pagination (see GET /news)
         db: Database session
 
     Returns:
-        List of player statistics for the match
-    """
-    scoring_details = db.query(MatchScoringDetail)\
-        .filter(MatchScoringDetail.match_id == match_id)\
-        .order_by(MatchScoringDetail.player_id)\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+        List of player statistics for the match, or one page of them when
+        ``cursor`` is given
+    """
+    query = select(MatchScoringDetail).filter(MatchScoringDetail.match_id == match_id)
+    if cursor is not None:
+        items, next_cursor = await keyset_page(db, query, SCORING_ORDER, cursor, limit)
+        return {"items": items, "next_cursor": next_cursor}
+
+    result = await db.execute(
+        query
+        .order_by(MatchScoringDetail.player_id)
+        .offset(skip)
+        .limit(limit)
+    )
+    scoring_details = result.scalars().all()
 
     return scoring_details
 
 
+@router.post("/matches/{match_id}/scoring", response_model=MatchScoringDetailResponse,
+             status_code=status.HTTP_201_CREATED)
+async def create_match_scoring_detail(
+    match_id: int,
+    detail: MatchScoringDetailCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """Record a player's statistics for a match and add them to the leaderboards."""
+    new_detail = MatchScoringDetail(match_id=match_id, **detail.dict())
+    db.add(new_detail)
+    await apply_detail(db, new_detail)
+    await db.commit()
+    await db.refresh(new_detail)
+    await publish("scoring")
+    return new_detail
+
+
+@router.put("/scoring/{detail_id}", response_model=MatchScoringDetailResponse)
+async def update_match_scoring_detail(
+    detail_id: int,
+    detail: MatchScoringDetailUpdate,
+    db: AsyncSession = Depends(get_db)
+):
+    """Update a player's match statistics; the leaderboards swap the old values for the new."""
+    db_detail = await db.get(MatchScoringDetail, detail_id)
+    if not db_detail:
+        raise HTTPException(status_code=404, detail="Scoring detail not found")
+
+    await revert_detail(db, db_detail)
+    for key, value in detail.dict(exclude_unset=True).items():
+        setattr(db_detail, key, value)
+    await apply_detail(db, db_detail)
+
+    await db.commit()
+    await db.refresh(db_detail)
+    await publish("scoring")
+    return db_detail
+
+
+@router.delete("/scoring/{detail_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_match_scoring_detail(
+    detail_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """Delete a player's match statistics and take them out of the leaderboards."""
+    db_detail = await db.get(MatchScoringDetail, detail_id)
+    if not db_detail:
+        raise HTTPException(status_code=404, detail="Scoring detail not found")
+
+    await revert_detail(db, db_detail)
+    await db.delete(db_detail)
+    await db.commit()
+    await publish("scoring")
+    return None
+
+
 # ===== POOL/GROUP INFORMATION =====
 @router.get("/pools", response_model=List[PoolMasterResponse])
-async def get_pools(
-    db: Session = Depends(get_db)
-):
+async def get_pools():
     """
     Get list of all pools/groups.
 
     Returns:
         List of pools
     """
-    pools = db.query(PoolMaster)\
-        .filter(PoolMaster.status == True)\
-        .order_by(PoolMaster.pool_name)\
-        .all()
+    snapshot = await reference_data.current()
+    return snapshot.pools
 
-    return pools
 
-
-@router.get("/pools/{year_id}/teams", response_model=List[PoolDetailsResponse])
+@router.get("/pools/{year_id}/teams",
+            response_model=Union[List[PoolDetailsResponse], List[PoolDetailsExpandedResponse]])
 async def get_pool_teams(
     year_id: int,
     pool_id: int = Query(None),
-    db: Session = Depends(get_db)
+    expand: Optional[str] = Query(None, description=EXPAND_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get pool details - which teams are in which pools for a year.
@@ -99,27 +182,33 @@ async def get_pool_teams(
     Args:
         year_id: Tournament year ID
         pool_id: Optional pool ID to filter
+        expand: ``teams`` embeds ``team``
         db: Database session
 
     Returns:
         List of pool details
     """
-    query = db.query(PoolDetails)\
+    expansions = parse_expand(expand)
+    query = select(PoolDetails)\
         .filter(PoolDetails.year_id == year_id, PoolDetails.status == 1)
 
     if pool_id is not None:
         query = query.filter(PoolDetails.pool_id == pool_id)
 
-    pool_details = query.order_by(
-        PoolDetails.pool_id, PoolDetails.team_id).all()
+    result = await db.execute(query.order_by(
+        PoolDetails.pool_id, PoolDetails.team_id))
+    pool_details = result.scalars().all()
+    if "teams" not in expansions:
+        return pool_details
 
-    return pool_details
+    snapshot = await reference_data.current()
+    return [embed_teams(detail, snapshot, team=detail.team_id) for detail in pool_details]
 
 
 @router.post("/pools", response_model=PoolMasterResponse, status_code=status.HTTP_201_CREATED)
 async def create_pool(
     pool: PoolCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new pool."""
     new_pool = PoolMaster(
@@ -128,8 +217,9 @@ async def create_pool(
         status=True
     )
     db.add(new_pool)
-    db.commit()
-    db.refresh(new_pool)
+    await db.commit()
+    await db.refresh(new_pool)
+    await publish("pool")
     return new_pool
 
 
@@ -137,10 +227,10 @@ async def create_pool(
 async def update_pool(
     pool_id: int,
     pool: PoolUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a pool."""
-    db_pool = db.query(PoolMaster).filter(PoolMaster.id == pool_id).first()
+    db_pool = await db.get(PoolMaster, pool_id)
     if not db_pool:
         raise HTTPException(status_code=404, detail="Pool not found")
 
@@ -149,23 +239,25 @@ async def update_pool(
     if pool.pool_category_type:
         db_pool.pool_category_type = pool.pool_category_type
 
-    db.commit()
-    db.refresh(db_pool)
+    await db.commit()
+    await db.refresh(db_pool)
+    await publish("pool")
     return db_pool
 
 
 @router.delete("/pools/{pool_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_pool(
     pool_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a pool."""
-    db_pool = db.query(PoolMaster).filter(PoolMaster.id == pool_id).first()
+    db_pool = await db.get(PoolMaster, pool_id)
     if not db_pool:
         raise HTTPException(status_code=404, detail="Pool not found")
 
     db_pool.status = False
-    db.commit()
+    await db.commit()
+    await publish("pool")
     return None
 
 
@@ -173,19 +265,28 @@ async def delete_pool(
 async def update_pool_teams(
     pool_id: int,
     data: PoolTeamsUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Update teams in a pool."""
+    """
+    Update teams in a pool. Pool membership decides which results count,
+    so the pool's standings are rebuilt in the same transaction; a table
+    kept by hand is left as it is.
+    """
     # Verify pool exists
-    pool = db.query(PoolMaster).filter(PoolMaster.id == pool_id).first()
+    pool = await db.get(PoolMaster, pool_id)
     if not pool:
         raise HTTPException(status_code=404, detail="Pool not found")
 
+    former_team_ids = (await db.execute(select(PoolDetails.team_id).filter(
+        PoolDetails.pool_id == pool_id,
+        PoolDetails.year_id == data.year_id
+    ))).scalars().all()
+
     # Remove existing teams for this pool and year
-    db.query(PoolDetails).filter(
+    await db.execute(delete(PoolDetails).filter(
         PoolDetails.pool_id == pool_id,
         PoolDetails.year_id == data.year_id
-    ).delete()
+    ))
 
     # Add new teams
     for team_id in data.team_ids:
@@ -200,35 +301,44 @@ async def update_pool_teams(
         )
         db.add(new_detail)
 
-    db.commit()
+    await db.flush()
+    rebuilt = await rebuild_pool(db, data.year_id, pool_id, former_team_ids)
+    await db.commit()
+    await publish("pool", *(["standing"] if rebuilt is not None else []))
     return {"message": "Pool teams updated"}
 
 
 # ===== TOURNAMENT YEARS =====
 @router.get("/years", response_model=List[YearMasterResponse])
-async def get_tournament_years(
-    db: Session = Depends(get_db)
-):
+async def get_tournament_years():
     """
     Get list of all tournament years/editions.
 
     Returns:
         List of tournament years
     """
-    years = db.query(YearMaster)\
-        .filter(YearMaster.status == True)\
-        .order_by(YearMaster.year.desc())\
-        .all()
-
-    return years
+    snapshot = await reference_data.current()
+    return snapshot.years
 
 
 # ===== HALL OF HONOUR =====
-@router.get("/honours", response_model=List[HonourResponse])
+async def embed_honour_teams(honours) -> List[dict]:
+    """Honours with ``team_1`` and ``team_2`` embedded."""
+    snapshot = await reference_data.current()
+    return [embed_teams(honour, snapshot, team_1=honour.team_id_1, team_2=honour.team_id_2)
+            for honour in honours]
+
+
+@router.get("/honours", response_model=Union[
+    List[HonourResponse], CursorPage[HonourResponse],
+    List[HonourExpandedResponse], CursorPage[HonourExpandedResponse]])
 async def get_honours(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    expand: Optional[str] = Query(None, description=EXPAND_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get tournament winners/champions by year.
@@ -236,38 +346,65 @@ async def get_honours(
     Args:
         skip: Number of records to skip
         limit: Maximum number of records to return
+        cursor: Switches to keyset pagination (see GET /news)
+        expand: ``teams`` embeds ``team_1`` and ``team_2``
         db: Database session
 
     Returns:
-        List of tournament winners
-    """
-    honours = db.query(Honour)\
-        .order_by(Honour.year.desc())\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
-
-    return honours
-
-
-@router.get("/honours/{year}", response_model=List[HonourResponse])
+        List of tournament winners, or one page of them when ``cursor`` is
+        given
+    """
+    expansions = parse_expand(expand)
+
+    async def load(session: AsyncSession):
+        next_cursor = None
+        if cursor is not None:
+            honours, next_cursor = await keyset_page(
+                session, select(Honour), HONOUR_ORDER, cursor, limit)
+        else:
+            result = await session.execute(
+                select(Honour)
+                .order_by(Honour.year.desc())
+                .offset(skip)
+                .limit(limit)
+            )
+            honours = result.scalars().all()
+
+        if "teams" in expansions:
+            honours = await embed_honour_teams(honours)
+        if cursor is not None:
+            return {"items": honours, "next_cursor": next_cursor}
+        return honours
+
+    item = HonourExpandedResponse if expansions else HonourResponse
+    schema = CursorPage[item] if cursor is not None else List[item]
+    return await cached_response(request, db, "honours", schema, load, count=select(Honour))
+
+
+@router.get("/honours/{year}",
+            response_model=Union[List[HonourResponse], List[HonourExpandedResponse]])
 async def get_honours_by_year(
     year: int,
-    db: Session = Depends(get_db)
+    expand: Optional[str] = Query(None, description=EXPAND_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get tournament winners for a specific year.
 
     Args:
         year: Tournament year
+        expand: ``teams`` embeds ``team_1`` and ``team_2``
         db: Database session
 
     Returns:
         List of winners for that year
     """
-    honours = db.query(Honour)\
-        .filter(Honour.year == year)\
-        .all()
+    expansions = parse_expand(expand)
+    result = await db.execute(
+        select(Honour)
+        .filter(Honour.year == year)
+    )
+    honours = result.scalars().all()
 
     if not honours:
         raise HTTPException(
@@ -275,15 +412,18 @@ async def get_honours_by_year(
             detail=f"No winners found for year {year}"
         )
 
+    if "teams" in expansions:
+        return await embed_honour_teams(honours)
     return honours
 
 
 # ===== DEDICATED/TRIBUTE SECTION =====
 @router.get("/dedicated", response_model=List[DedicatedResponse])
 async def get_dedicated(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get dedicated guests/dignitaries.
@@ -296,20 +436,28 @@ async def get_dedicated(
     Returns:
         List of dedicated guests
     """
-    dedicated = db.query(Dedicated)\
-        .filter(Dedicated.status == True)\
-        .order_by(Dedicated.order_by, Dedicated.name)\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+    active = select(Dedicated).filter(Dedicated.status == True)
+
+    async def load(session: AsyncSession):
+        result = await session.execute(
+            active
+            .order_by(Dedicated.order_by, Dedicated.name)
+            .offset(skip)
+            .limit(limit)
+        )
+        dedicated = result.scalars().all()
 
-    return dedicated
+        return dedicated
+
+    return await cached_response(
+        request, db, "dedicated", List[DedicatedResponse], load, count=active)
 
 
 # ===== NEWS TICKER =====
 @router.get("/ticker", response_model=List[TickerResponse])
 async def get_ticker(
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get active news ticker items.
@@ -317,19 +465,26 @@ async def get_ticker(
     Returns:
         List of active ticker items
     """
-    ticker_items = db.query(Ticker)\
-        .filter(Ticker.status == True)\
-        .order_by(Ticker.date_created.desc())\
-        .limit(10)\
-        .all()
+    async def load(session: AsyncSession):
+        result = await session.execute(
+            select(Ticker)
+            .filter(Ticker.status == True)
+            .order_by(Ticker.date_created.desc())
+            .limit(10)
+        )
+        ticker_items = result.scalars().all()
 
-    return ticker_items
+        return ticker_items
+
+    return await cached_response(
+        request, db, "ticker", List[TickerResponse], load, ttl=30)
 
 
 # ===== IMAGE OF THE DAY =====
 @router.get("/image-of-day", response_model=ImageOfDayResponse)
 async def get_image_of_day(
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get current image of the day.
@@ -337,37 +492,38 @@ async def get_image_of_day(
     Returns:
         Image of the day
     """
-    image = db.query(ImageOfDay)\
-        .filter(ImageOfDay.status == True)\
-        .order_by(ImageOfDay.date_updated.desc())\
-        .first()
-
-    if not image:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No image of the day found"
+    async def load(session: AsyncSession):
+        result = await session.execute(
+            select(ImageOfDay)
+            .filter(ImageOfDay.status == True)
+            .order_by(ImageOfDay.date_updated.desc())
         )
+        image = result.scalars().first()
+
+        if not image:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No image of the day found"
+            )
+
+        return image
 
-    return image
+    return await cached_response(
+        request, db, "image_of_day", ImageOfDayResponse, load, ttl=60,
+        last_modified=lambda item: latest(item, "date_updated"))
 
 
 # ===== PLAYER POSITIONS =====
 @router.get("/positions", response_model=List[PositionMasterResponse])
-async def get_positions(
-    db: Session = Depends(get_db)
-):
+async def get_positions():
     """
     Get list of all player positions.
 
     Returns:
         List of positions
     """
-    positions = db.query(PositionMaster)\
-        .filter(PositionMaster.status == True)\
-        .order_by(PositionMaster.position)\
-        .all()
-
-    return positions
+    snapshot = await reference_data.current()
+    return snapshot.positions
 
 
 # ===== MATCH REPORTS =====
@@ -376,7 +532,7 @@ async def get_match_reports(
     match_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get match report images for a specific match.
@@ -390,11 +546,13 @@ async def get_match_reports(
     Returns:
         List of match report images
     """
-    reports = db.query(MatchReport)\
-        .filter(MatchReport.match_id == match_id)\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+    result = await db.execute(
+        select(MatchReport)
+        .filter(MatchReport.match_id == match_id)
+        .offset(skip)
+        .limit(limit)
+    )
+    reports = result.scalars().all()
 
     return reports
 
@@ -402,7 +560,8 @@ async def get_match_reports(
 # ===== LIVE STREAMING =====
 @router.get("/streaming", response_model=StreamingResponse)
 async def get_streaming(
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get current live streaming link.
@@ -410,23 +569,31 @@ async def get_streaming(
     Returns:
         Live streaming information
     """
-    streaming = db.query(Streaming)\
-        .order_by(Streaming.date_updated.desc())\
-        .first()
-
-    if not streaming:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No streaming link found"
+    async def load(session: AsyncSession):
+        result = await session.execute(
+            select(Streaming)
+            .order_by(Streaming.date_updated.desc())
         )
+        streaming = result.scalars().first()
+
+        if not streaming:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No streaming link found"
+            )
 
-    return streaming
+        return streaming
+
+    return await cached_response(
+        request, db, "streaming", StreamingResponse, load, ttl=30,
+        last_modified=lambda item: latest(item, "date_updated"))
 
 
 # ===== TOURNAMENT TIMER =====
 @router.get("/timer", response_model=TimerResponse)
 async def get_timer(
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get tournament countdown timer.
@@ -434,21 +601,26 @@ async def get_timer(
     Returns:
         Timer information
     """
-    timer = db.query(Timer).first()
+    async def load(session: AsyncSession):
+        result = await session.execute(select(Timer))
+        timer = result.scalars().first()
 
-    if not timer:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No timer found"
-        )
+        if not timer:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No timer found"
+            )
 
-    return timer
+        return timer
+
+    return await cached_response(
+        request, db, "timer", TimerResponse, load)
 
 
 @router.post("/timer", response_model=TimerResponse)
 async def update_timer(
     timer_data: TimerUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update tournament countdown timer.
@@ -460,7 +632,8 @@ async def update_timer(
     Returns:
         Updated timer information
     """
-    timer = db.query(Timer).first()
+    result = await db.execute(select(Timer))
+    timer = result.scalars().first()
 
     # Ensure we have a string, default to empty if None
     new_time = timer_data.timer_time if timer_data.timer_time is not None else ""
@@ -473,55 +646,49 @@ async def update_timer(
         # Update existing timer
         timer.timer_time = new_time
 
-    db.commit()
-    db.refresh(timer)
+    await db.commit()
+    await db.refresh(timer)
+    await publish("timer")
     return timer
 
 
 # ===== CAPACITY MASTER =====
 @router.get("/capacities", response_model=List[CapacityMasterResponse])
-async def get_capacities(
-    db: Session = Depends(get_db)
-):
+async def get_capacities():
     """
     Get list of player capacities.
 
     Returns:
         List of capacities
     """
-    capacities = db.query(CapacityMaster)\
-        .filter(CapacityMaster.status == True)\
-        .order_by(CapacityMaster.capacity)\
-        .all()
-
-    return capacities
+    snapshot = await reference_data.current()
+    return snapshot.capacities
 
 
 # ===== LEVEL MASTER =====
 @router.get("/levels", response_model=List[LevelMasterResponse])
-async def get_levels(
-    db: Session = Depends(get_db)
-):
+async def get_levels():
     """
     Get list of tournament levels.
 
     Returns:
         List of levels
     """
-    levels = db.query(LevelMaster)\
-        .filter(LevelMaster.status == True)\
-        .order_by(LevelMaster.level)\
-        .all()
-
-    return levels
+    snapshot = await reference_data.current()
+    return snapshot.levels
 
 
 # ===== IDENTITY MASTER =====
-@router.get("/identities", response_model=List[IdentityMasterResponse])
+@router.get("/identities",
+            response_model=Union[List[IdentityMasterResponse], CursorPage[IdentityMasterResponse]])
 async def get_identities(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get list of identity records.
@@ -529,28 +696,55 @@ async def get_identities(
     Args:
         skip: Number of records to skip
         limit: Maximum number of records to return
+        cursor: Switches to keyset pagination (see GET /news)
+        fields: Return only these fields (see GET /news)
         db: Database session
 
     Returns:
-        List of identity records
-    """
-    identities = db.query(IdentityMaster)\
-        .filter(IdentityMaster.status == True)\
-        .order_by(IdentityMaster.name)\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+        List of identity records, or one page of them when ``cursor`` is
+        given
+    """
+    selected = parse_fields(fields, IdentityMasterResponse)
+    query = select(IdentityMaster).filter(IdentityMaster.status == True)
+    # Identities are maintained outside the API, so the counter expires by TTL
+    total = await cached_count(request, db, "identities", query)
+    response.headers[TOTAL_COUNT_HEADER] = str(total)
+    if selected is not None:
+        query = query.options(*column_options(
+            IdentityMaster, IdentityMasterResponse, selected, *IDENTITY_ORDER.columns))
+
+    if cursor is not None:
+        items, next_cursor = await keyset_page(db, query, IDENTITY_ORDER, cursor, limit)
+        page = {"items": items, "next_cursor": next_cursor}
+        if selected is not None:
+            item = sparse_schema(IdentityMasterResponse, selected)
+            return sparse_response(CursorPage[item], page, dict(response.headers))
+        return page
+
+    result = await db.execute(
+        query
+        .order_by(IdentityMaster.name)
+        .offset(skip)
+        .limit(limit)
+    )
+    identities = result.scalars().all()
 
+    if selected is not None:
+        item = sparse_schema(IdentityMasterResponse, selected)
+        return sparse_response(List[item], identities, dict(response.headers))
     return identities
 
 
 # ===== TEAM PLAYER SCORING DETAILS =====
-@router.get("/matches/{match_id}/goals", response_model=List[TeamPlayerScoringDetailResponse])
+@router.get("/matches/{match_id}/goals",
+            response_model=Union[List[TeamPlayerScoringDetailResponse],
+                                 CursorPage[TeamPlayerScoringDetailResponse]])
 async def get_match_goals(
     match_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get goal scoring details with timing for a specific match.
@@ -559,16 +753,24 @@ async def get_match_goals(
         match_id: Match ID
         skip: Number of records to skip
         limit: Maximum number of records to return
+        cursor: Switches to keyset pagination (see GET /news)
         db: Database session
 
     Returns:
-        List of goal scoring details with player IDs and timing
-    """
-    goals = db.query(TeamPlayerScoringDetail)\
-        .filter(TeamPlayerScoringDetail.match_id == match_id)\
-        .order_by(TeamPlayerScoringDetail.time)\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+        List of goal scoring details with player IDs and timing, or one
+        page of them when ``cursor`` is given
+    """
+    query = select(TeamPlayerScoringDetail).filter(TeamPlayerScoringDetail.match_id == match_id)
+    if cursor is not None:
+        items, next_cursor = await keyset_page(db, query, GOAL_ORDER, cursor, limit)
+        return {"items": items, "next_cursor": next_cursor}
+
+    result = await db.execute(
+        query
+        .order_by(TeamPlayerScoringDetail.time)
+        .offset(skip)
+        .limit(limit)
+    )
+    goals = result.scalars().all()
 
     return goals
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 
 from app.core import get_db, create_access_token, verify_password, get_password_hash
 from app.core.config import settings
+from app.core.executor import run_blocking
 from app.models.user import User, UserProfile
 from app.schemas.user import UserResponse, UserLogin, Token, UserPasswordUpdate
 from app.api.deps import get_current_active_user
@@ -15,7 +17,7 @@ router = APIRouter()
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     User login endpoint.
@@ -31,9 +33,14 @@ async def login(
         HTTPException: If credentials are invalid
     """
     # Find user by username
-    user = db.query(User).filter(User.username == form_data.username).first()
-
-    if not user or not verify_password(form_data.password, user.password):
+    result = await db.execute(
+        select(User).filter(User.username == form_data.username))
+    user = result.scalars().first()
+
+    # bcrypt is deliberately slow, so keep it off the event loop
+    password_ok = user is not None and await run_blocking(
+        verify_password, form_data.password, user.password)
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -77,7 +84,7 @@ async def get_current_user_info(
 async def change_password(
     password_data: UserPasswordUpdate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Change current user's password.
@@ -93,13 +100,14 @@ async def change_password(
     Raises:
         HTTPException: If current password is incorrect
     """
-    if not verify_password(password_data.current_password, current_user.password):
+    if not await run_blocking(verify_password, password_data.current_password, current_user.password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password"
         )
 
-    current_user.password = get_password_hash(password_data.new_password)
-    db.commit()
+    current_user.password = await run_blocking(
+        get_password_hash, password_data.new_password)
+    await db.commit()
 
     return {"message": "Password updated successfully"}
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
-from sqlalchemy.orm import Session
-from typing import List, Optional
-import shutil
-import os
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, UploadFile, File, Form
+from sqlalchemy import select, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
 from datetime import datetime
 
-from app.core import get_db
-from app.core.config import settings
+from app.core import get_db, get_read_db
+from app.core.cache import cached_response
+from app.core.invalidation import publish
+from app.core.conditional import latest
+from app.core.pagination import Keyset, keyset_page
+from app.core.uploads import save_upload, delete_upload
 from app.models.content import Gallery, Memory, Advertisement
 from app.schemas.content import (
     GalleryResponse,
@@ -14,15 +17,20 @@ from app.schemas.content import (
     MemoryCreate,
     AdvertisementResponse
 )
+from app.schemas.common import CursorPage
 
 router = APIRouter()
 
+GALLERY_ORDER = Keyset(desc(Gallery.date_created), desc(Gallery.id))
 
-@router.get("/gallery", response_model=List[GalleryResponse])
+
+@router.get("/gallery", response_model=Union[List[GalleryResponse], CursorPage[GalleryResponse]])
 async def get_gallery(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get gallery items.
@@ -30,25 +38,39 @@ async def get_gallery(
     Args:
         skip: Number of records to skip
         limit: Maximum number of records to return
+        cursor: Switches to keyset pagination (see GET /news); use it for
+            deep pages of the archive
         db: Database session
 
     Returns:
-        List of gallery items
+        List of gallery items, or one page of them when ``cursor`` is given
     """
-    gallery_items = db.query(Gallery)\
-        .filter(Gallery.status == True, Gallery.parent_image == 0)\
-        .order_by(Gallery.date_created.desc())\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+    query = select(Gallery).filter(Gallery.status == True, Gallery.parent_image == 0)
+
+    async def load(session: AsyncSession):
+        if cursor is not None:
+            items, next_cursor = await keyset_page(session, query, GALLERY_ORDER, cursor, limit)
+            return {"items": items, "next_cursor": next_cursor}
+
+        result = await session.execute(
+            query
+            .order_by(Gallery.date_created.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        gallery_items = result.scalars().all()
 
-    return gallery_items
+        return gallery_items
+
+    schema = CursorPage[GalleryResponse] if cursor is not None else List[GalleryResponse]
+    return await cached_response(request, db, "gallery", schema, load, count=query)
 
 
 @router.get("/gallery/{gallery_id}", response_model=GalleryResponse)
 async def get_gallery_item(
     gallery_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get gallery item details.
@@ -63,23 +85,30 @@ async def get_gallery_item(
     Raises:
         HTTPException: If gallery item not found
     """
-    gallery_item = db.query(Gallery)\
-        .filter(Gallery.id == gallery_id, Gallery.status == True)\
-        .first()
-
-    if not gallery_item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Gallery item not found"
+    async def load(session: AsyncSession):
+        result = await session.execute(
+            select(Gallery)
+            .filter(Gallery.id == gallery_id, Gallery.status == True)
         )
+        gallery_item = result.scalars().first()
 
-    return gallery_item
+        if not gallery_item:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Gallery item not found"
+            )
+
+        return gallery_item
+
+    return await cached_response(
+        request, db, "gallery", GalleryResponse, load,
+        last_modified=lambda item: latest(item, "date_updated", "date_created"))
 
 
 @router.get("/gallery/{gallery_id}/images", response_model=List[GalleryResponse])
 async def get_gallery_images(
     gallery_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all images in a gallery album.
@@ -91,10 +120,12 @@ async def get_gallery_images(
     Returns:
         List of images in the album
     """
-    images = db.query(Gallery)\
-        .filter(Gallery.parent_image == gallery_id, Gallery.status == True)\
-        .order_by(Gallery.date_created.desc())\
-        .all()
+    result = await db.execute(
+        select(Gallery)
+        .filter(Gallery.parent_image == gallery_id, Gallery.status == True)
+        .order_by(Gallery.date_created.desc())
+    )
+    images = result.scalars().all()
 
     return images
 
@@ -102,7 +133,7 @@ async def get_gallery_images(
 @router.post("/memories", response_model=MemoryResponse, status_code=status.HTTP_201_CREATED)
 async def create_memory(
     memory_data: MemoryCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new memory post.
@@ -123,8 +154,8 @@ async def create_memory(
     )
 
     db.add(new_memory)
-    db.commit()
-    db.refresh(new_memory)
+    await db.commit()
+    await db.refresh(new_memory)
 
     return new_memory
 
@@ -135,7 +166,7 @@ async def get_advertisements(
         None, description="Filter by position (sidebar, header, footer, etc.)"),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get active advertisements.
@@ -149,12 +180,13 @@ async def get_advertisements(
     Returns:
         List of active advertisements
     """
-    query = db.query(Advertisement).filter(Advertisement.status == True)
+    query = select(Advertisement).filter(Advertisement.status == True)
 
     if position:
         query = query.filter(Advertisement.position == position)
 
-    ads = query.offset(skip).limit(limit).all()
+    result = await db.execute(query.offset(skip).limit(limit))
+    ads = result.scalars().all()
 
     return ads
 
@@ -165,25 +197,13 @@ async def create_gallery(
     images: List[UploadFile] = File(...),
     parent_image: int = Form(0),
     status: bool = Form(True),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create new gallery item(s)."""
-    upload_dir = os.path.join(settings.UPLOAD_DIR, "gallery")
-    os.makedirs(upload_dir, exist_ok=True)
-
     created_items = []
 
     for image in images:
-        timestamp = int(datetime.now().timestamp())
-        # Use a counter or uuid to ensure uniqueness if multiple files are processed in same second
-        # But for simplicity, we rely on the loop speed not being infinite,
-        # though adding a small random suffix or index is safer.
-        # Let's just append the original filename which should be distinct in a batch usually.
-        filename = f"{timestamp}_{image.filename}"
-        file_path = os.path.join(upload_dir, filename)
-
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(image.file, buffer)
+        filename = await save_upload(image, "gallery")
 
         db_gallery = Gallery(
             title=title,
@@ -196,20 +216,21 @@ async def create_gallery(
             user_updated_by=1
         )
         db.add(db_gallery)
-        db.commit()
-        db.refresh(db_gallery)
+        await db.commit()
+        await db.refresh(db_gallery)
         created_items.append(db_gallery)
 
+    await publish("gallery")
     return created_items
 
 
 @router.delete("/gallery/{gallery_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_gallery(
     gallery_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a gallery item."""
-    db_gallery = db.query(Gallery).filter(Gallery.id == gallery_id).first()
+    db_gallery = await db.get(Gallery, gallery_id)
     if not db_gallery:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -217,14 +238,9 @@ async def delete_gallery(
         )
 
     # Delete file
-    upload_dir = os.path.join(settings.UPLOAD_DIR, "gallery")
-    file_path = os.path.join(upload_dir, db_gallery.image_name)
-    if os.path.exists(file_path):
-        try:
-            os.remove(file_path)
-        except Exception:
-            pass
-
-    db.delete(db_gallery)
-    db.commit()
+    await delete_upload("gallery", db_gallery.image_name)
+
+    await db.delete(db_gallery)
+    await db.commit()
+    await publish("gallery")
     return None
@@ -0,0 +1,96 @@
+"""Leaderboards: top scorers, discipline and team goals of a year."""
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy import desc, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import get_read_db
+from app.core.cache import cached_response
+from app.core.reference import reference_data
+from app.models.additional import PlayerYearStats
+from app.models.team import TeamPlayer
+from app.schemas.leaderboard import LeaderboardResponse
+
+router = APIRouter()
+
+
+async def load_leaderboards(db: AsyncSession, year_id: int, limit: int) -> dict:
+    """
+    Load a year's leaderboards in three queries over the per-year aggregate
+    (see ``app.services.leaderboards``): top scorers and most carded
+    players, each joined to the roster, and goals per team. Teams come from
+    the reference snapshot.
+    """
+    def player_query(*criteria):
+        return (
+            select(PlayerYearStats, TeamPlayer.full_name, TeamPlayer.jersey_no)
+            .outerjoin(TeamPlayer, TeamPlayer.id == PlayerYearStats.player_id)
+            .filter(PlayerYearStats.year_id == year_id, *criteria)
+        )
+
+    scorers = (await db.execute(
+        player_query(PlayerYearStats.goals > 0)
+        .order_by(desc(PlayerYearStats.goals), PlayerYearStats.matches_played,
+                  PlayerYearStats.player_id)
+        .limit(limit)
+    )).all()
+    carded = (await db.execute(
+        player_query(or_(PlayerYearStats.red_card > 0, PlayerYearStats.yellow_card > 0,
+                         PlayerYearStats.green_card > 0))
+        .order_by(desc(PlayerYearStats.red_card), desc(PlayerYearStats.yellow_card),
+                  desc(PlayerYearStats.green_card), PlayerYearStats.player_id)
+        .limit(limit)
+    )).all()
+    goals = func.sum(PlayerYearStats.goals)
+    team_goals = (await db.execute(
+        select(PlayerYearStats.team_id, goals)
+        .filter(PlayerYearStats.year_id == year_id)
+        .group_by(PlayerYearStats.team_id)
+        # Rows whose matches were all deleted stay at zero until a rebuild
+        .having(func.sum(PlayerYearStats.matches_played) > 0)
+        .order_by(desc(goals), PlayerYearStats.team_id)
+    )).all()
+
+    snapshot = await reference_data.current()
+
+    def entry(stats, full_name, jersey_no) -> dict:
+        data = {attr.key: getattr(stats, attr.key) for attr in stats.__mapper__.column_attrs}
+        data.update(player_name=full_name, jersey_no=jersey_no,
+                    team=snapshot.team_summaries.get(stats.team_id))
+        return data
+
+    return {
+        "year_id": year_id,
+        "top_scorers": [entry(*row) for row in scorers],
+        "cards": [entry(*row) for row in carded],
+        "team_goals": [
+            {"team_id": team_id, "team": snapshot.team_summaries.get(team_id),
+             "goals": total or 0}
+            for team_id, total in team_goals
+        ],
+    }
+
+
+@router.get("/{year_id}", response_model=LeaderboardResponse)
+async def get_leaderboards(
+    year_id: int,
+    request: Request,
+    limit: int = Query(10, ge=1, le=100, description="Players per leaderboard"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get a tournament year's leaderboards: top scorers, the most carded
+    players (red, then yellow, then green) and goals per team, with player
+    names and teams embedded.
+
+    Args:
+        year_id: Tournament year ID
+        limit: Players per leaderboard
+        db: Database session
+
+    Returns:
+        Leaderboards for the year
+    """
+    async def load(session: AsyncSession):
+        return await load_leaderboards(session, year_id, limit)
+
+    return await cached_response(request, db, "leaderboards", LeaderboardResponse, load)
@@ -0,0 +1,107 @@
+"""Match centre: one response for a match page."""
+from fastapi import APIRouter, Depends, HTTPException, status, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import get_read_db
+from app.core.cache import cached_response
+from app.core.expand import embed_teams
+from app.core.reference import reference_data
+from app.models.additional import MatchReport, MatchScoringDetail, TeamPlayerScoringDetail
+from app.models.team import TeamPlayer
+from app.models.tournament import Fixture, MatchResult
+from app.schemas.match import MatchCentreResponse
+
+router = APIRouter()
+
+# Goals and reports are entered outside the API, so only fixture, result,
+# player statistics and team writes evict the match centre; this bounds
+# the staleness of the rest
+MATCH_CENTRE_TTL = 30
+
+
+async def load_match_centre(db: AsyncSession, match_id: int) -> dict:
+    """
+    Load a match page in four queries whatever the number of goals, cards
+    or reports: fixture with its result, player statistics and goals (each
+    joined to the roster) and reports. Teams come from the reference
+    snapshot.
+
+    Raises:
+        HTTPException: 404 if the fixture does not exist
+    """
+    row = (await db.execute(
+        select(Fixture, MatchResult)
+        .outerjoin(MatchResult, MatchResult.fixture_id == Fixture.id)
+        .filter(Fixture.id == match_id)
+        .order_by(MatchResult.id.desc())
+        .limit(1)
+    )).first()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Match not found"
+        )
+    fixture, result = row
+
+    def with_player(detail, full_name, jersey_no) -> dict:
+        data = {attr.key: getattr(detail, attr.key) for attr in detail.__mapper__.column_attrs}
+        data.update(player_name=full_name, jersey_no=jersey_no)
+        return data
+
+    def roster_query(model, *order):
+        return (
+            select(model, TeamPlayer.full_name, TeamPlayer.jersey_no)
+            .outerjoin(TeamPlayer, TeamPlayer.id == model.player_id)
+            .filter(model.match_id == match_id)
+            .order_by(*order)
+        )
+
+    player_stats = (await db.execute(roster_query(
+        MatchScoringDetail, MatchScoringDetail.player_id, MatchScoringDetail.id))).all()
+    goals = (await db.execute(roster_query(
+        TeamPlayerScoringDetail, TeamPlayerScoringDetail.time, TeamPlayerScoringDetail.id))).all()
+    reports = (await db.execute(
+        select(MatchReport)
+        .filter(MatchReport.match_id == match_id)
+        .order_by(MatchReport.id)
+    )).scalars().all()
+
+    snapshot = await reference_data.current()
+    return {
+        "fixture": embed_teams(fixture, snapshot,
+                               team_1=fixture.team_id_1, team_2=fixture.team_id_2),
+        "result": result,
+        "winner_team": snapshot.team_summaries.get(result.winner_team_id) if result else None,
+        "player_stats": [with_player(*row) for row in player_stats],
+        "goals": [with_player(*row) for row in goals],
+        "reports": reports,
+    }
+
+
+@router.get("/{match_id}", response_model=MatchCentreResponse)
+async def get_match_centre(
+    match_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get everything a match page shows: the fixture with both teams, the
+    result, per-player statistics and goals with player names, and the
+    match report images.
+
+    Args:
+        match_id: Fixture ID
+        db: Database session
+
+    Returns:
+        Match centre data
+
+    Raises:
+        HTTPException: If the match is not found
+    """
+    async def load(session: AsyncSession):
+        return await load_match_centre(session, match_id)
+
+    return await cached_response(
+        request, db, "matches", MatchCentreResponse, load, ttl=MATCH_CENTRE_TTL)
@@ -1,12 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status as http_status, Query, UploadFile, File, Form
-from sqlalchemy.orm import Session
-from typing import List, Optional
-import shutil
-import os
+from fastapi import APIRouter, Depends, HTTPException, status as http_status, Query, Request, UploadFile, File, Form
+from sqlalchemy import select, desc, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from typing import List, Optional, Union
 from datetime import datetime
 
-from app.core import get_db
-from app.core.config import settings
+from app.core import get_db, get_read_db
+from app.core.cache import cached_response
+from app.core.expand import EXPAND_DESCRIPTION, embed_teams, parse_expand
+from app.core.fields import (
+    FIELDS_DESCRIPTION, column_options, parse_fields, source_fields, sparse_schema
+)
+from app.core.invalidation import publish
+from app.core.conditional import latest
+from app.core.pagination import Keyset, keyset_page
+from app.core.reference import reference_data
+from app.core.uploads import save_upload, delete_upload, upload_url
 from app.models.news import News, NewsImage, Official, Sponsor, Standing
 from app.models.content import Banner
 from app.schemas.news import (
@@ -14,12 +23,20 @@ from app.schemas.news import (
     OfficialResponse,
     SponsorResponse,
     StandingResponse,
+    StandingExpandedResponse,
     NewsUpdate
 )
+from app.schemas.common import CursorPage
 from app.schemas.content import BannerCreate
 
 router = APIRouter()
 
+NEWS_ORDER = Keyset(desc(News.date_created), desc(News.id))
+
+# Pool by pool in rank order; rows not ranked yet fall back to points
+STANDING_ORDER = (Standing.pool_category_type, Standing.pool_id,
+                  Standing.position.is_(None), Standing.position, desc(Standing.points))
+
 
 def sanitize_datetime(obj, date_field):
     """Helper to handle invalid datetime fields."""
@@ -29,11 +46,44 @@ def sanitize_datetime(obj, date_field):
     return date_val
 
 
-@router.get("/news", response_model=List[NewsResponse])
+def news_payload(news: News) -> dict:
+    """
+    Response dict for an article. Columns deferred by ?fields= and images
+    that were not loaded are left out.
+    """
+    unloaded = inspect(news).unloaded
+    payload = {}
+    for key in ("id", "title", "description", "date_created", "status"):
+        if key not in unloaded:
+            payload[key] = getattr(news, key)
+    if "date_updated" not in unloaded:
+        payload["date_updated"] = sanitize_datetime(news, 'date_updated')
+    if "images" not in unloaded:
+        images = [image.news_image for image in news.images]
+        payload["news_image"] = images[0] if images else None
+        payload["news_images"] = images
+    return payload
+
+
+async def load_with_images(db: AsyncSession, news_id: int) -> News:
+    """Re-read an article and its images after a write."""
+    rows = await db.execute(
+        select(News)
+        .options(selectinload(News.images))
+        .filter(News.id == news_id)
+        .execution_options(populate_existing=True)
+    )
+    return rows.scalars().one()
+
+
+@router.get("/news", response_model=Union[List[NewsResponse], CursorPage[NewsResponse]])
 async def get_news(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get list of all news articles.
@@ -41,41 +91,50 @@ async def get_news(
     Args:
         skip: Number of records to skip
         limit: Maximum number of records to return
+        cursor: Switches to keyset pagination: empty for the first page,
+            then the previous page's ``next_cursor``. The response becomes
+            ``{"items": [...], "next_cursor": ...}`` and ``skip`` is ignored
+        fields: Return only these fields, e.g. ``id,title,date_created``
+            for a headline list; other columns are not even loaded
         db: Database session
 
     Returns:
-        List of news articles
+        List of news articles, or one page of them when ``cursor`` is given;
+        X-Total-Count holds the number of published articles
     """
-    news_list = db.query(News)\
-        .filter(News.status.is_(True))\
-        .order_by(News.date_created.desc())\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
-
-    # Sanitize datetime fields and get images
-    result = []
-    for news in news_list:
-        # Fetch image
-        image = db.query(NewsImage).filter(NewsImage.news_id == news.id).first()
-
-        result.append({
-            "id": news.id,
-            "title": news.title,
-            "description": news.description,
-            "date_created": news.date_created,
-            "date_updated": sanitize_datetime(news, 'date_updated'),
-            "status": news.status,
-            "news_image": image.news_image if image else None
-        })
+    published = select(News).filter(News.status.is_(True))
+    selected = parse_fields(fields, NewsResponse)
+    item = NewsResponse
+    query = published
+    if selected is not None:
+        item = sparse_schema(NewsResponse, selected)
+        query = query.options(*column_options(News, NewsResponse, selected, *NEWS_ORDER.columns))
+    if selected is None or source_fields(NewsResponse, selected) & {"news_image", "news_images"}:
+        # Images for the whole page arrive in one extra IN query
+        query = query.options(selectinload(News.images))
+
+    async def load(session: AsyncSession):
+        if cursor is not None:
+            rows, next_cursor = await keyset_page(session, query, NEWS_ORDER, cursor, limit)
+            return {"items": [news_payload(news) for news in rows], "next_cursor": next_cursor}
+
+        rows = await session.execute(
+            query
+            .order_by(News.date_created.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return [news_payload(news) for news in rows.scalars().all()]
 
-    return result
+    schema = CursorPage[item] if cursor is not None else List[item]
+    return await cached_response(request, db, "news", schema, load, count=published)
 
 
 @router.get("/news/{news_id}", response_model=NewsResponse)
 async def get_news_by_id(
     news_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get news article by ID.
@@ -90,28 +149,25 @@ async def get_news_by_id(
     Raises:
         HTTPException: If news not found
     """
-    news = db.query(News)\
-        .filter(News.id == news_id, News.status.is_(True))\
-        .first()
-
-    if not news:
-        raise HTTPException(
-            status_code=http_status.HTTP_404_NOT_FOUND,
-            detail="News article not found"
+    async def load(session: AsyncSession):
+        rows = await session.execute(
+            select(News)
+            .options(selectinload(News.images))
+            .filter(News.id == news_id, News.status.is_(True))
         )
+        news = rows.scalars().first()
 
-    # Fetch image
-    image = db.query(NewsImage).filter(NewsImage.news_id == news.id).first()
+        if not news:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail="News article not found"
+            )
 
-    return {
-        "id": news.id,
-        "title": news.title,
-        "description": news.description,
-        "date_created": news.date_created,
-        "date_updated": sanitize_datetime(news, 'date_updated'),
-        "status": news.status,
-        "news_image": image.news_image if image else None
-    }
+        return news_payload(news)
+
+    return await cached_response(
+        request, db, "news", NewsResponse, load,
+        last_modified=lambda item: latest(item, "date_updated", "date_created"))
 
 
 @router.post("/news", response_model=NewsResponse, status_code=http_status.HTTP_201_CREATED)
@@ -120,7 +176,7 @@ async def create_news(
     description: Optional[str] = Form(None),
     status: bool = Form(True),
     image: Optional[UploadFile] = File(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new news article."""
     # Create news record
@@ -134,23 +190,12 @@ async def create_news(
         user_updated=1
     )
     db.add(db_news)
-    db.commit()
-    db.refresh(db_news)
+    await db.commit()
+    await db.refresh(db_news)
 
     # Handle image upload
-    news_image_name = None
     if image:
-        upload_dir = os.path.join(settings.UPLOAD_DIR, "news")
-        os.makedirs(upload_dir, exist_ok=True)
-
-        timestamp = int(datetime.now().timestamp())
-        filename = f"{timestamp}_{image.filename}"
-        file_path = os.path.join(upload_dir, filename)
-
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(image.file, buffer)
-
-        news_image_name = filename
+        filename = await save_upload(image, "news")
 
         # Create NewsImage record
         db_image = NewsImage(
@@ -158,17 +203,10 @@ async def create_news(
             news_image=filename
         )
         db.add(db_image)
-        db.commit()
+        await db.commit()
 
-    return {
-        "id": db_news.id,
-        "title": db_news.title,
-        "description": db_news.description,
-        "date_created": db_news.date_created,
-        "date_updated": db_news.date_updated,
-        "status": db_news.status,
-        "news_image": news_image_name
-    }
+    await publish("news")
+    return news_payload(await load_with_images(db, db_news.id))
 
 
 @router.put("/news/{news_id}", response_model=NewsResponse)
@@ -178,10 +216,10 @@ async def update_news(
     description: Optional[str] = Form(None),
     status: Optional[bool] = Form(None),
     image: Optional[UploadFile] = File(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a news article."""
-    db_news = db.query(News).filter(News.id == news_id).first()
+    db_news = await db.get(News, news_id)
     if not db_news:
         raise HTTPException(
             status_code=http_status.HTTP_404_NOT_FOUND,
@@ -198,33 +236,17 @@ async def update_news(
     db_news.date_updated = datetime.now()
     db_news.user_updated = 1
 
-    news_image_name = None
-
     # Handle image upload
     if image:
-        upload_dir = os.path.join(settings.UPLOAD_DIR, "news")
-        os.makedirs(upload_dir, exist_ok=True)
-
-        timestamp = int(datetime.now().timestamp())
-        filename = f"{timestamp}_{image.filename}"
-        file_path = os.path.join(upload_dir, filename)
-
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(image.file, buffer)
-
-        news_image_name = filename
+        filename = await save_upload(image, "news")
 
         # Check if image exists
-        db_image = db.query(NewsImage).filter(
-            NewsImage.news_id == news_id).first()
+        db_image = (await db.execute(
+            select(NewsImage).filter(NewsImage.news_id == news_id)
+        )).scalars().first()
         if db_image:
             # Delete old file if exists
-            old_file_path = os.path.join(upload_dir, db_image.news_image)
-            if os.path.exists(old_file_path):
-                try:
-                    os.remove(old_file_path)
-                except Exception:
-                    pass
+            await delete_upload("news", db_image.news_image)
             db_image.news_image = filename
             # db_image.status = True
         else:
@@ -233,34 +255,20 @@ async def update_news(
                 news_image=filename
             )
             db.add(db_image)
-    else:
-        # Get existing image
-        db_image = db.query(NewsImage).filter(
-            NewsImage.news_id == news_id).first()
-        if db_image:
-            news_image_name = db_image.news_image
 
-    db.commit()
-    db.refresh(db_news)
+    await db.commit()
+    await publish("news")
 
-    return {
-        "id": db_news.id,
-        "title": db_news.title,
-        "description": db_news.description,
-        "date_created": db_news.date_created,
-        "date_updated": db_news.date_updated,
-        "status": db_news.status,
-        "news_image": news_image_name
-    }
+    return news_payload(await load_with_images(db, news_id))
 
 
 @router.delete("/news/{news_id}", status_code=http_status.HTTP_204_NO_CONTENT)
 async def delete_news(
     news_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a news article."""
-    db_news = db.query(News).filter(News.id == news_id).first()
+    db_news = await db.get(News, news_id)
     if not db_news:
         raise HTTPException(
             status_code=http_status.HTTP_404_NOT_FOUND,
@@ -268,28 +276,25 @@ async def delete_news(
         )
 
     # Delete associated images
-    db_images = db.query(NewsImage).filter(NewsImage.news_id == news_id).all()
-    upload_dir = os.path.join(settings.UPLOAD_DIR, "news")
-
+    db_images = (await db.execute(
+        select(NewsImage).filter(NewsImage.news_id == news_id)
+    )).scalars().all()
     for img in db_images:
-        file_path = os.path.join(upload_dir, img.news_image)
-        if os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-            except Exception:
-                pass
-        db.delete(img)
-
-    db.delete(db_news)
-    db.commit()
+        await delete_upload("news", img.news_image)
+        await db.delete(img)
+
+    await db.delete(db_news)
+    await db.commit()
+    await publish("news")
     return None
 
 
 @router.get("/officials", response_model=List[OfficialResponse])
 async def get_officials(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get list of all hockey officials.
@@ -302,20 +307,27 @@ async def get_officials(
     Returns:
         List of officials
     """
-    officials = db.query(Official)\
-        .filter(Official.status == True)\
-        .order_by(Official.order_by)\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+    active = select(Official).filter(Official.status == True)
+
+    async def load(session: AsyncSession):
+        rows = await session.execute(
+            active
+            .order_by(Official.order_by)
+            .offset(skip)
+            .limit(limit)
+        )
+        officials = rows.scalars().all()
 
-    return officials
+        return officials
+
+    return await cached_response(
+        request, db, "officials", List[OfficialResponse], load, count=active)
 
 
 @router.get("/officials/{official_id}", response_model=OfficialResponse)
 async def get_official_by_id(
     official_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get official by ID.
@@ -330,9 +342,11 @@ async def get_official_by_id(
     Raises:
         HTTPException: If official not found
     """
-    official = db.query(Official)\
-        .filter(Official.id == official_id, Official.status == True)\
-        .first()
+    rows = await db.execute(
+        select(Official)
+        .filter(Official.id == official_id, Official.status == True)
+    )
+    official = rows.scalars().first()
 
     if not official:
         raise HTTPException(
@@ -345,9 +359,11 @@ async def get_official_by_id(
 
 @router.get("/sponsors", response_model=List[SponsorResponse])
 async def get_sponsors(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db)
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get list of all sponsors.
@@ -355,25 +371,40 @@ async def get_sponsors(
     Args:
         skip: Number of records to skip
         limit: Maximum number of records to return
+        fields: Return only these fields (see GET /news)
         db: Database session
 
     Returns:
         List of sponsors
     """
-    sponsors = db.query(Sponsor)\
-        .filter(Sponsor.status == True)\
-        .order_by(Sponsor.order_by)\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+    active = select(Sponsor).filter(Sponsor.status == True)
+    selected = parse_fields(fields, SponsorResponse)
+    item = SponsorResponse
+    query = active
+    if selected is not None:
+        item = sparse_schema(SponsorResponse, selected)
+        query = query.options(*column_options(Sponsor, SponsorResponse, selected))
+
+    async def load(session: AsyncSession):
+        rows = await session.execute(
+            query
+            .order_by(Sponsor.order_by)
+            .offset(skip)
+            .limit(limit)
+        )
+        sponsors = rows.scalars().all()
+
+        return sponsors
 
-    return sponsors
+    return await cached_response(
+        request, db, "sponsors", List[item], load, count=active)
 
 
 @router.get("/sponsors/{sponsor_id}", response_model=SponsorResponse)
 async def get_sponsor_by_id(
     sponsor_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get sponsor by ID.
@@ -388,17 +419,24 @@ async def get_sponsor_by_id(
     Raises:
         HTTPException: If sponsor not found
     """
-    sponsor = db.query(Sponsor)\
-        .filter(Sponsor.id == sponsor_id, Sponsor.status == True)\
-        .first()
-
-    if not sponsor:
-        raise HTTPException(
-            status_code=http_status.HTTP_404_NOT_FOUND,
-            detail="Sponsor not found"
+    async def load(session: AsyncSession):
+        rows = await session.execute(
+            select(Sponsor)
+            .filter(Sponsor.id == sponsor_id, Sponsor.status == True)
         )
+        sponsor = rows.scalars().first()
+
+        if not sponsor:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail="Sponsor not found"
+            )
+
+        return sponsor
 
-    return sponsor
+    return await cached_response(
+        request, db, "sponsors", SponsorResponse, load,
+        last_modified=lambda item: latest(item, "date_updated", "date_created"))
 
 
 @router.post("/sponsors", response_model=SponsorResponse, status_code=http_status.HTTP_201_CREATED)
@@ -408,21 +446,12 @@ async def create_sponsor(
     order_by: int = Form(0),
     status: bool = Form(True),
     image: Optional[UploadFile] = File(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new sponsor."""
     sponser_image_name = None
     if image:
-        upload_dir = os.path.join(settings.UPLOAD_DIR, "sponsors")
-        os.makedirs(upload_dir, exist_ok=True)
-
-        timestamp = int(datetime.now().timestamp())
-        filename = f"{timestamp}_{image.filename}"
-        file_path = os.path.join(upload_dir, filename)
-
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(image.file, buffer)
-        sponser_image_name = filename
+        sponser_image_name = await save_upload(image, "sponsors")
 
     db_sponsor = Sponsor(
         sponser_name=sponser_name,
@@ -436,8 +465,9 @@ async def create_sponsor(
         user_updated=1
     )
     db.add(db_sponsor)
-    db.commit()
-    db.refresh(db_sponsor)
+    await db.commit()
+    await db.refresh(db_sponsor)
+    await publish("sponsor")
     return db_sponsor
 
 
@@ -449,10 +479,10 @@ async def update_sponsor(
     order_by: Optional[int] = Form(None),
     status: Optional[bool] = Form(None),
     image: Optional[UploadFile] = File(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a sponsor."""
-    db_sponsor = db.query(Sponsor).filter(Sponsor.id == sponsor_id).first()
+    db_sponsor = await db.get(Sponsor, sponsor_id)
     if not db_sponsor:
         raise HTTPException(
             status_code=http_status.HTTP_404_NOT_FOUND,
@@ -469,51 +499,46 @@ async def update_sponsor(
         db_sponsor.status = status
 
     if image:
-        upload_dir = os.path.join(settings.UPLOAD_DIR, "sponsors")
-        os.makedirs(upload_dir, exist_ok=True)
-
-        timestamp = int(datetime.now().timestamp())
-        filename = f"{timestamp}_{image.filename}"
-        file_path = os.path.join(upload_dir, filename)
-
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(image.file, buffer)
-
-        db_sponsor.sponser_image = filename
+        db_sponsor.sponser_image = await save_upload(image, "sponsors")
 
     db_sponsor.date_updated = datetime.now()
     db_sponsor.user_updated = 1  # Default user
 
-    db.commit()
-    db.refresh(db_sponsor)
+    await db.commit()
+    await db.refresh(db_sponsor)
+    await publish("sponsor")
     return db_sponsor
 
 
 @router.delete("/sponsors/{sponsor_id}", status_code=http_status.HTTP_204_NO_CONTENT)
 async def delete_sponsor(
     sponsor_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a sponsor."""
-    db_sponsor = db.query(Sponsor).filter(Sponsor.id == sponsor_id).first()
+    db_sponsor = await db.get(Sponsor, sponsor_id)
     if not db_sponsor:
         raise HTTPException(
             status_code=http_status.HTTP_404_NOT_FOUND,
             detail="Sponsor not found"
         )
 
-    db.delete(db_sponsor)
-    db.commit()
+    await db.delete(db_sponsor)
+    await db.commit()
+    await publish("sponsor")
     return None
 
 
-@router.get("/standings/{year_id}", response_model=List[StandingResponse])
+@router.get("/standings/{year_id}",
+            response_model=Union[List[StandingResponse], List[StandingExpandedResponse]])
 async def get_standings_by_year(
     year_id: int,
+    request: Request,
     pool_id: int = Query(None, description="Filter by pool ID"),
     pool_category_type: int = Query(
         None, description="Filter by pool category type"),
-    db: Session = Depends(get_db)
+    expand: Optional[str] = Query(None, description=EXPAND_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get standings/points table for a tournament year.
@@ -522,12 +547,15 @@ async def get_standings_by_year(
         year_id: Tournament year ID
         pool_id: Optional pool ID filter
         pool_category_type: Optional pool category filter
+        expand: ``teams`` embeds ``team``
         db: Database session
 
     Returns:
-        List of standings
+        List of standings, pool by pool in rank order with ``position``
+        and ``status_pool_winner`` filled in
     """
-    query = db.query(Standing)\
+    expansions = parse_expand(expand)
+    query = select(Standing)\
         .filter(Standing.year_id == year_id)
 
     if pool_id is not None:
@@ -536,14 +564,25 @@ async def get_standings_by_year(
     if pool_category_type is not None:
         query = query.filter(Standing.pool_category_type == pool_category_type)
 
-    standings = query.order_by(Standing.points.desc()).all()
+    async def load(session: AsyncSession):
+        rows = await session.execute(query.order_by(*STANDING_ORDER))
+        standings = rows.scalars().all()
+        if "teams" not in expansions:
+            return standings
 
-    return standings
+        snapshot = await reference_data.current()
+        return [embed_teams(standing, snapshot, team=standing.team_id)
+                for standing in standings]
+
+    schema = List[StandingExpandedResponse] if expansions else List[StandingResponse]
+    # Result writes evict this at once; the short TTL covers hand edits
+    return await cached_response(
+        request, db, "standings", schema, load, ttl=60)
 
 
 @router.get("/banners/active", response_model=List[dict])
 async def get_active_banners(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get active banners for homepage.
@@ -553,15 +592,18 @@ async def get_active_banners(
     """
     from app.models.content import Banner
 
-    banners = db.query(Banner)\
-        .filter(Banner.status == True)\
-        .all()
+    rows = await db.execute(
+        select(Banner)
+        .filter(Banner.status == True)
+    )
+    banners = rows.scalars().all()
 
     result = []
     for banner in banners:
         result.append({
             "id": banner.id,
             "image_name": banner.image_name,
+            "image_url": upload_url("banners", banner.image_name),
             "title_1": banner.title_1,
             "title_2": banner.title_2,
             "title_3": banner.title_3,
@@ -578,7 +620,7 @@ async def create_banner(
     title_2: Optional[str] = Form(None),
     title_3: Optional[str] = Form(None),
     image: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new banner.
@@ -594,16 +636,7 @@ async def create_banner(
         Created banner details
     """
     # Save image
-    upload_dir = os.path.join(settings.UPLOAD_DIR, "banners")
-    os.makedirs(upload_dir, exist_ok=True)
-
-    # Generate unique filename
-    timestamp = int(datetime.now().timestamp())
-    filename = f"{timestamp}_{image.filename}"
-    file_path = os.path.join(upload_dir, filename)
-
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(image.file, buffer)
+    filename = await save_upload(image, "banners")
 
     # Create banner record
     new_banner = Banner(
@@ -618,12 +651,13 @@ async def create_banner(
     )
 
     db.add(new_banner)
-    db.commit()
-    db.refresh(new_banner)
+    await db.commit()
+    await db.refresh(new_banner)
 
     return {
         "id": new_banner.id,
         "image_name": new_banner.image_name,
+        "image_url": upload_url("banners", new_banner.image_name),
         "title_1": new_banner.title_1,
         "title_2": new_banner.title_2,
         "title_3": new_banner.title_3,
@@ -634,7 +668,7 @@ async def create_banner(
 @router.delete("/banners/{banner_id}")
 async def delete_banner(
     banner_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a banner.
@@ -646,7 +680,7 @@ async def delete_banner(
     Returns:
         Success message
     """
-    banner = db.query(Banner).filter(Banner.id == banner_id).first()
+    banner = await db.get(Banner, banner_id)
 
     if not banner:
         raise HTTPException(
@@ -655,13 +689,9 @@ async def delete_banner(
         )
 
     # Delete image file
-    if banner.image_name:
-        file_path = os.path.join(
-            settings.UPLOAD_DIR, "banners", banner.image_name)
-        if os.path.exists(file_path):
-            os.remove(file_path)
-
-    db.delete(banner)
-    db.commit()
+    await delete_upload("banners", banner.image_name)
+
+    await db.delete(banner)
+    await db.commit()
 
     return {"message": "Banner deleted successfully"}
@@ -1,17 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
-from sqlalchemy.orm import Session
-from typing import List, Optional
-import shutil
-import os
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, UploadFile, File, Form
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
 from datetime import datetime
 
-from app.core import get_db
-from app.core.config import settings
+from app.core import get_db, get_read_db
+from app.core.cache import TOTAL_COUNT_HEADER
+from app.core.invalidation import publish
+from app.core.pagination import Keyset, slice_page
+from app.core.reference import reference_data
+from app.core.uploads import save_upload
 from app.models.team import Team, TeamPlayer
+from app.schemas.common import CursorPage
 from app.schemas.team import TeamResponse, TeamPlayerResponse
 
 router = APIRouter()
 
+# Matches the order of ReferenceSnapshot.teams
+TEAM_ORDER = Keyset(Team.team_name, Team.id)
+
 
 @router.post("/", response_model=TeamResponse, status_code=status.HTTP_201_CREATED)
 async def create_team(
@@ -21,18 +28,12 @@ async def create_team(
     team_coach: str = Form(""),
     team_manager: str = Form(""),
     team_logo: UploadFile = File(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new team."""
     logo_filename = ""
     if team_logo:
-        upload_dir = os.path.join(settings.UPLOAD_DIR, "teams")
-        os.makedirs(upload_dir, exist_ok=True)
-        timestamp = int(datetime.now().timestamp())
-        logo_filename = f"{timestamp}_{team_logo.filename}"
-        file_path = os.path.join(upload_dir, logo_filename)
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(team_logo.file, buffer)
+        logo_filename = await save_upload(team_logo, "teams")
 
     new_team = Team(
         team_name=team_name,
@@ -51,8 +52,9 @@ async def create_team(
         status=True
     )
     db.add(new_team)
-    db.commit()
-    db.refresh(new_team)
+    await db.commit()
+    await db.refresh(new_team)
+    await publish("team")
     return new_team
 
 
@@ -65,10 +67,10 @@ async def update_team(
     team_coach: Optional[str] = Form(None),
     team_manager: Optional[str] = Form(None),
     team_logo: UploadFile = File(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a team."""
-    team = db.query(Team).filter(Team.id == team_id).first()
+    team = await db.get(Team, team_id)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
 
@@ -85,38 +87,34 @@ async def update_team(
         team.team_manager = team_manager
 
     if team_logo:
-        upload_dir = os.path.join(settings.UPLOAD_DIR, "teams")
-        os.makedirs(upload_dir, exist_ok=True)
-        timestamp = int(datetime.now().timestamp())
-        logo_filename = f"{timestamp}_{team_logo.filename}"
-        file_path = os.path.join(upload_dir, logo_filename)
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(team_logo.file, buffer)
-        team.team_logo = logo_filename
+        team.team_logo = await save_upload(team_logo, "teams")
 
     team.date_updated = str(datetime.now())
-    db.commit()
-    db.refresh(team)
+    await db.commit()
+    await db.refresh(team)
+    await publish("team")
     return team
 
 
 @router.delete("/{team_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_team(team_id: int, db: Session = Depends(get_db)):
+async def delete_team(team_id: int, db: AsyncSession = Depends(get_db)):
     """Delete a team (soft delete)."""
-    team = db.query(Team).filter(Team.id == team_id).first()
+    team = await db.get(Team, team_id)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
 
     team.status = False
-    db.commit()
+    await db.commit()
+    await publish("team")
     return None
 
 
-@router.get("/", response_model=List[TeamResponse])
+@router.get("/", response_model=Union[List[TeamResponse], CursorPage[TeamResponse]])
 async def get_teams(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None)
 ):
     """
     Get list of all teams.
@@ -124,32 +122,26 @@ async def get_teams(
     Args:
         skip: Number of records to skip
         limit: Maximum number of records to return
-        db: Database session
+        cursor: Switches to keyset pagination (see GET /news)
 
     Returns:
-        List of teams
+        List of teams, or one page of them when ``cursor`` is given
     """
-    teams = db.query(Team)\
-        .filter(Team.status == True)\
-        .order_by(Team.team_name)\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
-
-    return teams
+    snapshot = await reference_data.current()
+    response.headers[TOTAL_COUNT_HEADER] = str(len(snapshot.teams))
+    if cursor is not None:
+        items, next_cursor = slice_page(snapshot.teams, TEAM_ORDER, cursor, limit)
+        return {"items": items, "next_cursor": next_cursor}
+    return snapshot.teams[skip:skip + limit]
 
 
 @router.get("/{team_id}", response_model=TeamResponse)
-async def get_team(
-    team_id: int,
-    db: Session = Depends(get_db)
-):
+async def get_team(team_id: int):
     """
     Get team details by ID.
 
     Args:
         team_id: Team ID
-        db: Database session
 
     Returns:
         Team details
@@ -157,11 +149,10 @@ async def get_team(
     Raises:
         HTTPException: If team not found
     """
-    team = db.query(Team)\
-        .filter(Team.id == team_id, Team.status == True)\
-        .first()
+    snapshot = await reference_data.current()
+    team = snapshot.teams_by_id.get(team_id)
 
-    if not team:
+    if not team or not team.status:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Team not found"
@@ -175,7 +166,7 @@ async def get_team_players(
     team_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all players for a team.
@@ -190,8 +181,9 @@ async def get_team_players(
         List of players for the team
     """
     # First verify team exists
-    team = db.query(Team).filter(
-        Team.id == team_id, Team.status == True).first()
+    result = await db.execute(
+        select(Team).filter(Team.id == team_id, Team.status == True))
+    team = result.scalars().first()
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -199,11 +191,13 @@ async def get_team_players(
         )
 
     # Get players
-    players = db.query(TeamPlayer)\
-        .filter(TeamPlayer.team_id == team_id, TeamPlayer.status == True)\
-        .order_by(TeamPlayer.jersey_no)\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+    result = await db.execute(
+        select(TeamPlayer)
+        .filter(TeamPlayer.team_id == team_id, TeamPlayer.status == True)
+        .order_by(TeamPlayer.jersey_no)
+        .offset(skip)
+        .limit(limit)
+    )
+    players = result.scalars().all()
 
     return players
@@ -1,15 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import select, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
 from datetime import datetime
 from pydantic import BaseModel
 
-from app.core import get_db
-from app.models.tournament import Tournament, Fixture, MatchResult, Category
+from app.core import get_db, get_read_db
+from app.core.cache import TOTAL_COUNT_HEADER, cached_count, cached_response
+from app.core.expand import EXPAND_DESCRIPTION, embed_teams, parse_expand
+from app.core.fields import (
+    FIELDS_DESCRIPTION, column_options, parse_fields, sparse_response, sparse_schema
+)
+from app.core.invalidation import publish
+from app.core.reference import reference_data
+from app.models.tournament import Tournament, Fixture, MatchResult
+from app.services.ranking import rerank
+from app.services.standings import apply_result, fixture_pool, fixture_results, revert_result
 from app.schemas.tournament import (
     TournamentResponse,
     FixtureResponse,
+    FixtureExpandedResponse,
     MatchResultResponse,
+    MatchResultExpandedResponse,
     CategoryResponse,
     FixtureCreate
 )
@@ -42,24 +54,29 @@ class MatchResultUpdate(BaseModel):
 
 
 def sanitize_tournament(tournament):
-    """Convert tournament model to dict with proper datetime handling."""
+    """
+    Convert tournament model to dict with proper datetime handling.
+    Columns deferred by ?fields= are left out.
+    """
+    unloaded = inspect(tournament).unloaded
     data = {
-        "id": tournament.id,
-        "event_title": tournament.event_title,
-        "description": tournament.description,
-        "event_image": tournament.event_image,
-        "status": tournament.status,
-        "date_created": tournament.date_created,
-        "date_updated": None if (isinstance(tournament.date_updated, str) or tournament.date_updated is None) else tournament.date_updated
+        key: getattr(tournament, key)
+        for key in ("id", "event_title", "description", "event_image", "status", "date_created")
+        if key not in unloaded
     }
+    if "date_updated" not in unloaded:
+        data["date_updated"] = None if (isinstance(tournament.date_updated, str) or tournament.date_updated is None) else tournament.date_updated
     return data
 
 
 @router.get("/", response_model=List[TournamentResponse])
 async def get_tournaments(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db)
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get list of all tournaments.
@@ -67,25 +84,38 @@ async def get_tournaments(
     Args:
         skip: Number of records to skip
         limit: Maximum number of records to return
+        fields: Return only these fields (see GET /news)
         db: Database session
 
     Returns:
         List of tournaments
     """
-    tournaments = db.query(Tournament)\
-        .filter(Tournament.status == True)\
-        .order_by(Tournament.date_created.desc())\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+    selected = parse_fields(fields, TournamentResponse)
+    active = select(Tournament).filter(Tournament.status == True)
+    total = await cached_count(request, db, "tournaments", active)
+    response.headers[TOTAL_COUNT_HEADER] = str(total)
+
+    query = active
+    if selected is not None:
+        query = query.options(*column_options(Tournament, TournamentResponse, selected))
+    result = await db.execute(
+        query
+        .order_by(Tournament.date_created.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    tournaments = [sanitize_tournament(t) for t in result.scalars().all()]
 
-    return [sanitize_tournament(t) for t in tournaments]
+    if selected is not None:
+        return sparse_response(List[sparse_schema(TournamentResponse, selected)],
+                               tournaments, dict(response.headers))
+    return tournaments
 
 
 @router.get("/{tournament_id}", response_model=TournamentResponse)
 async def get_tournament(
     tournament_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get tournament details by ID.
@@ -100,9 +130,11 @@ async def get_tournament(
     Raises:
         HTTPException: If tournament not found
     """
-    tournament = db.query(Tournament)\
-        .filter(Tournament.id == tournament_id, Tournament.status == True)\
-        .first()
+    result = await db.execute(
+        select(Tournament)
+        .filter(Tournament.id == tournament_id, Tournament.status == True)
+    )
+    tournament = result.scalars().first()
 
     if not tournament:
         raise HTTPException(
@@ -113,80 +145,122 @@ async def get_tournament(
     return sanitize_tournament(tournament)
 
 
-@router.get("/{tournament_id}/fixtures", response_model=List[FixtureResponse])
+@router.get("/{tournament_id}/fixtures",
+            response_model=Union[List[FixtureResponse], List[FixtureExpandedResponse]])
 async def get_tournament_fixtures(
     tournament_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    expand: Optional[str] = Query(None, description=EXPAND_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get fixtures for a tournament.
 
     Args:
         tournament_id: Tournament ID (year_id in database)
+        expand: ``teams`` embeds ``team_1`` and ``team_2``
         db: Database session
 
     Returns:
         List of fixtures
     """
-    fixtures = db.query(Fixture)\
-        .filter(Fixture.year_id == tournament_id)\
-        .order_by(Fixture.date_match)\
-        .all()
+    expansions = parse_expand(expand)
+
+    async def load(session: AsyncSession):
+        result = await session.execute(
+            select(Fixture)
+            .filter(Fixture.year_id == tournament_id)
+            .order_by(Fixture.date_match)
+        )
+        fixtures = result.scalars().all()
+        if "teams" not in expansions:
+            return fixtures
+
+        snapshot = await reference_data.current()
+        return [embed_teams(fixture, snapshot,
+                            team_1=fixture.team_id_1, team_2=fixture.team_id_2)
+                for fixture in fixtures]
 
-    return fixtures
+    schema = List[FixtureExpandedResponse] if expansions else List[FixtureResponse]
+    return await cached_response(request, db, "fixtures", schema, load)
 
 
-@router.get("/{tournament_id}/results", response_model=List[MatchResultResponse])
+@router.get("/{tournament_id}/results",
+            response_model=Union[List[MatchResultResponse], List[MatchResultExpandedResponse]])
 async def get_tournament_results(
     tournament_id: int,
-    db: Session = Depends(get_db)
+    expand: Optional[str] = Query(None, description=EXPAND_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get results for a tournament.
 
     Args:
         tournament_id: Tournament ID
+        expand: ``teams`` adds the fixture's ``team_id_1``/``team_id_2`` and
+            embeds ``team_1``, ``team_2`` and ``winner_team``
+        fields: Return only these fields (see GET /news); with ``expand``
+            the embedded fields may be selected too
         db: Database session
 
     Returns:
         List of match results
     """
-    try:
-        results = db.query(MatchResult)\
-            .join(Fixture, MatchResult.fixture_id == Fixture.id)\
-            .filter(Fixture.year_id == tournament_id)\
-            .all()
+    expansions = parse_expand(expand)
+    schema = MatchResultExpandedResponse if "teams" in expansions else MatchResultResponse
+    selected = parse_fields(fields, schema)
+    options = []
+    if selected is not None:
+        # winner_team is embedded from winner_team_id
+        options = column_options(MatchResult, schema, selected, MatchResult.winner_team_id)
+    if "teams" not in expansions:
+        result = await db.execute(
+            select(MatchResult)
+            .options(*options)
+            .join(Fixture, MatchResult.fixture_id == Fixture.id)
+            .filter(Fixture.year_id == tournament_id)
+        )
+        results = result.scalars().all()
+        if selected is not None:
+            return sparse_response(List[sparse_schema(schema, selected)], results)
         return results
-    except Exception as e:
-        # Return empty list if query fails (e.g., no data)
-        print(f"Error fetching results: {e}")
-        return []
+
+    # The team ids come along with the join that is needed anyway
+    rows = (await db.execute(
+        select(MatchResult, Fixture.team_id_1, Fixture.team_id_2)
+        .options(*options)
+        .join(Fixture, MatchResult.fixture_id == Fixture.id)
+        .filter(Fixture.year_id == tournament_id)
+    )).all()
+    snapshot = await reference_data.current()
+    results = []
+    for match_result, team_id_1, team_id_2 in rows:
+        data = embed_teams(match_result, snapshot, team_1=team_id_1, team_2=team_id_2,
+                           winner_team=match_result.winner_team_id)
+        data.update(team_id_1=team_id_1, team_id_2=team_id_2)
+        results.append(data)
+    if selected is not None:
+        return sparse_response(List[sparse_schema(schema, selected)], results)
+    return results
 
 
 @router.get("/categories/all", response_model=List[CategoryResponse])
-async def get_categories(
-    db: Session = Depends(get_db)
-):
+async def get_categories():
     """
     Get tournament categories (Men/Women).
 
-    Args:
-        db: Database session
-
     Returns:
         List of active categories
     """
-    categories = db.query(Category)\
-        .filter(Category.status == True)\
-        .all()
-
-    return categories
+    snapshot = await reference_data.current()
+    return snapshot.categories
 
 
 @router.post("/fixtures", response_model=FixtureResponse, status_code=status.HTTP_201_CREATED)
 async def create_fixture(
     fixture: FixtureCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new fixture."""
     new_fixture = Fixture(
@@ -195,8 +269,11 @@ async def create_fixture(
         winner_id=0, match_status=False, match_report_file=""
     )
     db.add(new_fixture)
-    db.commit()
-    db.refresh(new_fixture)
+    pool = await fixture_pool(db, new_fixture)
+    await rerank(db, pool)
+    await db.commit()
+    await db.refresh(new_fixture)
+    await publish("fixture", *(["standing"] if pool else []))
     return new_fixture
 
 
@@ -204,47 +281,68 @@ async def create_fixture(
 async def update_fixture(
     fixture_id: int,
     fixture: FixtureUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Update a fixture."""
-    db_fixture = db.query(Fixture).filter(Fixture.id == fixture_id).first()
+    """Update a fixture; a change of teams or stage moves its results in the standings."""
+    db_fixture = await db.get(Fixture, fixture_id)
     if not db_fixture:
         raise HTTPException(status_code=404, detail="Fixture not found")
 
     update_data = fixture.dict(exclude_unset=True)
+    results, pools = [], []
+    if update_data.keys() & {"team_id_1", "team_id_2", "pool_type"}:
+        results = await fixture_results(db, fixture_id)
+        pools.append(await fixture_pool(db, db_fixture))
+    for match_result in results:
+        pools.append(await revert_result(db, match_result))
     for key, value in update_data.items():
         setattr(db_fixture, key, value)
-
-    db.commit()
-    db.refresh(db_fixture)
+    for match_result in results:
+        pools.append(await apply_result(db, match_result))
+    if pools:
+        pools.append(await fixture_pool(db, db_fixture))
+    await rerank(db, *pools)
+
+    await db.commit()
+    await db.refresh(db_fixture)
+    await publish("fixture", *(["result"] if results else []),
+                  *(["standing"] if any(pools) else []))
     return db_fixture
 
 
 @router.delete("/fixtures/{fixture_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_fixture(
     fixture_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Delete a fixture."""
-    db_fixture = db.query(Fixture).filter(Fixture.id == fixture_id).first()
+    """Delete a fixture; its results no longer count in the standings."""
+    db_fixture = await db.get(Fixture, fixture_id)
     if not db_fixture:
         raise HTTPException(status_code=404, detail="Fixture not found")
 
-    db.delete(db_fixture)
-    db.commit()
+    results = await fixture_results(db, fixture_id)
+    pools = [await fixture_pool(db, db_fixture)]
+    pools += [await revert_result(db, match_result) for match_result in results]
+    await db.delete(db_fixture)
+    await rerank(db, *pools)
+    await db.commit()
+    await publish("fixture", *(["result"] if results else []),
+                  *(["standing"] if any(pools) else []))
     return None
 
 
 @router.post("/results", response_model=MatchResultResponse, status_code=status.HTTP_201_CREATED)
 async def create_result(
     result: MatchResultCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Create a match result."""
+    """Create a match result and add it to the standings."""
     new_result = MatchResult(**result.dict())
     db.add(new_result)
-    db.commit()
-    db.refresh(new_result)
+    await rerank(db, await apply_result(db, new_result))
+    await db.commit()
+    await db.refresh(new_result)
+    await publish("result")
     return new_result
 
 
@@ -252,34 +350,38 @@ async def create_result(
 async def update_result(
     result_id: int,
     result: MatchResultUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Update a match result."""
-    db_result = db.query(MatchResult).filter(
-        MatchResult.id == result_id).first()
+    """Update a match result; the standings swap the old scores for the new."""
+    db_result = await db.get(MatchResult, result_id)
     if not db_result:
         raise HTTPException(status_code=404, detail="Result not found")
 
+    old_pool = await revert_result(db, db_result)
     update_data = result.dict(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_result, key, value)
+    await rerank(db, old_pool, await apply_result(db, db_result))
 
-    db.commit()
-    db.refresh(db_result)
+    await db.commit()
+    await db.refresh(db_result)
+    await publish("result")
     return db_result
 
 
 @router.delete("/results/{result_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_result(
     result_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Delete a match result."""
-    db_result = db.query(MatchResult).filter(
-        MatchResult.id == result_id).first()
+    """Delete a match result and take it out of the standings."""
+    db_result = await db.get(MatchResult, result_id)
     if not db_result:
         raise HTTPException(status_code=404, detail="Result not found")
 
-    db.delete(db_result)
-    db.commit()
+    pool = await revert_result(db, db_result)
+    await db.delete(db_result)
+    await rerank(db, pool)
+    await db.commit()
+    await publish("result")
     return None
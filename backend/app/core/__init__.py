@@ -1,7 +1,7 @@
 """Core package initialization."""
 
 from app.core.config import settings
-from app.core.database import Base, engine, get_db
+from app.core.database import Base, engine, get_db, get_read_db
 from app.core.security import (
     create_access_token,
     decode_access_token,
@@ -14,6 +14,7 @@ __all__ = [
     "Base",
     "engine",
     "get_db",
+    "get_read_db",
     "create_access_token",
     "decode_access_token",
     "get_password_hash",
@@ -0,0 +1,204 @@
+"""Response cache of serialized JSON bodies in front of read endpoints."""
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.core.cache_backends import create_cache_backend
+from app.core.conditional import REVALIDATE, conditional_response, http_date, make_etag
+from app.core.config import settings
+from app.core.database import reads_from_primary
+from app.core.invalidation import EVERYTHING, invalidation_bus
+from app.core.singleflight import coalesce_read
+
+JSON_MEDIA_TYPE = "application/json"
+
+# Rows matching a paginated listing's filters, across all pages
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+# Cache namespaces affected by a change to each entity; an entity not
+# listed here invalidates the namespace of the same name.
+ENTITY_NAMESPACES: Dict[str, Tuple[str, ...]] = {
+    "fixture": ("fixtures", "matches"),
+    "result": ("results", "standings", "matches"),
+    "standing": ("standings",),
+    # Match player statistics
+    "scoring": ("leaderboards", "matches"),
+    "sponsor": ("sponsors",),
+    # Teams are embedded in these responses by ?expand=teams
+    "team": ("teams", "fixtures", "results", "standings", "honours", "matches",
+             "leaderboards"),
+    "pool": ("pools",),
+}
+
+cache_backend = create_cache_backend()
+
+_adapters: Dict[Any, TypeAdapter] = {}
+
+
+def serialize(schema: Any, data: Any) -> bytes:
+    """Validate ``data`` against a response schema and dump it to JSON bytes."""
+    adapter = _adapters.get(schema)
+    if adapter is None:
+        adapter = _adapters[schema] = TypeAdapter(schema)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def cache_key(path: str, query_string: str) -> str:
+    """Route path plus query parameters in a canonical order."""
+    params = sorted(p for p in query_string.split("&") if p)
+    return f"{path}?{'&'.join(params)}"
+
+
+def request_cache_key(request: Request) -> str:
+    return cache_key(request.url.path, request.url.query)
+
+
+async def cached_response(
+    request: Request,
+    db: AsyncSession,
+    namespace: str,
+    schema: Any,
+    load: Callable[[AsyncSession], Awaitable[Any]],
+    ttl: float = None,
+    last_modified: Callable[[Any], Optional[datetime]] = None,
+    count: Optional[Select] = None
+) -> Response:
+    """
+    Serve a JSON response from the cache, loading and storing it on a miss.
+
+    Misses go through single-flight, so an expired hot key triggers one
+    query. Clients inside their read-your-writes window bypass the cache.
+    Responses carry an ETag (and Last-Modified when ``last_modified``
+    extracts one from the loaded data), and matching conditional requests
+    get an empty 304.
+
+    A 404 raised by ``load`` is cached too, for at most CACHE_NEGATIVE_TTL
+    seconds, so polling an empty table does not hit the database each time.
+    Writes to the namespace evict it like any other entry.
+
+    For paginated listings, ``count`` is the unpaginated query; its row
+    count is sent as X-Total-Count (see ``cached_count``).
+    """
+    ttl = settings.CACHE_DEFAULT_TTL if ttl is None else ttl
+    key = request_cache_key(request)
+    headers = {}
+    if count is not None:
+        total = await cached_count(request, db, namespace, count, ttl)
+        headers[TOTAL_COUNT_HEADER] = str(total)
+
+    async def load_serialized(session: AsyncSession) -> Tuple[int, bytes, Optional[str]]:
+        try:
+            data = await load(session)
+        except HTTPException as e:
+            if e.status_code != 404:
+                raise
+            return 404, json.dumps({"detail": e.detail}, separators=(",", ":")).encode(), None
+        modified = last_modified(data) if last_modified else None
+        return 200, serialize(schema, data), http_date(modified) if modified else None
+
+    if reads_from_primary(request):
+        status, body, modified = await load_serialized(db)
+        return _respond(request, status, body, make_etag(body), modified, "BYPASS", headers)
+
+    entry = await cache_backend.lookup(key)
+    if entry is not None:
+        return _respond(request, entry.status, entry.body, entry.etag,
+                        entry.last_modified, "HIT", headers)
+
+    generation = await cache_backend.generation(namespace)
+    status, body, modified = await coalesce_read(request, db, ("cache", key), load_serialized)
+    etag = make_etag(body)
+    if status == 404:
+        ttl = min(ttl, settings.CACHE_NEGATIVE_TTL)
+    await cache_backend.store(key, namespace, body, ttl, generation, etag, modified, status)
+    return _respond(request, status, body, etag, modified, "MISS", headers)
+
+
+def _respond(request: Request, status: int, body: bytes, etag: str,
+             last_modified: Optional[str], cache_state: str,
+             headers: Dict[str, str] = None) -> Response:
+    headers = dict(headers or {}, **{"X-Cache": cache_state})
+    if status != 200:
+        headers["Cache-Control"] = REVALIDATE
+        return Response(body, status_code=status, media_type=JSON_MEDIA_TYPE, headers=headers)
+    return conditional_response(request, body, JSON_MEDIA_TYPE, etag, last_modified, headers)
+
+
+def count_query(query: Select) -> Select:
+    """COUNT(*) of the rows ``query`` selects, ignoring its ORDER BY."""
+    return select(func.count()).select_from(query.order_by(None).subquery())
+
+
+async def cached_count(
+    request: Request,
+    db: AsyncSession,
+    namespace: str,
+    query: Select,
+    ttl: float = None
+) -> int:
+    """
+    Number of rows ``query`` selects, kept as a counter in the cache.
+
+    The counter lives in ``namespace`` next to the listing it counts, so
+    the write that evicts the listing evicts the count as well and the
+    next request runs one COUNT(*) (through single-flight) instead of one
+    per request. Clients inside their read-your-writes window count on the
+    primary.
+    """
+    statement = count_query(query)
+
+    async def load(session: AsyncSession) -> int:
+        return (await session.execute(statement)).scalar_one()
+
+    if reads_from_primary(request):
+        return await load(db)
+
+    compiled = statement.compile()
+    identity = f"{compiled}|{sorted(compiled.params.items())!r}"
+    key = "count:" + hashlib.blake2b(identity.encode(), digest_size=16).hexdigest()
+    entry = await cache_backend.lookup(key)
+    if entry is not None:
+        return int(entry.body)
+
+    generation = await cache_backend.generation(namespace)
+    total = await coalesce_read(request, db, ("count", key), load)
+    ttl = settings.CACHE_DEFAULT_TTL if ttl is None else ttl
+    await cache_backend.store(key, namespace, str(total).encode(), ttl, generation)
+    return total
+
+
+async def invalidate(*namespaces: str) -> None:
+    """Evict cached responses derived from the given namespaces."""
+    await cache_backend.invalidate(*namespaces)
+
+
+async def stale_lookup(scope: dict) -> Optional[Tuple[int, list, bytes]]:
+    """Stale-response hook for the load shedder."""
+    query = scope.get("query_string", b"").decode("latin-1")
+    entry = await cache_backend.lookup_stale(cache_key(scope["path"], query))
+    if entry is None:
+        return None
+    return entry.status, [(b"content-type", JSON_MEDIA_TYPE.encode())], entry.body
+
+
+async def _on_change(entities, remote: bool) -> None:
+    # A shared backend was already invalidated by the worker that wrote
+    if remote and cache_backend.shared:
+        return
+    if EVERYTHING in entities:
+        await cache_backend.clear()
+        return
+    namespaces = set()
+    for entity in entities:
+        namespaces.update(ENTITY_NAMESPACES.get(entity, (entity,)))
+    await invalidate(*sorted(namespaces))
+
+
+invalidation_bus.subscribe(_on_change)
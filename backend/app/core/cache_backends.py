@@ -0,0 +1,369 @@
+"""
+Storage backends for the response cache.
+
+Both backends store pre-serialized response bodies together with their
+validators, so a hit is served without any Pydantic work:
+
+* ``MemoryCacheBackend`` keeps an LRU per worker process.
+* ``RedisCacheBackend`` shares entries and namespace generations between
+  all workers through any Redis-protocol server.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry:
+    __slots__ = ("body", "namespace", "expires_at", "stale_until", "etag", "last_modified",
+                 "status")
+
+    def __init__(self, body: bytes, namespace: str, expires_at: float, stale_until: float,
+                 etag: Optional[str] = None, last_modified: Optional[str] = None,
+                 status: int = 200):
+        self.body = body
+        self.namespace = namespace
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.etag = etag
+        self.last_modified = last_modified
+        # 404 for a cached "not found"
+        self.status = status
+
+
+class ResponseCache:
+    """
+    LRU cache of response bodies keyed by route and query string.
+
+    Entries belong to a namespace (news, sponsors, gallery, ...) so writes
+    can evict everything derived from the rows they touched. Expired
+    entries are kept for ``stale_seconds`` so overloaded routes can still
+    serve them when shedding load.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, stale_seconds: float, replica_lag: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_seconds = stale_seconds
+        self.replica_lag = replica_lag
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._namespaces: Dict[str, Set[str]] = {}
+        self._invalidated_at: Dict[str, float] = {}
+        self._generations: Dict[str, int] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Return the live entry for ``key``, counting a hit or a miss."""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self.lookup(key)
+        return entry.body if entry is not None else None
+
+    def lookup_stale(self, key: str) -> Optional[CacheEntry]:
+        """Return an entry even if expired, as long as it is inside the stale window."""
+        entry = self._entries.get(key)
+        if entry is None or entry.stale_until <= time.monotonic():
+            return None
+        return entry
+
+    def get_stale(self, key: str) -> Optional[bytes]:
+        entry = self.lookup_stale(key)
+        return entry.body if entry is not None else None
+
+    def generation(self, namespace: str) -> int:
+        """Counter bumped by every invalidation of ``namespace``."""
+        return self._generations.get(namespace, 0)
+
+    def set(self, key: str, namespace: str, body: bytes, ttl: float,
+            generation: Optional[int] = None, etag: Optional[str] = None,
+            last_modified: Optional[str] = None, status: int = 200) -> None:
+        if len(body) > self.max_bytes:
+            return
+        # A write landed while this body was being loaded; it may be stale
+        if generation is not None and generation != self.generation(namespace):
+            return
+        now = time.monotonic()
+        expires_at = now + ttl
+        # Right after a write the replica may still lag; don't pin its
+        # answer for a full TTL.
+        invalidated_at = self._invalidated_at.get(namespace)
+        if invalidated_at is not None and now - invalidated_at < self.replica_lag:
+            expires_at = min(expires_at, invalidated_at + self.replica_lag)
+
+        self._remove(key)
+        self._entries[key] = CacheEntry(
+            body, namespace, expires_at, expires_at + self.stale_seconds,
+            etag, last_modified, status)
+        self._namespaces.setdefault(namespace, set()).add(key)
+        self._bytes += len(body)
+        self._evict()
+
+    def invalidate(self, *namespaces: str) -> None:
+        """Drop every entry in the given namespaces."""
+        now = time.monotonic()
+        for namespace in namespaces:
+            self._invalidated_at[namespace] = now
+            self._generations[namespace] = self.generation(namespace) + 1
+            for key in list(self._namespaces.pop(namespace, ())):
+                self._remove(key)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._namespaces.clear()
+        self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= len(entry.body)
+        keys = self._namespaces.get(entry.namespace)
+        if keys is not None:
+            keys.discard(key)
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def stats(self) -> Dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class MemoryCacheBackend:
+    """Async facade over a per-process ResponseCache."""
+
+    name = "memory"
+    shared = False
+
+    def __init__(self, cache: ResponseCache):
+        self.cache = cache
+
+    async def lookup(self, key: str) -> Optional[CacheEntry]:
+        return self.cache.lookup(key)
+
+    async def lookup_stale(self, key: str) -> Optional[CacheEntry]:
+        return self.cache.lookup_stale(key)
+
+    async def generation(self, namespace: str) -> int:
+        return self.cache.generation(namespace)
+
+    async def store(self, key: str, namespace: str, body: bytes, ttl: float, generation: int,
+                    etag: Optional[str] = None, last_modified: Optional[str] = None,
+                    status: int = 200) -> None:
+        self.cache.set(key, namespace, body, ttl, generation, etag, last_modified, status)
+
+    async def invalidate(self, *namespaces: str) -> None:
+        self.cache.invalidate(*namespaces)
+
+    async def clear(self) -> None:
+        self.cache.clear()
+
+    def stats(self) -> Dict:
+        return {"backend": self.name, **self.cache.stats()}
+
+
+class RedisCacheBackend:
+    """
+    Response cache shared by all workers through Redis.
+
+    Each namespace has a generation counter in Redis; invalidating it is a
+    single INCR, visible to every worker at once. Entries record the
+    generation they were built under, and an entry whose generation no
+    longer matches is treated as a miss, so orphaned entries simply age
+    out through their Redis TTL. Redis errors are logged and treated as
+    misses so an outage degrades to uncached reads.
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, url: str, prefix: str, max_bytes: int, stale_seconds: float,
+                 replica_lag: float, client=None):
+        self.url = url
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.stale_seconds = stale_seconds
+        self.replica_lag = replica_lag
+        self._client = client
+        self._loop = None
+        self._loop_client = None
+        self._invalidated_at: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    @property
+    def client(self):
+        if self._client is not None:
+            return self._client
+        # Optional dependency, only needed when CACHE_BACKEND=redis
+        import redis.asyncio as redis
+
+        # Connections belong to the loop that opened them
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._loop_client = redis.Redis.from_url(self.url)
+        return self._loop_client
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self.prefix}:entry:{key}"
+
+    def _generation_key(self, namespace: str) -> str:
+        return f"{self.prefix}:gen:{namespace}"
+
+    @staticmethod
+    def _encode(entry: CacheEntry, generation: int) -> bytes:
+        header = json.dumps({
+            "ns": entry.namespace,
+            "gen": generation,
+            "exp": entry.expires_at,
+            "stale": entry.stale_until,
+            "etag": entry.etag,
+            "lm": entry.last_modified,
+            "st": entry.status,
+        }, separators=(",", ":")).encode()
+        return header + b"\n" + entry.body
+
+    @staticmethod
+    def _decode(raw: bytes):
+        header, body = raw.split(b"\n", 1)
+        meta = json.loads(header)
+        entry = CacheEntry(body, meta["ns"], meta["exp"], meta["stale"], meta["etag"], meta["lm"],
+                           meta.get("st", 200))
+        return entry, meta["gen"]
+
+    async def _fetch(self, key: str) -> Optional[CacheEntry]:
+        """Entry for ``key`` if its namespace generation is still current."""
+        try:
+            raw = await self.client.get(self._entry_key(key))
+            if raw is None:
+                return None
+            entry, generation = self._decode(raw)
+            current = await self.client.get(self._generation_key(entry.namespace))
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Redis cache read failed: %s", e)
+            return None
+        if generation != int(current or 0):
+            return None
+        return entry
+
+    async def lookup(self, key: str) -> Optional[CacheEntry]:
+        entry = await self._fetch(key)
+        if entry is None or entry.expires_at <= time.time():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    async def lookup_stale(self, key: str) -> Optional[CacheEntry]:
+        entry = await self._fetch(key)
+        if entry is None or entry.stale_until <= time.time():
+            return None
+        return entry
+
+    async def generation(self, namespace: str) -> int:
+        try:
+            return int(await self.client.get(self._generation_key(namespace)) or 0)
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Redis cache read failed: %s", e)
+            # Never matches a stored generation, so nothing is cached meanwhile
+            return -1
+
+    async def store(self, key: str, namespace: str, body: bytes, ttl: float, generation: int,
+                    etag: Optional[str] = None, last_modified: Optional[str] = None,
+                    status: int = 200) -> None:
+        if len(body) > self.max_bytes or generation < 0:
+            return
+        now = time.time()
+        expires_at = now + ttl
+        invalidated_at = self._invalidated_at.get(namespace)
+        if invalidated_at is not None and now - invalidated_at < self.replica_lag:
+            expires_at = min(expires_at, invalidated_at + self.replica_lag)
+        entry = CacheEntry(body, namespace, expires_at, expires_at + self.stale_seconds,
+                           etag, last_modified, status)
+        try:
+            await self.client.set(
+                self._entry_key(key),
+                self._encode(entry, generation),
+                px=max(1, int((entry.stale_until - now) * 1000))
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Redis cache write failed: %s", e)
+
+    async def invalidate(self, *namespaces: str) -> None:
+        now = time.time()
+        for namespace in namespaces:
+            self._invalidated_at[namespace] = now
+            try:
+                await self.client.incr(self._generation_key(namespace))
+            except Exception as e:
+                self.errors += 1
+                logger.error("Redis cache invalidation of %s failed: %s", namespace, e)
+            self.invalidations += 1
+
+    async def clear(self) -> None:
+        async for key in self.client.scan_iter(match=f"{self.prefix}:*"):
+            await self.client.delete(key)
+
+    def stats(self) -> Dict:
+        return {
+            "backend": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+        }
+
+
+def create_cache_backend():
+    """Build the backend selected by CACHE_BACKEND."""
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(
+            url=settings.REDIS_URL,
+            prefix=settings.CACHE_KEY_PREFIX,
+            max_bytes=settings.CACHE_MAX_BYTES,
+            stale_seconds=settings.CACHE_STALE_SECONDS,
+            replica_lag=settings.READ_YOUR_WRITES_SECONDS
+        )
+    return MemoryCacheBackend(ResponseCache(
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        max_bytes=settings.CACHE_MAX_BYTES,
+        stale_seconds=settings.CACHE_STALE_SECONDS,
+        replica_lag=settings.READ_YOUR_WRITES_SECONDS
+    ))
@@ -0,0 +1,96 @@
+"""Validators (ETag / Last-Modified) and conditional GET evaluation."""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Iterable, Optional
+
+from fastapi import Request, Response
+
+# Clients must revalidate, but may reuse their copy after a 304
+REVALIDATE = "no-cache"
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag derived from the exact response bytes."""
+    return '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def http_date(value: datetime) -> str:
+    """Format a datetime for Last-Modified. Naive values are taken as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def latest(items: Any, *fields: str) -> Optional[datetime]:
+    """
+    Most recent datetime found in ``fields`` across one item or a list of them.
+
+    Items may be ORM objects or dicts; missing, null and invalid values
+    (MySQL zero dates come back as strings) are ignored.
+    """
+    if items is None:
+        return None
+    if isinstance(items, dict) or not isinstance(items, Iterable):
+        items = [items]
+    newest = None
+    for item in items:
+        for field in fields:
+            value = item.get(field) if isinstance(item, dict) else getattr(item, field, None)
+            if isinstance(value, datetime) and (newest is None or value > newest):
+                newest = value
+    return newest
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison
+    candidates = (tag.strip() for tag in header.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def not_modified(request: Request, etag: str, last_modified: Optional[str]) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since against the current validators.
+
+    If-Modified-Since is only consulted when If-None-Match is absent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since is None:
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return parsedate_to_datetime(last_modified) <= since
+
+
+def validator_headers(etag: str, last_modified: Optional[str]) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE}
+    if last_modified is not None:
+        headers["Last-Modified"] = last_modified
+    return headers
+
+
+def conditional_response(
+    request: Request,
+    body: bytes,
+    media_type: str,
+    etag: str,
+    last_modified: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Return ``body`` with validators, or an empty 304 if the client is current."""
+    headers = {**validator_headers(etag, last_modified), **(headers or {})}
+    if not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=media_type, headers=headers)
@@ -8,10 +8,26 @@ class Settings(BaseSettings):
     # Application
     APP_NAME: str = "Surjit Hockey API"
     API_VERSION: str = "v1"
-    DEBUG: bool = True
+    DEBUG: bool = False
 
     # Database
     DATABASE_URL: str
+    ASYNC_DATABASE_URL: str = ""
+    # Read replica; empty means reads use the primary
+    DATABASE_REPLICA_URL: str = ""
+    # Seconds a client keeps reading from the primary after a write
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    # Connection pool (per engine, per worker)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 10.0
+    DB_POOL_RECYCLE: int = 3600
+    # Liveness strategy: "keepalive" (background ping), "pre_ping" or "none"
+    DB_LIVENESS: str = "keepalive"
+    DB_KEEPALIVE_INTERVAL: int = 60
+    # Connections each worker opens per pool before accepting traffic
+    DB_POOL_WARMUP: int = 5
 
     # Security
     SECRET_KEY: str
@@ -24,6 +40,63 @@ class Settings(BaseSettings):
 
     # File Uploads
     UPLOAD_DIR: str = "uploads"
+    # Prefix for upload URLs in API responses; point it at a CDN in production
+    UPLOADS_BASE_URL: str = "/uploads"
+
+    # Thread pool for blocking work (bcrypt, file copies)
+    BLOCKING_WORKERS: int = 8
+
+    # Response cache: "memory" (per worker) or "redis" (shared by all workers)
+    CACHE_BACKEND: str = "memory"
+    REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_KEY_PREFIX: str = "surjit"
+    CACHE_DEFAULT_TTL: int = 300
+    # Upper bound for caching a 404 (e.g. no timer or stream configured yet)
+    CACHE_NEGATIVE_TTL: int = 30
+    CACHE_MAX_ENTRIES: int = 2048
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # How long expired entries may still be served to shed requests
+    CACHE_STALE_SECONDS: int = 600
+
+    # Cross-worker invalidation: "local", "redis" (pub/sub) or "database"
+    # (polled version table). With a broadcast transport, TTLs can be long.
+    INVALIDATION_BUS: str = "local"
+    INVALIDATION_CHANNEL: str = "surjit:invalidate"
+    INVALIDATION_POLL_INTERVAL: float = 2.0
+
+    # Master-table snapshot; writes on this worker rebuild it immediately
+    REFERENCE_MAX_AGE: int = 300
+
+    # Concurrent requests per route group and worker (0 = unlimited)
+    LIMIT_AUTH: int = 16
+    LIMIT_CONTENT_UPLOADS: int = 4
+    LIMIT_CONTENT: int = 48
+    LIMIT_ADDITIONAL: int = 64
+    # Seconds a request may wait for a slot before it is shed with a 503
+    LIMIT_QUEUE_TIMEOUT: float = 0.05
+    LIMIT_RETRY_AFTER: int = 2
+
+    # Production server (python -m app.server)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    WEB_CONCURRENCY: int = 0  # 0 = one worker per CPU
+    WORKER_MAX_REQUESTS: int = 10000
+    WORKER_MAX_REQUESTS_JITTER: int = 1000
+    WORKER_TIMEOUT: int = 60
+    GRACEFUL_TIMEOUT: int = 30
+    KEEPALIVE_SECONDS: int = 5
+
+    @property
+    def async_database_url(self) -> str:
+        """Async driver URL; derived from DATABASE_URL when not set explicitly."""
+        if self.ASYNC_DATABASE_URL:
+            return self.ASYNC_DATABASE_URL
+        return self.DATABASE_URL.replace("mysql+pymysql://", "mysql+aiomysql://", 1)
+
+    @property
+    def async_replica_url(self) -> str:
+        """Async driver URL for the read replica, or '' when none is configured."""
+        return self.DATABASE_REPLICA_URL.replace("mysql+pymysql://", "mysql+aiomysql://", 1)
 
     @property
     def cors_origins_list(self) -> List[str]:
@@ -1,31 +1,138 @@
+import hashlib
+import hmac
+import math
+import time
+from fastapi import Request
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core.pool_monitor import MonitoredQueuePool, monitor_engine
 import pymysql
 
-# Create database engine with MySQL zero date handling
+# MySQL zero date handling, shared by the sync and async drivers
+connect_args = {"init_command": "SET sql_mode='ALLOW_INVALID_DATES'"}
+
+# Synchronous engine, used by maintenance scripts and the test harness
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
     pool_recycle=3600,
-    connect_args={"init_command": "SET sql_mode='ALLOW_INVALID_DATES'"}
+    connect_args=connect_args
 )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def create_api_engine(url: str):
+    """Create a monitored async engine using the pool settings."""
+    api_engine = create_async_engine(
+        url,
+        poolclass=MonitoredQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_LIVENESS == "pre_ping",
+        connect_args=connect_args
+    )
+    monitor_engine(api_engine)
+    return api_engine
+
+
+# Async engine used by the API so queries never block the event loop
+async_engine = create_api_engine(settings.async_database_url)
+
+# Read-only engine on the replica; falls back to the primary when unset
+if settings.async_replica_url:
+    replica_engine = create_api_engine(settings.async_replica_url)
+else:
+    replica_engine = async_engine
+
+
+def api_engines() -> dict:
+    """Distinct async engines by role, for telemetry and lifecycle hooks."""
+    engines = {"primary": async_engine}
+    if replica_engine is not async_engine:
+        engines["replica"] = replica_engine
+    return engines
+
+# Objects stay usable after commit so handlers can return them directly
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+ReplicaSessionLocal = async_sessionmaker(
+    bind=replica_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+# Cookie/header holding the epoch until which a client reads from the primary
+READ_PRIMARY_COOKIE = "read_primary_until"
+READ_PRIMARY_HEADER = "X-Read-Primary-Until"
+
 # Create Base class for models
 Base = declarative_base()
 
 
-def get_db():
+async def get_db():
     """
-    Dependency to get database session.
+    Dependency to get an async database session.
     Yields a database session and ensures it's closed after use.
     """
-    db = SessionLocal()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _sign_read_primary(value: str) -> str:
+    return hmac.new(settings.SECRET_KEY.encode(), f"read-primary:{value}".encode(),
+                    hashlib.sha256).hexdigest()
+
+
+def read_primary_marker() -> str:
+    """
+    Signed marker keeping a client on the primary for the next
+    READ_YOUR_WRITES_SECONDS: the epoch it expires at and its HMAC.
+    """
+    # Rounded down so a fresh marker is never past the window
+    until = math.floor((time.time() + settings.READ_YOUR_WRITES_SECONDS) * 1000) / 1000
+    value = f"{until:.3f}"
+    return f"{value}.{_sign_read_primary(value)}"
+
+
+def reads_from_primary(request: Request) -> bool:
+    """
+    True while the client is inside its read-your-writes window.
+
+    The marker comes from the client, so only one signed by this API and
+    expiring within READ_YOUR_WRITES_SECONDS counts; anything else would
+    let a client skip the cache and the replica for good.
+    """
+    marker = request.headers.get(READ_PRIMARY_HEADER) or \
+        request.cookies.get(READ_PRIMARY_COOKIE, "")
+    value, _, signature = marker.rpartition(".")
+    if not value or not hmac.compare_digest(signature, _sign_read_primary(value)):
+        return False
     try:
+        until = float(value)
+    except ValueError:
+        return False
+    now = time.time()
+    return now < until <= now + settings.READ_YOUR_WRITES_SECONDS
+
+
+async def get_read_db(request: Request):
+    """
+    Dependency for read-only endpoints.
+    Yields a replica session, or a primary session for clients that
+    wrote within the last READ_YOUR_WRITES_SECONDS.
+    """
+    session_factory = AsyncSessionLocal if reads_from_primary(
+        request) else ReplicaSessionLocal
+    async with session_factory() as db:
         yield db
-    finally:
-        db.close()
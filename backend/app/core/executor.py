@@ -0,0 +1,85 @@
+"""Bounded thread pool for blocking work (bcrypt, file copies, disk I/O)."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from app.core.config import settings
+from app.core.metrics import Histogram
+
+
+class BlockingExecutor:
+    """
+    Runs blocking callables off the event loop on a fixed-size thread pool.
+
+    Tracks how many jobs are waiting for a worker, how many are running,
+    and how long jobs wait before they start.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="blocking")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self.wait_time = Histogram()
+        self.run_time = Histogram()
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``func(*args, **kwargs)`` on the pool and await its result."""
+        submitted = time.perf_counter()
+
+        def job():
+            started = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+            self.wait_time.observe((started - submitted) * 1000)
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                with self._lock:
+                    self._failed += 1
+                raise
+            finally:
+                self.run_time.observe((time.perf_counter() - started) * 1000)
+                with self._lock:
+                    self._active -= 1
+                    self._completed += 1
+            return result
+
+        with self._lock:
+            self._queued += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, job)
+
+    def stats(self) -> Dict:
+        """Current queue depth, utilisation and wait-time histogram."""
+        with self._lock:
+            queued, active = self._queued, self._active
+            completed, failed = self._completed, self._failed
+        return {
+            "max_workers": self.max_workers,
+            "queued": queued,
+            "active": active,
+            "completed": completed,
+            "failed": failed,
+            "wait_time": self.wait_time.snapshot(),
+            "run_time": self.run_time.snapshot(),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and release the worker threads."""
+        self._pool.shutdown(wait=wait)
+
+
+blocking_executor = BlockingExecutor(settings.BLOCKING_WORKERS)
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking callable on the shared executor."""
+    return await blocking_executor.run(func, *args, **kwargs)
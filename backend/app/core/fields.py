@@ -0,0 +1,108 @@
+"""
+Sparse fieldsets: ``?fields=`` on list endpoints.
+
+A request such as ``GET /news?fields=id,title`` loads only the columns
+behind the requested fields (everything else is deferred and never leaves
+the database) and serializes them with a schema holding just those fields.
+"""
+from functools import lru_cache
+from typing import Any, FrozenSet, Iterable, List, Optional, Type
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+from sqlalchemy.orm import load_only
+
+from app.core.cache import JSON_MEDIA_TYPE, serialize
+
+FIELDS_DESCRIPTION = "Comma-separated fields to return; id is always included"
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[FrozenSet[str]]:
+    """
+    Parse a ``fields`` query parameter against a response schema.
+
+    Returns:
+        The requested field names plus ``id``, or None when the parameter
+        is absent (full response)
+
+    Raises:
+        HTTPException: 400 for a field the schema does not have
+    """
+    if fields is None:
+        return None
+    names = {name.strip() for name in fields.split(",") if name.strip()}
+    available = set(schema.model_fields) | set(schema.model_computed_fields)
+    unknown = names - available
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    if "id" in available:
+        names.add("id")
+    return frozenset(names)
+
+
+def source_fields(schema: Type[BaseModel], names: Iterable[str]) -> FrozenSet[str]:
+    """
+    Schema fields needed to produce ``names``: computed fields are replaced
+    by the field they read, declared in the schema's ``field_sources``.
+    """
+    sources = getattr(schema, "field_sources", {})
+    return frozenset(sources.get(name, name) for name in names)
+
+
+@lru_cache(maxsize=256)
+def sparse_schema(schema: Type[BaseModel], names: FrozenSet[str]) -> Type[BaseModel]:
+    """
+    A model with only the fields in ``names`` of ``schema``.
+
+    Fields read by a selected computed field are carried along but left
+    out of the output. Validation reads no other attribute, so deferred
+    columns are never loaded.
+    """
+    annotations = {}
+    namespace = {
+        "__module__": schema.__module__,
+        "__doc__": f"{schema.__name__} restricted by ?fields=.",
+        "model_config": ConfigDict(from_attributes=True),
+    }
+    needed = source_fields(schema, names)
+    for name, info in schema.model_fields.items():
+        if name in names:
+            annotations[name] = info.annotation
+            namespace[name] = info
+        elif name in needed:
+            annotations[name] = Optional[info.annotation]
+            namespace[name] = Field(default=None, exclude=True)
+    for name, info in schema.model_computed_fields.items():
+        if name in names:
+            namespace[name] = computed_field(info.wrapped_property, return_type=info.return_type)
+    namespace["__annotations__"] = annotations
+    return type(f"{schema.__name__}Fields", (BaseModel,), namespace)
+
+
+def column_options(model: Any, schema: Type[BaseModel], names: FrozenSet[str],
+                   *always: Any) -> List:
+    """
+    Loader options deferring every column of ``model`` not needed for
+    ``names``. ``always`` lists further columns the handler reads itself,
+    such as keyset sort keys; the primary key is always loaded.
+    """
+    columns = {attr.key for attr in model.__mapper__.column_attrs}
+    keys = (source_fields(schema, names) & columns) | {column.key for column in always}
+    attributes = [getattr(model, key) for key in sorted(keys)]
+    if not attributes:
+        attributes = [getattr(model, key.key) for key in model.__mapper__.primary_key]
+    return [load_only(*attributes)]
+
+
+def sparse_response(schema: Any, data: Any, headers: dict = None) -> Response:
+    """
+    Serialize ``data`` for an endpoint that is not cached.
+
+    The route's response_model describes the full schema, so a sparse
+    result is returned as a ready Response instead of being validated
+    against it.
+    """
+    return Response(serialize(schema, data), media_type=JSON_MEDIA_TYPE, headers=headers)
@@ -0,0 +1,266 @@
+"""
+Cross-worker invalidation bus.
+
+Write handlers call ``publish("news")`` (or fixture, result, standing,
+team, ...) after committing. The change is applied to this worker's
+caches immediately and broadcast to every other worker through the
+configured transport:
+
+* ``local``    - single process, nothing to broadcast.
+* ``redis``    - Redis pub/sub; delivery is immediate.
+* ``database`` - a version counter per entity in ``hockey_entity_version``
+  that each worker polls every INVALIDATION_POLL_INTERVAL seconds. Works
+  with nothing but the primary database.
+"""
+import asyncio
+import json
+import logging
+import uuid
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, FrozenSet, List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.system import EntityVersion
+
+logger = logging.getLogger(__name__)
+
+# Sent to local subscribers when broadcasts may have been missed
+EVERYTHING = "*"
+
+# subscriber(entities, remote); remote is False for this worker's own writes
+Subscriber = Callable[[FrozenSet[str], bool], Awaitable[None]]
+Deliver = Callable[[FrozenSet[str]], Awaitable[None]]
+
+
+class LocalTransport:
+    """No other workers to tell."""
+
+    name = "local"
+
+    async def start(self, deliver: Deliver) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def send(self, entities: FrozenSet[str]) -> None:
+        pass
+
+
+class RedisTransport:
+    """Broadcast changes over a Redis pub/sub channel."""
+
+    name = "redis"
+
+    def __init__(self, url: str, channel: str, client=None):
+        self.url = url
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._client = client
+        self._task: Optional[asyncio.Task] = None
+
+    def _connect(self):
+        if self._client is None:
+            # Optional dependency, only needed when INVALIDATION_BUS=redis
+            import redis.asyncio as redis
+            self._client = redis.Redis.from_url(self.url)
+        return self._client
+
+    async def start(self, deliver: Deliver) -> None:
+        self._connect()
+        self._task = asyncio.create_task(self._listen(deliver))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def send(self, entities: FrozenSet[str]) -> None:
+        message = json.dumps({"origin": self.origin, "entities": sorted(entities)})
+        await self._connect().publish(self.channel, message)
+
+    async def _listen(self, deliver: Deliver) -> None:
+        resubscribed = False
+        while True:
+            try:
+                pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(self.channel)
+                if resubscribed:
+                    # Anything broadcast while disconnected was lost
+                    await deliver(frozenset({EVERYTHING}))
+                async for message in pubsub.listen():
+                    payload = json.loads(message["data"])
+                    if payload.get("origin") != self.origin:
+                        await deliver(frozenset(payload.get("entities", ())))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Invalidation listener disconnected: %s", e)
+                resubscribed = True
+                await asyncio.sleep(1)
+
+
+class DatabaseTransport:
+    """
+    Bump a per-entity version row on write and poll the table for changes.
+
+    Polls read the primary; the table holds one short row per entity.
+    """
+
+    name = "database"
+
+    def __init__(self, poll_interval: float, session_factory=AsyncSessionLocal):
+        self.poll_interval = poll_interval
+        self.session_factory = session_factory
+        self._seen: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, deliver: Deliver) -> None:
+        async with self.session_factory() as session:
+            conn = await session.connection()
+            await conn.run_sync(
+                lambda sync_conn: EntityVersion.__table__.create(sync_conn, checkfirst=True))
+            await session.commit()
+        self._seen = await self._versions()
+        self._task = asyncio.create_task(self._poll(deliver))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def send(self, entities: FrozenSet[str]) -> None:
+        for entity in entities:
+            version = await self._bump(entity)
+            # Skip our own change at the next poll, unless someone else
+            # also bumped the entity in between
+            if self._seen.get(entity, 0) == version - 1:
+                self._seen[entity] = version
+
+    async def _bump(self, entity: str) -> int:
+        async with self.session_factory() as session:
+            bump = update(EntityVersion).where(EntityVersion.entity == entity).values(
+                version=EntityVersion.version + 1, date_updated=datetime.now())
+            result = await session.execute(bump)
+            if result.rowcount == 0:
+                session.add(EntityVersion(entity=entity, version=1, date_updated=datetime.now()))
+                try:
+                    await session.flush()
+                except IntegrityError:
+                    # Another worker created the row first
+                    await session.rollback()
+                    await session.execute(bump)
+            version = (await session.execute(
+                select(EntityVersion.version).where(EntityVersion.entity == entity)
+            )).scalar_one()
+            await session.commit()
+            return version
+
+    async def _versions(self) -> Dict[str, int]:
+        async with self.session_factory() as session:
+            rows = await session.execute(select(EntityVersion.entity, EntityVersion.version))
+            return {entity: version for entity, version in rows.all()}
+
+    async def poll_once(self, deliver: Deliver) -> None:
+        versions = await self._versions()
+        changed = frozenset(
+            entity for entity, version in versions.items()
+            if self._seen.get(entity) != version
+        )
+        self._seen = versions
+        if changed:
+            await deliver(changed)
+
+    async def _poll(self, deliver: Deliver) -> None:
+        failed = False
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                if failed:
+                    # Changes may have been missed while the table was unreachable
+                    await deliver(frozenset({EVERYTHING}))
+                    failed = False
+                await self.poll_once(deliver)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Invalidation poll failed: %s", e)
+                failed = True
+
+
+class InvalidationBus:
+    """Fan entity changes out to local subscribers and to other workers."""
+
+    def __init__(self, transport):
+        self.transport = transport
+        self._subscribers: List[Subscriber] = []
+        self.published = 0
+        self.received = 0
+        self.errors = 0
+
+    def subscribe(self, subscriber: Subscriber) -> None:
+        """Register ``subscriber(entities, remote)``; it may also receive EVERYTHING."""
+        self._subscribers.append(subscriber)
+
+    async def start(self) -> None:
+        try:
+            await self.transport.start(self._receive)
+        except Exception as e:
+            self.errors += 1
+            logger.error("Could not start %s invalidation bus: %s", self.transport.name, e)
+
+    async def stop(self) -> None:
+        await self.transport.stop()
+
+    async def publish(self, *entities: str) -> None:
+        """Apply a change locally, then broadcast it to the other workers."""
+        changed = frozenset(entities)
+        await self._deliver(changed, remote=False)
+        self.published += 1
+        try:
+            await self.transport.send(changed)
+        except Exception as e:
+            # Other workers catch up when their TTLs expire
+            self.errors += 1
+            logger.error("Could not broadcast invalidation of %s: %s", sorted(changed), e)
+
+    async def _receive(self, entities: FrozenSet[str]) -> None:
+        self.received += 1
+        await self._deliver(entities, remote=True)
+
+    async def _deliver(self, entities: FrozenSet[str], remote: bool) -> None:
+        for subscriber in self._subscribers:
+            try:
+                await subscriber(entities, remote)
+            except Exception as e:
+                self.errors += 1
+                logger.error("Invalidation subscriber failed: %s", e)
+
+    def stats(self) -> Dict:
+        return {
+            "transport": self.transport.name,
+            "published": self.published,
+            "received": self.received,
+            "errors": self.errors,
+        }
+
+
+def create_transport():
+    """Build the transport selected by INVALIDATION_BUS."""
+    if settings.INVALIDATION_BUS == "redis":
+        return RedisTransport(settings.REDIS_URL, settings.INVALIDATION_CHANNEL)
+    if settings.INVALIDATION_BUS == "database":
+        return DatabaseTransport(settings.INVALIDATION_POLL_INTERVAL)
+    return LocalTransport()
+
+
+invalidation_bus = InvalidationBus(create_transport())
+
+
+async def publish(*entities: str) -> None:
+    """Tell every worker that rows of the given entities changed."""
+    await invalidation_bus.publish(*entities)
@@ -0,0 +1,176 @@
+"""Per-route-group concurrency limits with fast load shedding."""
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, FrozenSet, List, Optional
+
+from app.core.config import settings
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+@dataclass
+class RouteGroup:
+    """A path prefix (optionally restricted to some methods) with its own budget."""
+    name: str
+    prefix: str
+    limit: int
+    methods: Optional[FrozenSet[str]] = None
+
+    def matches(self, method: str, path: str) -> bool:
+        if not path.startswith(self.prefix):
+            return False
+        return self.methods is None or method in self.methods
+
+
+class _GroupState:
+    def __init__(self, group: RouteGroup):
+        self.group = group
+        self.in_flight = 0
+        self.peak = 0
+        self.admitted = 0
+        self.shed = 0
+        self.served_stale = 0
+        self._loop = None
+        self._semaphore = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # Created on the serving loop; a worker forked after import gets its own
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.group.limit)
+            self.in_flight = 0
+        return self._semaphore
+
+
+class ConcurrencyLimiter:
+    """
+    Tracks in-flight requests per route group.
+
+    A request that cannot get a slot within ``queue_timeout`` seconds is
+    shed instead of queueing on the database pool.
+    """
+
+    def __init__(self, groups: List[RouteGroup], queue_timeout: float, retry_after: int):
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._states = [_GroupState(g) for g in groups if g.limit > 0]
+
+    def match(self, method: str, path: str) -> Optional[_GroupState]:
+        for state in self._states:
+            if state.group.matches(method, path):
+                return state
+        return None
+
+    async def acquire(self, state: _GroupState) -> bool:
+        """Take a slot, waiting at most ``queue_timeout``; False means shed."""
+        semaphore = state.semaphore
+        if self.queue_timeout <= 0:
+            # No queueing: a free slot is taken at once, without a timer
+            # that would expire before the acquire runs
+            if semaphore.locked():
+                return False
+            await semaphore.acquire()
+        else:
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                return False
+        state.in_flight += 1
+        state.admitted += 1
+        state.peak = max(state.peak, state.in_flight)
+        return True
+
+    def release(self, state: _GroupState) -> None:
+        state.in_flight -= 1
+        state.semaphore.release()
+
+    def stats(self) -> Dict:
+        return {
+            state.group.name: {
+                "limit": state.group.limit,
+                "in_flight": state.in_flight,
+                "peak": state.peak,
+                "admitted": state.admitted,
+                "shed": state.shed,
+                "served_stale": state.served_stale,
+            }
+            for state in self._states
+        }
+
+
+def default_route_groups() -> List[RouteGroup]:
+    """Route budgets from Settings; first match wins, 0 disables a group."""
+    return [
+        RouteGroup("auth", "/api/v1/auth", settings.LIMIT_AUTH),
+        RouteGroup("content_uploads", "/api/v1/content",
+                   settings.LIMIT_CONTENT_UPLOADS, WRITE_METHODS),
+        RouteGroup("content", "/api/v1/content", settings.LIMIT_CONTENT),
+        RouteGroup("additional", "/api/v1/additional", settings.LIMIT_ADDITIONAL),
+    ]
+
+
+concurrency_limiter = ConcurrencyLimiter(
+    default_route_groups(),
+    queue_timeout=settings.LIMIT_QUEUE_TIMEOUT,
+    retry_after=settings.LIMIT_RETRY_AFTER
+)
+
+# Optional hook returning a stale (status, headers, body) for a shed GET
+StaleLookup = Callable[[dict], Awaitable[Optional[tuple]]]
+
+
+class ConcurrencyLimitMiddleware:
+    """ASGI middleware enforcing ConcurrencyLimiter budgets."""
+
+    def __init__(self, app, limiter: ConcurrencyLimiter, stale_lookup: Optional[StaleLookup] = None):
+        self.app = app
+        self.limiter = limiter
+        self.stale_lookup = stale_lookup
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = self.limiter.match(scope["method"], scope["path"])
+        if state is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.limiter.acquire(state):
+            state.shed += 1
+            await self._shed(scope, send, state)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.limiter.release(state)
+
+    async def _shed(self, scope, send, state: _GroupState) -> None:
+        if self.stale_lookup is not None and scope["method"] in SAFE_METHODS:
+            stale = await self.stale_lookup(scope)
+            if stale is not None:
+                state.served_stale += 1
+                status, headers, body = stale
+                await _send(send, status, headers + [(b"x-cache", b"STALE")], body)
+                return
+
+        body = json.dumps(
+            {"detail": "Server is busy, please retry shortly"}).encode()
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"retry-after", str(self.limiter.retry_after).encode()),
+        ]
+        await _send(send, 503, headers, body)
+
+
+async def _send(send, status: int, headers: list, body: bytes) -> None:
+    headers = [h for h in headers if h[0].lower() != b"content-length"]
+    headers.append((b"content-length", str(len(body)).encode()))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,44 @@
+"""Lightweight in-process metrics primitives."""
+import threading
+from bisect import bisect_left
+from typing import Dict, Sequence
+
+# Upper bounds (milliseconds) for latency histograms
+DEFAULT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Histogram:
+    """Thread-safe cumulative latency histogram with fixed buckets."""
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self._bounds = tuple(buckets_ms)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._total = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value_ms: float) -> None:
+        """Record a single observation in milliseconds."""
+        index = bisect_left(self._bounds, value_ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._total += value_ms
+            if value_ms > self._max:
+                self._max = value_ms
+
+    def snapshot(self) -> Dict:
+        """Return count, mean, max and per-bucket counts."""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._total
+            maximum = self._max
+
+        count = sum(counts)
+        buckets = {f"le_{bound}ms": counts[i] for i, bound in enumerate(self._bounds)}
+        buckets["inf"] = counts[-1]
+        return {
+            "count": count,
+            "mean_ms": round(total / count, 3) if count else 0.0,
+            "max_ms": round(maximum, 3),
+            "buckets": buckets,
+        }
@@ -0,0 +1,178 @@
+"""Keyset (cursor) pagination for listing endpoints."""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
+
+
+def _invalid() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor"
+    )
+
+
+class Keyset:
+    """
+    Sort order of a keyset-paginated listing.
+
+    Built from columns, optionally wrapped in ``desc()``; the last one must
+    be unique (normally the primary key) so every row has one position.
+    Instead of skipping rows, a page continues strictly after the sort key
+    of the previous page's last row, which a composite index on the same
+    columns answers with a single range scan however deep the page is.
+
+    Example::
+
+        Keyset(desc(News.date_created), desc(News.id))
+    """
+
+    def __init__(self, *order: Any):
+        self.columns = []
+        self.descending = []
+        for item in order:
+            if isinstance(item, UnaryExpression):
+                self.columns.append(item.element)
+                self.descending.append(item.modifier is operators.desc_op)
+            else:
+                self.columns.append(item)
+                self.descending.append(False)
+
+    def order_by(self) -> List:
+        return [column.desc() if desc else column.asc()
+                for column, desc in zip(self.columns, self.descending)]
+
+    def after(self, values: Sequence) -> Any:
+        """Filter matching rows that sort strictly after ``values``."""
+        def beyond(column, desc, value):
+            return column < value if desc else column > value
+
+        branches = []
+        for i, (column, desc, value) in enumerate(
+                zip(self.columns, self.descending, values)):
+            equal = [c == v for c, v in zip(self.columns[:i], values[:i])]
+            branches.append(and_(*equal, beyond(column, desc, value)))
+
+        # The redundant bound on the leading column lets the optimizer use it
+        # as an index range instead of evaluating the OR row by row
+        first, desc, value = self.columns[0], self.descending[0], values[0]
+        leading = first <= value if desc else first >= value
+        return and_(leading, or_(*branches))
+
+    def values(self, row: Any) -> Tuple:
+        """Sort key of ``row`` (an ORM object, schema instance or mapping)."""
+        return tuple(row[column.key] if isinstance(row, dict) else getattr(row, column.key)
+                     for column in self.columns)
+
+    def sorts_after(self, row: Any, values: Sequence) -> bool:
+        """In-memory counterpart of ``after()``."""
+        for key, value, desc in zip(self.values(row), values, self.descending):
+            if key != value:
+                return key < value if desc else key > value
+        return False
+
+    def encode(self, row: Any) -> str:
+        """Opaque cursor positioned at ``row``."""
+        values = [value.isoformat() if isinstance(value, (datetime, date)) else value
+                  for value in self.values(row)]
+        raw = json.dumps(values, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    def decode(self, cursor: str) -> Tuple:
+        """
+        Parse a cursor produced by ``encode``.
+
+        Raises:
+            HTTPException: 400 if the cursor is malformed or was issued for
+                a different listing
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (binascii.Error, ValueError, UnicodeDecodeError):
+            raise _invalid()
+        if not isinstance(values, list) or len(values) != len(self.columns):
+            raise _invalid()
+
+        parsed = []
+        for column, value in zip(self.columns, values):
+            python_type = column.type.python_type
+            try:
+                if python_type is datetime:
+                    value = datetime.fromisoformat(value)
+                elif python_type is date:
+                    value = date.fromisoformat(value)
+                elif not isinstance(value, python_type) or isinstance(value, bool):
+                    value = python_type(value)
+            except (TypeError, ValueError):
+                raise _invalid()
+            parsed.append(value)
+        return tuple(parsed)
+
+
+async def keyset_page(
+    db: AsyncSession,
+    query,
+    keyset: Keyset,
+    cursor: Optional[str],
+    limit: int
+) -> Tuple[List, Optional[str]]:
+    """
+    Fetch one page of ``query`` (which must not be ordered yet).
+
+    Args:
+        db: Database session
+        query: Filtered select() of an ORM entity
+        keyset: Sort order of the listing
+        cursor: ``next_cursor`` of the previous page; empty or None for the
+            first page
+        limit: Page size
+
+    Returns:
+        The rows of the page and the cursor of the next one (None when this
+        is the last page)
+    """
+    if cursor:
+        query = query.filter(keyset.after(keyset.decode(cursor)))
+    # One extra row tells whether another page exists
+    result = await db.execute(query.order_by(*keyset.order_by()).limit(limit + 1))
+    rows = result.scalars().all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, keyset.encode(rows[-1])
+
+
+def slice_page(
+    items: Sequence,
+    keyset: Keyset,
+    cursor: Optional[str],
+    limit: int
+) -> Tuple[List, Optional[str]]:
+    """
+    ``keyset_page`` for a list already held in memory in ``keyset`` order.
+
+    The page resumes after the row the cursor was taken from, looked up by
+    its unique last column, so a collation that orders names differently
+    from Python cannot skip or repeat rows. If that row is gone, the first
+    row sorting after the cursor is used instead.
+    """
+    start = 0
+    if cursor:
+        values = keyset.decode(cursor)
+        unique = keyset.columns[-1].key
+        start = next((i + 1 for i, item in enumerate(items)
+                      if getattr(item, unique) == values[-1]), None)
+        if start is None:
+            start = next((i for i, item in enumerate(items)
+                          if keyset.sorts_after(item, values)), len(items))
+    rows = list(items[start:start + limit])
+    more = start + limit < len(items)
+    return rows, keyset.encode(rows[-1]) if more else None
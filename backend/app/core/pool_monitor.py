@@ -0,0 +1,110 @@
+"""Connection pool telemetry and background keepalive."""
+import asyncio
+import logging
+import time
+from typing import Dict
+
+from sqlalchemy import event, exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTelemetry:
+    """Counters shared by a pool and every pool it is recreated into."""
+
+    def __init__(self):
+        self.wait_time = Histogram()
+        self.checkout_timeouts = 0
+        self.pre_ping_failures = 0
+        self.invalidations = 0
+        self.keepalive_pings = 0
+        self.keepalive_failures = 0
+
+
+class MonitoredQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args, telemetry: PoolTelemetry = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.telemetry = telemetry or PoolTelemetry()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.telemetry.checkout_timeouts += 1
+            raise
+        finally:
+            self.telemetry.wait_time.observe(
+                (time.perf_counter() - started) * 1000)
+
+    def recreate(self):
+        # Engine.dispose() swaps in a new pool; keep the counters running
+        pool = super().recreate()
+        pool.telemetry = self.telemetry
+        return pool
+
+
+def monitor_engine(engine: AsyncEngine) -> None:
+    """Attach invalidation counters to an engine built on MonitoredQueuePool."""
+
+    @event.listens_for(engine.sync_engine, "invalidate")
+    def count_invalidation(dbapi_connection, connection_record, exception):
+        telemetry = engine.sync_engine.pool.telemetry
+        telemetry.invalidations += 1
+        # A failed pre-ping surfaces as a DisconnectionError on checkout
+        if isinstance(exception, exc.DisconnectionError):
+            telemetry.pre_ping_failures += 1
+
+
+def pool_stats(engine: AsyncEngine) -> Dict:
+    """Live pool occupancy plus checkout/liveness counters."""
+    pool = engine.sync_engine.pool
+    telemetry = pool.telemetry
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow_in_use": max(pool.overflow(), 0),
+        "checkout_timeouts": telemetry.checkout_timeouts,
+        "wait_time": telemetry.wait_time.snapshot(),
+        "pre_ping_failures": telemetry.pre_ping_failures,
+        "invalidations": telemetry.invalidations,
+        "keepalive_pings": telemetry.keepalive_pings,
+        "keepalive_failures": telemetry.keepalive_failures,
+    }
+
+
+async def ping_idle_connections(engine: AsyncEngine) -> None:
+    """
+    Ping each idle connection once.
+
+    The queue pool hands out idle connections in FIFO order, so checking
+    out ``checkedin()`` connections one after another visits every idle
+    connection exactly once without opening new ones.
+    """
+    pool = engine.sync_engine.pool
+    telemetry = pool.telemetry
+    for _ in range(pool.checkedin()):
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            telemetry.keepalive_pings += 1
+        except Exception as e:
+            # Disconnect errors invalidate the connection; the pool
+            # replaces it on the next checkout.
+            telemetry.keepalive_failures += 1
+            logger.warning("Pool keepalive ping failed: %s", e)
+
+
+async def keepalive(engine: AsyncEngine, interval: float) -> None:
+    """Background task that keeps idle connections warm."""
+    while True:
+        await asyncio.sleep(interval)
+        await ping_idle_connections(engine)
@@ -0,0 +1,130 @@
+"""
+Guard against hot queries falling back to full table scans.
+
+HOT_QUERIES mirrors the statements behind the busiest endpoints. Run::
+
+    python -m app.core.query_plans
+
+against a database carrying production-sized data (after
+``alembic upgrade head``) to EXPLAIN each of them; the command exits with
+status 1 if any reads a table without an index. The test suite runs the
+same check on SQLite against the indexes declared on the models.
+"""
+import re
+import sys
+from typing import Callable, Dict, List
+
+from sqlalchemy import desc, func, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select
+
+from app.models.additional import (
+    Honour, IdentityMaster, MatchReport, MatchScoringDetail, PlayerYearStats,
+    TeamPlayerScoringDetail, Ticker
+)
+from app.models.content import Gallery
+from app.models.news import News, NewsImage, Standing
+from app.models.tournament import Fixture, MatchResult
+
+# Representative parameters; only the shape of each statement matters
+HOT_QUERIES: Dict[str, Callable[[], Select]] = {
+    "news": lambda: (
+        select(News).filter(News.status.is_(True))
+        .order_by(desc(News.date_created), desc(News.id)).limit(20)),
+    "news images": lambda: (
+        select(NewsImage).filter(NewsImage.news_id.in_([1, 2, 3]))),
+    "gallery": lambda: (
+        select(Gallery).filter(Gallery.status == True, Gallery.parent_image == 0)
+        .order_by(desc(Gallery.date_created), desc(Gallery.id)).limit(50)),
+    "ticker": lambda: (
+        select(Ticker).filter(Ticker.status == True)
+        .order_by(desc(Ticker.date_created)).limit(10)),
+    "fixtures": lambda: (
+        select(Fixture).filter(Fixture.year_id == 1).order_by(Fixture.date_match)),
+    "results": lambda: (
+        select(MatchResult).join(Fixture, MatchResult.fixture_id == Fixture.id)
+        .filter(Fixture.year_id == 1)),
+    "standings": lambda: (
+        select(Standing).filter(Standing.year_id == 1, Standing.pool_id == 1)
+        .order_by(Standing.pool_category_type, Standing.pool_id, Standing.position)),
+    "honours": lambda: (
+        select(Honour).order_by(desc(Honour.year), desc(Honour.id)).limit(100)),
+    "identities": lambda: (
+        select(IdentityMaster).filter(IdentityMaster.status == True)
+        .order_by(IdentityMaster.name, IdentityMaster.id).limit(100)),
+    "match scoring": lambda: (
+        select(MatchScoringDetail).filter(MatchScoringDetail.match_id == 1)
+        .order_by(MatchScoringDetail.player_id, MatchScoringDetail.id)),
+    "match goals": lambda: (
+        select(TeamPlayerScoringDetail).filter(TeamPlayerScoringDetail.match_id == 1)
+        .order_by(TeamPlayerScoringDetail.time, TeamPlayerScoringDetail.id)),
+    "match centre": lambda: (
+        select(Fixture, MatchResult)
+        .outerjoin(MatchResult, MatchResult.fixture_id == Fixture.id)
+        .filter(Fixture.id == 1)),
+    "match reports": lambda: (
+        select(MatchReport).filter(MatchReport.match_id == 1).order_by(MatchReport.id)),
+    "top scorers": lambda: (
+        select(PlayerYearStats).filter(PlayerYearStats.year_id == 1, PlayerYearStats.goals > 0)
+        .order_by(desc(PlayerYearStats.goals)).limit(10)),
+    "team goals": lambda: (
+        select(PlayerYearStats.team_id, func.sum(PlayerYearStats.goals))
+        .filter(PlayerYearStats.year_id == 1).group_by(PlayerYearStats.team_id)),
+}
+
+# SQLite reports "SCAN t" for a table scan and "SCAN t USING INDEX i" when it
+# walks an index in order (which a LIMIT or join cuts short)
+_SQLITE_TABLE_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+def _explain(connection: Connection, statement: Select) -> List[str]:
+    """Tables ``statement`` reads with a full scan."""
+    sql = str(statement.compile(
+        dialect=connection.dialect, compile_kwargs={"literal_binds": True}))
+    dialect = connection.dialect.name
+
+    if dialect == "mysql":
+        rows = connection.exec_driver_sql("EXPLAIN " + sql).mappings().all()
+        return [row["table"] for row in rows if row["type"] == "ALL"]
+    if dialect == "sqlite":
+        rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + sql).all()
+        return [match.group(1) for match in
+                (_SQLITE_TABLE_SCAN.match(row[-1]) for row in rows) if match]
+    raise ValueError(f"Query plans can only be checked on MySQL or SQLite, not {dialect}")
+
+
+def full_scans(connection: Connection, queries: Dict[str, Callable[[], Select]] = None) -> Dict[str, List[str]]:
+    """
+    EXPLAIN every hot query.
+
+    Args:
+        connection: Open connection to MySQL or SQLite
+        queries: Queries to check, HOT_QUERIES by default
+
+    Returns:
+        Query name to the tables it scans in full, for offending queries only
+
+    Raises:
+        ValueError: If the connection is to another database
+    """
+    offenders = {}
+    for name, build in (queries or HOT_QUERIES).items():
+        tables = _explain(connection, build())
+        if tables:
+            offenders[name] = tables
+    return offenders
+
+
+def main() -> int:
+    from app.core.database import engine
+
+    with engine.connect() as connection:
+        offenders = full_scans(connection)
+    for name, tables in offenders.items():
+        print(f"FULL SCAN  {name}: {', '.join(tables)}")
+    print(f"{len(HOT_QUERIES) - len(offenders)}/{len(HOT_QUERIES)} hot queries use an index")
+    return 1 if offenders else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
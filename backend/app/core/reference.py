@@ -0,0 +1,192 @@
+"""In-memory snapshot of small, rarely-changing master tables."""
+import logging
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.invalidation import EVERYTHING, invalidation_bus
+from app.core.singleflight import read_flight
+from app.models.additional import (
+    CapacityMaster, LevelMaster, PoolMaster, PositionMaster, YearMaster
+)
+from app.models.team import Team
+from app.models.tournament import Category
+from app.schemas.additional import (
+    CapacityMasterResponse, LevelMasterResponse, PoolMasterResponse,
+    PositionMasterResponse, YearMasterResponse
+)
+from app.schemas.team import TeamResponse, TeamSummary
+from app.schemas.tournament import CategoryResponse
+
+logger = logging.getLogger(__name__)
+
+# Entities whose changes make the snapshot outdated
+REFERENCE_ENTITIES = frozenset({"team", "pool", "year", "category", EVERYTHING})
+
+
+@dataclass(frozen=True)
+class ReferenceSnapshot:
+    """
+    One consistent, read-only view of the master tables.
+
+    List attributes hold active rows in the order the API returns them.
+    ``teams_by_id``, ``team_summaries`` and ``pools_by_id`` also include
+    inactive rows so ids stored on fixtures and honours always resolve.
+    """
+    version: int
+    built_at: float
+    positions: Tuple[PositionMasterResponse, ...]
+    capacities: Tuple[CapacityMasterResponse, ...]
+    levels: Tuple[LevelMasterResponse, ...]
+    years: Tuple[YearMasterResponse, ...]
+    pools: Tuple[PoolMasterResponse, ...]
+    categories: Tuple[CategoryResponse, ...]
+    teams: Tuple[TeamResponse, ...]
+    teams_by_id: Mapping[int, TeamResponse]
+    team_summaries: Mapping[int, TeamSummary]
+    pools_by_id: Mapping[int, PoolMasterResponse]
+    years_by_id: Mapping[int, YearMasterResponse]
+
+    def team_name(self, team_id: int) -> Optional[str]:
+        team = self.teams_by_id.get(team_id)
+        return team.team_name if team else None
+
+    def pool_name(self, pool_id: int) -> Optional[str]:
+        pool = self.pools_by_id.get(pool_id)
+        return pool.pool_name if pool else None
+
+    def year(self, year_id: int) -> Optional[str]:
+        year = self.years_by_id.get(year_id)
+        return year.year if year else None
+
+
+def _index(rows: Iterable) -> Mapping[int, object]:
+    return MappingProxyType({row.id: row for row in rows})
+
+
+async def _rows(db: AsyncSession, schema, query) -> Tuple:
+    result = await db.execute(query)
+    return tuple(schema.model_validate(row) for row in result.scalars().all())
+
+
+async def load_snapshot(db: AsyncSession, version: int) -> ReferenceSnapshot:
+    """Read every master table and build a snapshot tagged with ``version``."""
+    positions = await _rows(db, PositionMasterResponse, select(PositionMaster)
+                            .filter(PositionMaster.status == True)
+                            .order_by(PositionMaster.position))
+    capacities = await _rows(db, CapacityMasterResponse, select(CapacityMaster)
+                             .filter(CapacityMaster.status == True)
+                             .order_by(CapacityMaster.capacity))
+    levels = await _rows(db, LevelMasterResponse, select(LevelMaster)
+                         .filter(LevelMaster.status == True)
+                         .order_by(LevelMaster.level))
+    years = await _rows(db, YearMasterResponse, select(YearMaster)
+                        .order_by(YearMaster.year.desc()))
+    pools = await _rows(db, PoolMasterResponse, select(PoolMaster)
+                        .order_by(PoolMaster.pool_name))
+    categories = await _rows(db, CategoryResponse, select(Category)
+                             .filter(Category.status == True)
+                             .order_by(Category.id))
+    teams = await _rows(db, TeamResponse, select(Team)
+                        .order_by(Team.team_name, Team.id))
+
+    return ReferenceSnapshot(
+        version=version,
+        built_at=time.time(),
+        positions=positions,
+        capacities=capacities,
+        levels=levels,
+        years=tuple(y for y in years if y.status),
+        pools=tuple(p for p in pools if p.status),
+        categories=categories,
+        teams=tuple(t for t in teams if t.status),
+        teams_by_id=_index(teams),
+        team_summaries=_index(TeamSummary.model_validate(team) for team in teams),
+        pools_by_id=_index(pools),
+        years_by_id=_index(years),
+    )
+
+
+class ReferenceData:
+    """
+    Holder for the current ReferenceSnapshot.
+
+    Changes to a master table published on the invalidation bus call
+    ``bump()`` on every worker; the next reader rebuilds the snapshot once
+    (through single-flight) from the primary, so a writer sees its own
+    change. Snapshots older than ``max_age`` seconds are also rebuilt in
+    case a broadcast was lost.
+    """
+
+    def __init__(self, max_age: float):
+        self.max_age = max_age
+        self._version = 0
+        self._snapshot: Optional[ReferenceSnapshot] = None
+        self.rebuilds = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def bump(self) -> None:
+        """Mark the current snapshot as outdated."""
+        self._version += 1
+
+    def _is_current(self, snapshot: Optional[ReferenceSnapshot]) -> bool:
+        return (
+            snapshot is not None
+            and snapshot.version == self._version
+            and time.time() - snapshot.built_at < self.max_age
+        )
+
+    async def current(self) -> ReferenceSnapshot:
+        """Return an up-to-date snapshot, rebuilding it if needed."""
+        snapshot = self._snapshot
+        if self._is_current(snapshot):
+            return snapshot
+        version = self._version
+        return await read_flight.do(("reference", version), lambda: self._rebuild(version))
+
+    async def _rebuild(self, version: int) -> ReferenceSnapshot:
+        async with AsyncSessionLocal() as session:
+            snapshot = await load_snapshot(session, version)
+        # A slower rebuild of an older version must not replace a newer one
+        if self._snapshot is None or self._snapshot.version <= version:
+            self._snapshot = snapshot
+        self.rebuilds += 1
+        return snapshot
+
+    def stats(self) -> Dict:
+        snapshot = self._snapshot
+        return {
+            "version": self._version,
+            "snapshot_version": snapshot.version if snapshot else None,
+            "age_seconds": round(time.time() - snapshot.built_at, 1) if snapshot else None,
+            "teams": len(snapshot.teams_by_id) if snapshot else 0,
+            "rebuilds": self.rebuilds,
+        }
+
+
+reference_data = ReferenceData(max_age=settings.REFERENCE_MAX_AGE)
+
+
+async def _on_change(entities, remote: bool) -> None:
+    if entities & REFERENCE_ENTITIES:
+        reference_data.bump()
+
+
+invalidation_bus.subscribe(_on_change)
+
+
+async def load_reference_data() -> None:
+    """Build the first snapshot at startup; a failure is retried on first use."""
+    try:
+        await reference_data.current()
+    except Exception as e:
+        logger.warning("Could not load reference data: %s", e)
@@ -0,0 +1,73 @@
+"""Single-flight coalescing for identical concurrent reads."""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import ReplicaSessionLocal, reads_from_primary
+
+
+class SingleFlight:
+    """
+    Share one in-flight computation between concurrent callers of the same key.
+
+    The first caller for a key starts the computation as a task; callers
+    arriving while it runs await the same task. The task is shielded, so a
+    caller that disconnects does not cancel the work for everyone else.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fn()`` once per key at a time and return its result to every caller."""
+        task = self._in_flight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    def stats(self) -> Dict:
+        return {
+            "in_flight": len(self._in_flight),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+        }
+
+
+read_flight = SingleFlight()
+
+
+async def coalesce_read(
+    request: Request,
+    db: AsyncSession,
+    key: Hashable,
+    load: Callable[[AsyncSession], Awaitable[Any]]
+) -> Any:
+    """
+    Run a read through the shared single-flight group.
+
+    ``load`` receives a session and must return fully loaded data. Shared
+    loads run on their own replica session so they outlive any single
+    caller. Clients inside their read-your-writes window bypass coalescing
+    and read from their own primary session.
+    """
+    if reads_from_primary(request):
+        return await load(db)
+
+    async def shared_load():
+        async with ReplicaSessionLocal() as session:
+            return await load(session)
+
+    return await read_flight.do(key, shared_load)
@@ -0,0 +1,126 @@
+"""
+Upload storage helpers; all disk I/O runs on the blocking executor.
+
+Uploads are stored under the hash of their content (``<hash>.<ext>``), so
+a stored file never changes and its URL can be cached forever. Files
+from before content addressing keep their ``{timestamp}_{original}``
+names and are served with revalidation instead.
+"""
+import hashlib
+import os
+import re
+import tempfile
+from typing import BinaryIO, Optional
+
+from fastapi import UploadFile
+from starlette.staticfiles import StaticFiles
+
+from app.core.config import settings
+from app.core.executor import run_blocking
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Shared caches may store legacy uploads too, unlike conditional.REVALIDATE API responses
+UPLOAD_REVALIDATE = "public, no-cache"
+
+_CHUNK_SIZE = 1024 * 1024
+_EXTENSION = re.compile(r"^\.[a-z0-9]{1,10}$")
+_CONTENT_ADDRESSED = re.compile(r"^[0-9a-f]{32}(\.[a-z0-9]{1,10})?$")
+
+
+def _file_mode() -> int:
+    # The umask can only be read by setting it; done once, at import
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Mode of a plain open(); temp files are created 0600, which a front
+# server reading UPLOAD_DIR from disk could not serve
+_FILE_MODE = _file_mode()
+
+
+def _extension(filename: Optional[str]) -> str:
+    ext = os.path.splitext(filename or "")[1].lower()
+    return ext if _EXTENSION.match(ext) else ""
+
+
+def is_content_addressed(filename: str) -> bool:
+    return bool(_CONTENT_ADDRESSED.match(filename))
+
+
+def _store_file(source: BinaryIO, directory: str, ext: str) -> str:
+    os.makedirs(directory, exist_ok=True)
+    digest = hashlib.blake2b(digest_size=16)
+    # Hash while writing to a temp file, then move it under its final name
+    with tempfile.NamedTemporaryFile(dir=directory, delete=False) as buffer:
+        try:
+            for chunk in iter(lambda: source.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+                buffer.write(chunk)
+        except BaseException:
+            buffer.close()
+            os.remove(buffer.name)
+            raise
+    filename = digest.hexdigest() + ext
+    final_path = os.path.join(directory, filename)
+    if os.path.exists(final_path):
+        # Identical content is already stored
+        os.remove(buffer.name)
+    else:
+        os.chmod(buffer.name, _FILE_MODE)
+        os.replace(buffer.name, final_path)
+    return filename
+
+
+def _remove_file(file_path: str) -> None:
+    if os.path.exists(file_path):
+        try:
+            os.remove(file_path)
+        except Exception:
+            pass
+
+
+async def save_upload(upload: UploadFile, subdir: str) -> str:
+    """
+    Store an uploaded file under ``UPLOAD_DIR/subdir``.
+
+    Args:
+        upload: Uploaded file
+        subdir: Upload sub-directory (news, teams, gallery, ...)
+
+    Returns:
+        Stored (content-addressed) filename
+    """
+    directory = os.path.join(settings.UPLOAD_DIR, subdir)
+    return await run_blocking(_store_file, upload.file, directory, _extension(upload.filename))
+
+
+async def delete_upload(subdir: str, filename: Optional[str]) -> None:
+    """
+    Remove a stored upload if it exists.
+
+    Content-addressed files may be shared by several rows (the same image
+    uploaded twice) and may still be cached by clients, so they are kept.
+    """
+    if not filename or is_content_addressed(filename):
+        return
+    file_path = os.path.join(settings.UPLOAD_DIR, subdir, filename)
+    await run_blocking(_remove_file, file_path)
+
+
+def upload_url(subdir: str, filename: Optional[str]) -> Optional[str]:
+    """Public URL of a stored upload, on UPLOADS_BASE_URL (e.g. a CDN)."""
+    if not filename:
+        return None
+    return f"{settings.UPLOADS_BASE_URL.rstrip('/')}/{subdir}/{filename}"
+
+
+class UploadFiles(StaticFiles):
+    """StaticFiles that marks content-addressed uploads as immutable."""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        name = os.path.basename(full_path)
+        response.headers["Cache-Control"] = (
+            IMMUTABLE if is_content_addressed(name) else UPLOAD_REVALIDATE)
+        return response
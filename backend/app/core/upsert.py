@@ -0,0 +1,45 @@
+"""Atomic insert-or-increment for counter tables with a unique key."""
+from typing import Any, Dict, Sequence
+
+from sqlalchemy import func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def upsert_increment(
+    db: AsyncSession,
+    model: Any,
+    key: Sequence[str],
+    values: Dict[str, Any],
+    deltas: Dict[str, int]
+) -> None:
+    """
+    Add ``deltas`` to the row of ``model`` matching ``values`` on the
+    unique ``key`` columns, creating it from ``values`` and ``deltas`` if
+    there is none.
+
+    One statement (``INSERT ... ON DUPLICATE KEY UPDATE`` on MySQL,
+    ``ON CONFLICT DO UPDATE`` on SQLite), so two writers creating the same
+    row at once both count instead of one failing or inserting a duplicate.
+
+    Raises:
+        ValueError: If the session is bound to another database
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        statement = mysql_insert(model).values({**values, **deltas})
+        added = statement.inserted
+    elif dialect == "sqlite":
+        statement = sqlite_insert(model).values({**values, **deltas})
+        added = statement.excluded
+    else:
+        raise ValueError(f"No upsert for {dialect}")
+
+    increments = {column: func.coalesce(getattr(model, column), 0) + added[column]
+                  for column in deltas}
+    if dialect == "mysql":
+        statement = statement.on_duplicate_key_update(increments)
+    else:
+        statement = statement.on_conflict_do_update(index_elements=list(key), set_=increments)
+    await db.execute(statement)
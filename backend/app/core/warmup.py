@@ -0,0 +1,40 @@
+"""Worker warm-up run from the application lifespan before serving traffic."""
+import logging
+from contextlib import AsyncExitStack
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.database import api_engines
+from app.core.reference import load_reference_data
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_pool(db_engine: AsyncEngine, connections: int) -> None:
+    """Open ``connections`` pooled connections, then return them all idle."""
+    async with AsyncExitStack() as stack:
+        # Hold every connection until the end so each one is distinct
+        for _ in range(connections):
+            conn = await stack.enter_async_context(db_engine.connect())
+            await conn.execute(text("SELECT 1"))
+
+
+async def warm_up() -> None:
+    """
+    Prepare a freshly started worker.
+
+    Fills each connection pool up to DB_POOL_WARMUP connections and loads
+    the reference-data snapshot. Failures are logged rather than raised so
+    a database blip does not stop the worker from booting.
+    """
+    connections = min(settings.DB_POOL_WARMUP, settings.DB_POOL_SIZE)
+    if connections > 0:
+        for role, db_engine in api_engines().items():
+            try:
+                await warm_pool(db_engine, connections)
+            except Exception as e:
+                logger.warning("Could not warm %s pool: %s", role, e)
+
+    await load_reference_data()
@@ -1,9 +1,45 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 from app.core.config import settings
-from app.api.v1 import tournaments, teams, content, news, additional, auth
+from app.core.executor import blocking_executor
+from app.core.database import (
+    READ_PRIMARY_COOKIE, READ_PRIMARY_HEADER, api_engines, read_primary_marker
+)
+from app.core.pool_monitor import keepalive, pool_stats
+from app.core.uploads import UploadFiles
+from app.core.warmup import warm_up
+from app.core.singleflight import read_flight
+from app.core.limits import ConcurrencyLimitMiddleware, concurrency_limiter
+from app.core.cache import TOTAL_COUNT_HEADER, cache_backend, stale_lookup
+from app.core.invalidation import invalidation_bus
+from app.core.reference import reference_data
+from app.api.v1 import tournaments, teams, content, news, additional, auth, matches, leaderboards
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the worker, start background tasks and release resources on shutdown."""
+    await warm_up()
+    await invalidation_bus.start()
+
+    tasks = []
+    if settings.DB_LIVENESS == "keepalive":
+        tasks = [
+            asyncio.create_task(keepalive(db_engine, settings.DB_KEEPALIVE_INTERVAL))
+            for db_engine in api_engines().values()
+        ]
+
+    yield
+
+    await invalidation_bus.stop()
+    for task in tasks:
+        task.cancel()
+    for db_engine in api_engines().values():
+        await db_engine.dispose()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -11,13 +47,23 @@ app = FastAPI(
     version=settings.API_VERSION,
     description="REST API for Surjit Hockey Tournament Management System",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
-# Mount static files for uploads
+# Mount static files for uploads; content-addressed files are immutable
 uploads_path = Path(__file__).parent.parent / "uploads"
 uploads_path.mkdir(exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=str(uploads_path)), name="uploads")
+app.mount("/uploads", UploadFiles(directory=str(uploads_path)), name="uploads")
+
+# Shed load per route group before requests queue on the DB pool.
+# Added before CORS so shed responses still carry CORS headers. Shed
+# GETs fall back to a recently expired cached response when one exists.
+app.add_middleware(
+    ConcurrencyLimitMiddleware,
+    limiter=concurrency_limiter,
+    stale_lookup=stale_lookup
+)
 
 # Configure CORS
 app.add_middleware(
@@ -26,8 +72,27 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[READ_PRIMARY_HEADER, TOTAL_COUNT_HEADER],
 )
 
+
+@app.middleware("http")
+async def read_your_writes(request: Request, call_next):
+    """Pin a client's reads to the primary for a short window after it writes."""
+    response = await call_next(request)
+    if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        marker = read_primary_marker()
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            marker,
+            max_age=settings.READ_YOUR_WRITES_SECONDS,
+            httponly=True
+        )
+        # Cross-origin clients can echo this back as a request header
+        response.headers[READ_PRIMARY_HEADER] = marker
+    return response
+
+
 # Include routers
 app.include_router(
     tournaments.router,
@@ -47,6 +112,18 @@ app.include_router(
     tags=["Content"]
 )
 
+app.include_router(
+    matches.router,
+    prefix="/api/v1/matches",
+    tags=["Match Centre"]
+)
+
+app.include_router(
+    leaderboards.router,
+    prefix="/api/v1/leaderboards",
+    tags=["Leaderboards"]
+)
+
 app.include_router(
     news.router,
     prefix="/api/v1",
@@ -87,6 +164,23 @@ async def health_check():
     }
 
 
+@app.get("/metrics")
+async def metrics():
+    """Runtime metrics for capacity planning."""
+    return {
+        "executor": blocking_executor.stats(),
+        "singleflight": read_flight.stats(),
+        "concurrency": concurrency_limiter.stats(),
+        "cache": cache_backend.stats(),
+        "reference": reference_data.stats(),
+        "invalidation": invalidation_bus.stats(),
+        "database": {
+            role: pool_stats(db_engine)
+            for role, db_engine in api_engines().items()
+        }
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -6,11 +6,12 @@ from app.models.team import Team, TeamPlayer, Alumni
 from app.models.content import Banner, Advertisement, Gallery, Memory
 from app.models.news import News, NewsImage, Official, Sponsor, Standing
 from app.models.additional import (
-    MatchScoringDetail, PoolMaster, PoolDetails, YearMaster,
+    MatchScoringDetail, PlayerYearStats, PoolMaster, PoolDetails, YearMaster,
     Honour, Dedicated, Ticker, ImageOfDay, PositionMaster,
     MatchReport, Streaming, Timer, CapacityMaster, LevelMaster,
     IdentityMaster, TeamPlayerScoringDetail
 )
+from app.models.system import EntityVersion
 
 __all__ = [
     "User",
@@ -33,6 +34,7 @@ __all__ = [
     "Sponsor",
     "Standing",
     "MatchScoringDetail",
+    "PlayerYearStats",
     "PoolMaster",
     "PoolDetails",
     "YearMaster",
@@ -48,4 +50,5 @@ __all__ = [
     "LevelMaster",
     "IdentityMaster",
     "TeamPlayerScoringDetail",
+    "EntityVersion",
 ]
@@ -1,11 +1,14 @@
 """Additional models for tournament features."""
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, SmallInteger
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, SmallInteger, Index
 from app.core.database import Base
 
 
 class MatchScoringDetail(Base):
     """Match player statistics - goals, cards, fouls."""
     __tablename__ = "hockey_fixture_match_details"
+    __table_args__ = (
+        Index("ix_match_details_match_player", "match_id", "player_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     year_id = Column(Integer, nullable=False, index=True)
@@ -22,6 +25,27 @@ class MatchScoringDetail(Base):
     status = Column(Integer, nullable=False, default=3)
 
 
+class PlayerYearStats(Base):
+    """Per-year totals of match player statistics, for the leaderboards."""
+    __tablename__ = "hockey_player_year_stats"
+    __table_args__ = (
+        Index("ix_player_year_stats_key", "year_id", "team_id", "player_id", unique=True),
+        Index("ix_player_year_stats_goals", "year_id", "goals"),
+        Index("ix_player_year_stats_cards", "year_id", "red_card", "yellow_card", "green_card"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    year_id = Column(Integer, nullable=False)
+    team_id = Column(Integer, nullable=False)
+    player_id = Column(Integer, nullable=False)
+    # Kept up to date by app.services.leaderboards
+    matches_played = Column(Integer, nullable=False, default=0)
+    goals = Column(Integer, nullable=False, default=0)
+    green_card = Column(Integer, nullable=False, default=0)
+    yellow_card = Column(Integer, nullable=False, default=0)
+    red_card = Column(Integer, nullable=False, default=0)
+
+
 class PoolMaster(Base):
     """Pool/Group master data."""
     __tablename__ = "hockey_pool_master"
@@ -58,6 +82,9 @@ class YearMaster(Base):
 class Honour(Base):
     """Tournament Winners/Champions."""
     __tablename__ = "hockey_honour"
+    __table_args__ = (
+        Index("ix_honour_year", "year", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     year = Column(Integer, nullable=False)
@@ -83,6 +110,9 @@ class Dedicated(Base):
 class Ticker(Base):
     """News ticker/breaking news."""
     __tablename__ = "hockey_ticker_master"
+    __table_args__ = (
+        Index("ix_ticker_status_created", "status", "date_created"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(300), nullable=False)
@@ -165,6 +195,9 @@ class LevelMaster(Base):
 class IdentityMaster(Base):
     """Identity/credential information."""
     __tablename__ = "hockey_identity_master"
+    __table_args__ = (
+        Index("ix_identity_status_name", "status", "name", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     identity_category_type = Column(SmallInteger, nullable=False)
@@ -193,6 +226,9 @@ class IdentityMaster(Base):
 class TeamPlayerScoringDetail(Base):
     """Team player scoring details - goals with timing."""
     __tablename__ = "hockey_team_player_details"
+    __table_args__ = (
+        Index("ix_team_player_details_match_time", "match_id", "time", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     year_id = Column(Integer, nullable=False, index=True)
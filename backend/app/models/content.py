@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Index
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -33,6 +33,11 @@ class Advertisement(Base):
 class Gallery(Base):
     """Photo gallery album model."""
     __tablename__ = "hockey_gallery"
+    __table_args__ = (
+        # Keyset pagination of active albums, newest first
+        Index("ix_gallery_status_parent_created",
+              "status", "parent_image", "date_created", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     image_name = Column(String(100), nullable=False)
@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Date
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Date, Index
+from sqlalchemy.orm import relationship
 from app.core.database import Base
 
 
 class News(Base):
     """News article model."""
     __tablename__ = "hockey_news_master"
+    __table_args__ = (
+        # Keyset pagination of published articles, newest first
+        Index("ix_news_status_created", "status", "date_created", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(250), nullable=False)
@@ -15,6 +20,17 @@ class News(Base):
     user_updated = Column(Integer, nullable=True)
     status = Column(Boolean, nullable=False)
 
+    # No FK constraint exists in the legacy schema, so the join is declared
+    # here. Load it explicitly (selectinload); lazy loads raise so an N+1
+    # cannot creep back in.
+    images = relationship(
+        "NewsImage",
+        primaryjoin="News.id == foreign(NewsImage.news_id)",
+        order_by="NewsImage.id",
+        viewonly=True,
+        lazy="raise"
+    )
+
 
 class NewsImage(Base):
     """News image model."""
@@ -65,6 +81,11 @@ class Sponsor(Base):
 class Standing(Base):
     """Tournament standings/points table model."""
     __tablename__ = "hockey_standing_master"
+    __table_args__ = (
+        Index("ix_standing_year_pool_points", "year_id", "pool_id", "points"),
+        # One row per team and pool; result writes upsert on it
+        Index("ix_standing_year_pool_team", "year_id", "pool_id", "team_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     year_id = Column(Integer, index=True, nullable=False)
@@ -80,3 +101,5 @@ class Standing(Base):
     goal_diffrence = Column(Integer, default=0)
     points = Column(Integer, default=0)
     status_pool_winner = Column(Boolean, default=False)
+    # Rank within the pool, 1 first; kept up to date by the ranking
+    position = Column(Integer, nullable=True)
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, DateTime, Integer, String
+from app.core.database import Base
+
+
+class EntityVersion(Base):
+    """Change counter per entity, polled by workers to invalidate caches."""
+    __tablename__ = "hockey_entity_version"
+
+    entity = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    date_updated = Column(DateTime, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Date
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Date, Index
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -21,6 +21,10 @@ class Tournament(Base):
 class Fixture(Base):
     """Match fixture model."""
     __tablename__ = "hockey_fixture_master"
+    __table_args__ = (
+        # Fixtures of a year in kick-off order; also drives the results join
+        Index("ix_fixture_year_date", "year_id", "date_match"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     year_id = Column(Integer, nullable=False)
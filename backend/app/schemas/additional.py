@@ -3,6 +3,8 @@ from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
 
+from app.schemas.team import TeamSummary
+
 
 class MatchScoringDetailResponse(BaseModel):
     """Match player statistics response."""
@@ -24,6 +26,33 @@ class MatchScoringDetailResponse(BaseModel):
         from_attributes = True
 
 
+class MatchScoringDetailCreate(BaseModel):
+    """Player statistics for a match; the match comes from the path."""
+    year_id: int
+    match_type: int
+    team_id: int
+    pool_category_type: int
+    player_id: int
+    green_card: int = 0
+    yellow_card: int = 0
+    red_card: int = 0
+    total_score: int = 0
+    fouled_point: int = 0
+    status: int = 3
+
+
+class MatchScoringDetailUpdate(BaseModel):
+    """Player statistics update schema."""
+    team_id: Optional[int] = None
+    player_id: Optional[int] = None
+    green_card: Optional[int] = None
+    yellow_card: Optional[int] = None
+    red_card: Optional[int] = None
+    total_score: Optional[int] = None
+    fouled_point: Optional[int] = None
+    status: Optional[int] = None
+
+
 class PoolMasterResponse(BaseModel):
     """Pool master response."""
     id: int
@@ -50,6 +79,11 @@ class PoolDetailsResponse(BaseModel):
         from_attributes = True
 
 
+class PoolDetailsExpandedResponse(PoolDetailsResponse):
+    """Pool membership with the team embedded (?expand=teams)."""
+    team: Optional[TeamSummary] = None
+
+
 class YearMasterResponse(BaseModel):
     """Year master response."""
     id: int
@@ -73,6 +107,12 @@ class HonourResponse(BaseModel):
         from_attributes = True
 
 
+class HonourExpandedResponse(HonourResponse):
+    """Honour with both teams embedded (?expand=teams)."""
+    team_1: Optional[TeamSummary] = None
+    team_2: Optional[TeamSummary] = None
+
+
 class DedicatedResponse(BaseModel):
     """Dedicated guests/dignitaries response."""
     id: int
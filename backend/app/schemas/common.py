@@ -0,0 +1,12 @@
+"""Schemas shared by several endpoints."""
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """One page of a keyset-paginated listing."""
+    items: List[T]
+    # Pass back as ?cursor= to get the next page; None on the last page
+    next_cursor: Optional[str] = None
@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 from typing import Optional
 from datetime import datetime
 
+from app.core.uploads import upload_url
+
 
 class BannerBase(BaseModel):
     """Base banner schema."""
@@ -62,6 +64,11 @@ class GalleryResponse(GalleryBase):
     date_created: datetime
     status: bool
 
+    @computed_field
+    @property
+    def image_url(self) -> Optional[str]:
+        return upload_url("gallery", self.image_name)
+
     class Config:
         from_attributes = True
 
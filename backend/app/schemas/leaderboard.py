@@ -0,0 +1,38 @@
+"""Schemas for the leaderboards."""
+from pydantic import BaseModel
+from typing import List, Optional
+
+from app.schemas.team import TeamSummary
+
+
+class PlayerLeaderboardEntry(BaseModel):
+    """A player's totals for the year with the player's roster entry."""
+    player_id: int
+    player_name: Optional[str] = None
+    jersey_no: Optional[int] = None
+    team_id: int
+    team: Optional[TeamSummary] = None
+    matches_played: int
+    goals: int
+    green_card: int
+    yellow_card: int
+    red_card: int
+
+    class Config:
+        from_attributes = True
+
+
+class TeamGoalsEntry(BaseModel):
+    """Goals a team's players scored in the year."""
+    team_id: int
+    team: Optional[TeamSummary] = None
+    goals: int
+
+
+class LeaderboardResponse(BaseModel):
+    """Top scorers, most carded players and team goal tallies of a year."""
+    year_id: int
+    top_scorers: List[PlayerLeaderboardEntry] = []
+    # Red cards first, then yellow, then green
+    cards: List[PlayerLeaderboardEntry] = []
+    team_goals: List[TeamGoalsEntry] = []
@@ -0,0 +1,32 @@
+"""Schemas for the match centre."""
+from pydantic import BaseModel
+from typing import List, Optional
+
+from app.schemas.additional import (
+    MatchReportResponse, MatchScoringDetailResponse, TeamPlayerScoringDetailResponse
+)
+from app.schemas.team import TeamSummary
+from app.schemas.tournament import FixtureExpandedResponse, MatchResultResponse
+
+
+class MatchPlayerStatsResponse(MatchScoringDetailResponse):
+    """Player statistics with the player's roster entry."""
+    player_name: Optional[str] = None
+    jersey_no: Optional[int] = None
+
+
+class MatchGoalResponse(TeamPlayerScoringDetailResponse):
+    """Goal with the scorer's roster entry."""
+    player_name: Optional[str] = None
+    jersey_no: Optional[int] = None
+
+
+class MatchCentreResponse(BaseModel):
+    """Everything a match page shows, in one response."""
+    fixture: FixtureExpandedResponse
+    # None until the match has a result
+    result: Optional[MatchResultResponse] = None
+    winner_team: Optional[TeamSummary] = None
+    player_stats: List[MatchPlayerStatsResponse] = []
+    goals: List[MatchGoalResponse] = []
+    reports: List[MatchReportResponse] = []
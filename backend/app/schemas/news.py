@@ -1,7 +1,10 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, computed_field
+from typing import ClassVar, Dict, List, Optional
 from datetime import datetime, date
 
+from app.core.uploads import upload_url
+from app.schemas.team import TeamSummary
+
 
 class NewsBase(BaseModel):
     """Base news schema."""
@@ -20,7 +23,25 @@ class NewsResponse(NewsBase):
     date_created: datetime
     date_updated: Optional[datetime] = None
     status: bool
+    # First image, kept for existing clients; news_images has all of them
     news_image: Optional[str] = None
+    news_images: List[str] = []
+
+    # Field each computed field is derived from, for ?fields=
+    field_sources: ClassVar[Dict[str, str]] = {
+        "news_image_url": "news_image",
+        "news_image_urls": "news_images",
+    }
+
+    @computed_field
+    @property
+    def news_image_url(self) -> Optional[str]:
+        return upload_url("news", self.news_image)
+
+    @computed_field
+    @property
+    def news_image_urls(self) -> List[str]:
+        return [upload_url("news", image) for image in self.news_images]
 
     class Config:
         from_attributes = True
@@ -67,6 +88,13 @@ class SponsorResponse(SponsorBase):
     order_by: Optional[int] = None
     status: bool
 
+    field_sources: ClassVar[Dict[str, str]] = {"sponser_image_url": "sponser_image"}
+
+    @computed_field
+    @property
+    def sponser_image_url(self) -> Optional[str]:
+        return upload_url("sponsors", self.sponser_image)
+
     class Config:
         from_attributes = True
 
@@ -86,6 +114,7 @@ class StandingBase(BaseModel):
     goal_diffrence: int = 0
     points: int = 0
     status_pool_winner: bool = False
+    position: Optional[int] = None
 
 
 class StandingResponse(StandingBase):
@@ -96,6 +125,11 @@ class StandingResponse(StandingBase):
         from_attributes = True
 
 
+class StandingExpandedResponse(StandingResponse):
+    """Standing with its team embedded (?expand=teams)."""
+    team: Optional[TeamSummary] = None
+
+
 class SponsorCreate(SponsorBase):
     """Schema for creating sponsor."""
     status: bool = True
@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field, field_serializer, field_validator
+from pydantic import BaseModel, Field, computed_field, field_serializer, field_validator
 from typing import Optional
 from datetime import date, datetime
 
+from app.core.uploads import upload_url
+
 
 class TeamBase(BaseModel):
     """Base team schema."""
@@ -23,6 +25,27 @@ class TeamResponse(TeamBase):
     team_type: int
     status: bool
 
+    @computed_field
+    @property
+    def team_logo_url(self) -> Optional[str]:
+        return upload_url("teams", self.team_logo)
+
+    class Config:
+        from_attributes = True
+
+
+class TeamSummary(BaseModel):
+    """Team fields embedded in other resources by ?expand=teams."""
+    id: int
+    team_name: str
+    team_name_short: str
+    team_logo: Optional[str] = None
+
+    @computed_field
+    @property
+    def team_logo_url(self) -> Optional[str]:
+        return upload_url("teams", self.team_logo)
+
     class Config:
         from_attributes = True
 
@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime, date
 
+from app.schemas.team import TeamSummary
+
 
 class TournamentBase(BaseModel):
     """Base tournament schema."""
@@ -56,6 +58,12 @@ class FixtureResponse(FixtureBase):
         from_attributes = True
 
 
+class FixtureExpandedResponse(FixtureResponse):
+    """Fixture with both teams embedded (?expand=teams)."""
+    team_1: Optional[TeamSummary] = None
+    team_2: Optional[TeamSummary] = None
+
+
 class MatchResultBase(BaseModel):
     """Base match result schema."""
     fixture_id: int
@@ -79,6 +87,15 @@ class MatchResultResponse(MatchResultBase):
         from_attributes = True
 
 
+class MatchResultExpandedResponse(MatchResultResponse):
+    """Match result with the fixture's teams embedded (?expand=teams)."""
+    team_id_1: Optional[int] = None
+    team_id_2: Optional[int] = None
+    team_1: Optional[TeamSummary] = None
+    team_2: Optional[TeamSummary] = None
+    winner_team: Optional[TeamSummary] = None
+
+
 class CategoryResponse(BaseModel):
     """Schema for category response."""
     id: int
@@ -0,0 +1,75 @@
+"""
+Production launcher: gunicorn managing uvicorn workers.
+
+Usage:
+    python -m app.server
+
+The app is imported once in the master (preload) and forked into
+workers. Each worker runs the FastAPI lifespan, which warms the
+connection pools before the worker starts accepting connections.
+Workers are recycled after WORKER_MAX_REQUESTS requests (with jitter so
+they do not all restart together) and drain in-flight requests for up to
+GRACEFUL_TIMEOUT seconds on shutdown or reload.
+"""
+import multiprocessing
+
+from gunicorn.app.base import BaseApplication
+
+from app.core.config import settings
+
+
+def default_workers() -> int:
+    """One async worker per CPU unless WEB_CONCURRENCY says otherwise."""
+    return settings.WEB_CONCURRENCY or multiprocessing.cpu_count()
+
+
+def post_fork(server, worker):
+    """Drop pool state inherited from the master so workers never share sockets."""
+    from app.core.database import api_engines, engine
+
+    engine.dispose(close=False)
+    for db_engine in api_engines().values():
+        db_engine.sync_engine.dispose(close=False)
+
+
+class HockeyServer(BaseApplication):
+    """Programmatic gunicorn application."""
+
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            if key in self.cfg.settings and value is not None:
+                self.cfg.set(key, value)
+
+    def load(self):
+        from app.main import app
+        return app
+
+
+def server_options() -> dict:
+    """Gunicorn settings derived from Settings."""
+    return {
+        "bind": f"{settings.SERVER_HOST}:{settings.SERVER_PORT}",
+        "workers": default_workers(),
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "preload_app": True,
+        "max_requests": settings.WORKER_MAX_REQUESTS,
+        "max_requests_jitter": settings.WORKER_MAX_REQUESTS_JITTER,
+        "timeout": settings.WORKER_TIMEOUT,
+        "graceful_timeout": settings.GRACEFUL_TIMEOUT,
+        "keepalive": settings.KEEPALIVE_SECONDS,
+        "post_fork": post_fork,
+        "accesslog": "-",
+        "errorlog": "-",
+    }
+
+
+def main():
+    HockeyServer(server_options()).run()
+
+
+if __name__ == "__main__":
+    main()
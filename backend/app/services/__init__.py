@@ -0,0 +1 @@
+"""Domain engines that derive tables from the records the API writes."""
@@ -0,0 +1,117 @@
+"""
+Leaderboard engine: keeps ``hockey_player_year_stats`` in step with the
+match player statistics (``hockey_fixture_match_details``).
+
+Each statistics row adds one match, its ``total_score`` goals and its
+cards to the row of its year, team and player. Writes apply that delta
+with an atomic upsert in the writer's transaction, so the leaderboards
+read a few hundred aggregate rows per year instead of summing every
+match. ``rebuild`` recomputes whole years with one grouped INSERT ...
+SELECT, for backfills and after hand edits::
+
+    python -m app.services.leaderboards --all
+"""
+import asyncio
+import sys
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.upsert import upsert_increment
+from app.models.additional import MatchScoringDetail, PlayerYearStats
+
+# Aggregate column: statistics column it sums
+STAT_COLUMNS = {
+    "goals": "total_score",
+    "green_card": "green_card",
+    "yellow_card": "yellow_card",
+    "red_card": "red_card",
+}
+
+
+def detail_tally(detail: MatchScoringDetail) -> Dict[str, int]:
+    """What one statistics row adds to its player's year."""
+    tally = {key: getattr(detail, column) or 0 for key, column in STAT_COLUMNS.items()}
+    tally["matches_played"] = 1
+    return tally
+
+
+async def apply_detail(db: AsyncSession, detail: MatchScoringDetail, sign: int = 1) -> None:
+    """
+    Add a statistics row to the aggregate, or take it back out with
+    ``sign=-1``.
+
+    Call it in the transaction that writes the row: an update reverts the
+    old values before changing them and applies the new ones after; a
+    delete only reverts. Nothing is committed here.
+
+    Args:
+        db: Session of the writing transaction
+        detail: Match player statistics row
+        sign: 1 to apply, -1 to revert
+    """
+    tally = {key: sign * value for key, value in detail_tally(detail).items()}
+    await upsert_increment(
+        db, PlayerYearStats, ("year_id", "team_id", "player_id"),
+        {"year_id": detail.year_id, "team_id": detail.team_id, "player_id": detail.player_id},
+        tally)
+
+
+async def revert_detail(db: AsyncSession, detail: MatchScoringDetail) -> None:
+    """Take a statistics row out of the aggregate (see ``apply_detail``)."""
+    await apply_detail(db, detail, sign=-1)
+
+
+async def rebuild(db: AsyncSession, year_ids: Sequence[int]) -> int:
+    """
+    Recompute the aggregate of ``year_ids`` from the statistics rows.
+
+    The years' rows are deleted and written again by one grouped
+    INSERT ... SELECT, so the statistics never leave the database.
+    Nothing is committed here.
+
+    Returns:
+        Number of aggregate rows written
+    """
+    await db.execute(delete(PlayerYearStats).where(PlayerYearStats.year_id.in_(year_ids)))
+    totals = select(
+        MatchScoringDetail.year_id, MatchScoringDetail.team_id, MatchScoringDetail.player_id,
+        func.count(MatchScoringDetail.id),
+        *(func.coalesce(func.sum(getattr(MatchScoringDetail, column)), literal(0))
+          for column in STAT_COLUMNS.values()),
+    ).filter(MatchScoringDetail.year_id.in_(year_ids))\
+        .group_by(MatchScoringDetail.year_id, MatchScoringDetail.team_id,
+                  MatchScoringDetail.player_id)
+    await db.execute(insert(PlayerYearStats).from_select(
+        ["year_id", "team_id", "player_id", "matches_played", *STAT_COLUMNS], totals))
+    return await db.scalar(select(func.count(PlayerYearStats.id))
+                           .filter(PlayerYearStats.year_id.in_(year_ids)))
+
+
+async def _rebuild(year_ids: Optional[List[int]]) -> None:
+    from app.core.database import AsyncSessionLocal
+    from app.core.invalidation import publish
+
+    async with AsyncSessionLocal() as db:
+        if year_ids is None:
+            # Also years whose statistics rows have all been deleted
+            year_ids = (await db.execute(
+                select(MatchScoringDetail.year_id)
+                .union(select(PlayerYearStats.year_id)))).scalars().all()
+        rows = await rebuild(db, year_ids)
+        await db.commit()
+    print(f"{len(year_ids)} years rebuilt, {rows} player rows")
+    await publish("scoring")
+
+
+def main(argv: List[str]) -> int:
+    if not argv:
+        print("usage: python -m app.services.leaderboards --all | YEAR_ID [YEAR_ID ...]")
+        return 2
+    asyncio.run(_rebuild(None if argv == ["--all"] else [int(year_id) for year_id in argv]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,248 @@
+"""
+Competition rules: match points and the ranking of a pool.
+
+Teams in a pool are ordered by:
+
+1. points
+2. goal difference
+3. goals scored
+4. head-to-head: a mini-league of the matches among the teams still level
+   (points, goal difference, goals scored), applied again to any smaller
+   group left level
+5. matches won, then team id, so the order never depends on row order
+
+The rank is stored on the standing rows (``position`` and
+``status_pool_winner``) whenever results change them, so reading a points
+table is a plain ordered select. Ranking is pure computation over rows
+loaded in bulk: ``rank_standings`` re-ranks every pool of any number of
+years with three queries and one batched UPDATE, including years whose
+tables were kept by hand::
+
+    python -m app.services.ranking --all
+"""
+import asyncio
+import sys
+from collections import defaultdict
+from itertools import groupby
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.additional import PoolDetails
+from app.models.news import Standing
+from app.models.tournament import Fixture, MatchResult
+
+WIN_POINTS = 3
+DRAW_POINTS = 1
+
+# Fixture.pool_type of a pool match; knockout rounds have other stages
+POOL_STAGE = 1
+
+# (team_id_1, team_id_2, score_1, score_2); scores are None until played
+Match = Tuple[int, int, Optional[int], Optional[int]]
+
+# (pool_type, pool_id_1, pool_id_2) of a fixture
+Stage = Tuple[int, int, int]
+
+# (year_id, pool_id); a pool belongs to one category, so the standing
+# rows of a pool are those matching the key results are written under
+PoolKey = Tuple[int, int]
+
+
+def team_tally(scored: int, conceded: int) -> Dict[str, int]:
+    """What one match adds to a team's standing."""
+    won, drawn = scored > conceded, scored == conceded
+    return {
+        "match_played": 1,
+        "match_won": int(won),
+        "match_draw": int(drawn),
+        "match_lost": int(scored < conceded),
+        "goal_far": scored,
+        "goal_aginst": conceded,
+        "goal_diffrence": scored - conceded,
+        "points": WIN_POINTS * won + DRAW_POINTS * drawn,
+    }
+
+
+def _head_to_head(team_ids: Iterable[int], matches: Iterable[Match]) -> Dict[int, Tuple[int, int, int]]:
+    """Points, goal difference and goals scored in the matches among ``team_ids``."""
+    table = {team_id: [0, 0, 0] for team_id in team_ids}
+    for team_id_1, team_id_2, score_1, score_2 in matches:
+        if team_id_1 not in table or team_id_2 not in table or score_1 is None or score_2 is None:
+            continue
+        for team_id, scored, conceded in ((team_id_1, score_1, score_2),
+                                          (team_id_2, score_2, score_1)):
+            tally = team_tally(scored, conceded)
+            row = table[team_id]
+            row[0] += tally["points"]
+            row[1] += tally["goal_diffrence"]
+            row[2] += tally["goal_far"]
+    return {team_id: tuple(row) for team_id, row in table.items()}
+
+
+def _break_tie(level: List[int], tallies: Mapping[int, Mapping[str, int]],
+               matches: Sequence[Match]) -> List[int]:
+    mini = _head_to_head(level, matches)
+    key = lambda team_id: tuple(-value for value in mini[team_id])
+    ordered = []
+    for _, group in groupby(sorted(level, key=key), key=key):
+        group = list(group)
+        if len(group) == 1:
+            ordered += group
+        elif len(group) < len(level):
+            ordered += _break_tie(group, tallies, matches)
+        else:
+            ordered += sorted(group, key=lambda t: (-(tallies[t]["match_won"] or 0), t))
+    return ordered
+
+
+def rank(tallies: Mapping[int, Mapping[str, int]], matches: Sequence[Match]) -> List[int]:
+    """
+    Order a pool's teams, best first.
+
+    Args:
+        tallies: Standing columns (points, goal_diffrence, goal_far,
+            match_won) by team id
+        matches: The pool's fixtures with their scores, for head-to-head
+
+    Returns:
+        Team ids in rank order
+    """
+    def key(team_id):
+        tally = tallies[team_id]
+        return (-(tally["points"] or 0), -(tally["goal_diffrence"] or 0),
+                -(tally["goal_far"] or 0))
+
+    ordered = []
+    for _, group in groupby(sorted(tallies, key=key), key=key):
+        group = list(group)
+        ordered += group if len(group) == 1 else _break_tie(group, tallies, matches)
+    return ordered
+
+
+def pool_complete(matches: Sequence[Match]) -> bool:
+    """Whether every fixture of the pool has been played."""
+    return bool(matches) and all(
+        score_1 is not None and score_2 is not None for _, _, score_1, score_2 in matches)
+
+
+def in_pool(stage: Stage, pool_id: int) -> bool:
+    """
+    Whether a fixture of ``stage`` is played in pool ``pool_id``: a pool
+    stage fixture whose ``pool_id_1`` and ``pool_id_2`` are unset (0) or
+    that pool. A knockout rematch of two teams of a pool is not a pool
+    match.
+    """
+    pool_type, pool_id_1, pool_id_2 = stage
+    return pool_type == POOL_STAGE and pool_id_1 in (0, pool_id) and pool_id_2 in (0, pool_id)
+
+
+def pool_matches(pool_id: int, team_ids: Iterable[int],
+                 fixtures: Iterable[Tuple[Stage, Match]]) -> List[Match]:
+    """The matches of pool ``pool_id`` in ``fixtures``, played between two of ``team_ids``."""
+    teams = set(team_ids)
+    return [match for stage, match in fixtures
+            if in_pool(stage, pool_id) and match[0] in teams and match[1] in teams]
+
+
+async def rank_standings(db: AsyncSession, year_ids: Sequence[int],
+                         pool_id: int = None, keep_hand_set_winners: bool = True) -> int:
+    """
+    Recompute ``position`` and ``status_pool_winner`` for every pool of
+    ``year_ids`` (or only ``pool_id``, with a single year). The winner
+    flag is set once all of the pool's fixtures have been played. With
+    ``keep_hand_set_winners``, a pool without any scored fixture (a table
+    kept by hand) keeps its flags. Pending changes in the session are
+    flushed first so they count; nothing is committed here.
+
+    Returns:
+        Number of standing rows whose rank changed
+    """
+    await db.flush()
+    columns = (Standing.id, Standing.year_id, Standing.pool_id, Standing.team_id,
+               Standing.points, Standing.goal_diffrence, Standing.goal_far,
+               Standing.match_won, Standing.position, Standing.status_pool_winner)
+    # Locking read: under REPEATABLE READ a plain select could rank from a
+    # snapshot missing another result committed to the same pool meanwhile
+    query = select(*columns).filter(Standing.year_id.in_(year_ids)).with_for_update()
+    members = select(PoolDetails.year_id, PoolDetails.pool_id, PoolDetails.team_id)\
+        .filter(PoolDetails.year_id.in_(year_ids), PoolDetails.status == 1)
+    if pool_id is not None:
+        query = query.filter(Standing.pool_id == pool_id)
+        members = members.filter(PoolDetails.pool_id == pool_id)
+    pools = defaultdict(dict)
+    for row in (await db.execute(query)).mappings():
+        pools[(row["year_id"], row["pool_id"])][row["team_id"]] = row
+    if not pools:
+        return 0
+
+    # Teams without a standing row yet still have fixtures to play
+    teams = defaultdict(set)
+    for year_id, member_pool_id, team_id in await db.execute(members):
+        teams[(year_id, member_pool_id)].add(team_id)
+    for key, rows in pools.items():
+        teams[key].update(rows)
+
+    query = select(Fixture.year_id, Fixture.pool_type, Fixture.pool_id_1, Fixture.pool_id_2,
+                   Fixture.team_id_1, Fixture.team_id_2,
+                   MatchResult.team1_score, MatchResult.team2_score)\
+        .outerjoin(MatchResult, MatchResult.fixture_id == Fixture.id)\
+        .filter(Fixture.year_id.in_(year_ids), Fixture.pool_type == POOL_STAGE)
+    if pool_id is not None:
+        team_ids = [team_id for key in pools for team_id in teams[key]]
+        query = query.filter(Fixture.team_id_1.in_(team_ids), Fixture.team_id_2.in_(team_ids))
+    fixtures = defaultdict(list)
+    for year_id, *row in await db.execute(query):
+        fixtures[year_id].append((tuple(row[:3]), tuple(row[3:])))
+
+    changes = []
+    for key, rows in pools.items():
+        played = pool_matches(key[1], teams[key], fixtures[key[0]])
+        complete = pool_complete(played)
+        # Years kept by hand have no scored fixtures
+        hand_kept = keep_hand_set_winners and not any(
+            score_1 is not None and score_2 is not None for _, _, score_1, score_2 in played)
+        for position, team_id in enumerate(rank(rows, played), start=1):
+            row = rows[team_id]
+            winner = bool(row["status_pool_winner"]) if hand_kept else complete and position == 1
+            if row["position"] != position or bool(row["status_pool_winner"]) != winner:
+                changes.append({"id": row["id"], "position": position,
+                                "status_pool_winner": winner})
+    if changes:
+        await db.execute(update(Standing), changes)
+    return len(changes)
+
+
+async def rerank(db: AsyncSession, *pools: Optional[PoolKey]) -> None:
+    """
+    Re-rank the pools a result write touched; None entries are skipped.
+    Their winner flags follow the results even once none is left.
+    """
+    for year_id, pool_id in dict.fromkeys(key for key in pools if key is not None):
+        await rank_standings(db, [year_id], pool_id, keep_hand_set_winners=False)
+
+
+async def _rank(year_ids: Optional[List[int]]) -> None:
+    from app.core.database import AsyncSessionLocal
+    from app.core.invalidation import publish
+
+    async with AsyncSessionLocal() as db:
+        if year_ids is None:
+            year_ids = (await db.execute(select(Standing.year_id).distinct())).scalars().all()
+        changed = await rank_standings(db, year_ids)
+        await db.commit()
+    print(f"{len(year_ids)} years ranked, {changed} standings changed")
+    await publish("standing")
+
+
+def main(argv: List[str]) -> int:
+    if not argv:
+        print("usage: python -m app.services.ranking --all | YEAR_ID [YEAR_ID ...]")
+        return 2
+    asyncio.run(_rank(None if argv == ["--all"] else [int(year_id) for year_id in argv]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,258 @@
+"""
+Standings engine: keeps ``hockey_standing_master`` in step with results.
+
+Only pool matches count: a result updates the standings when its fixture
+is in the pool stage and both its teams belong to the same pool that year
+(``hockey_pool_details``); knockout rounds never do.
+Result writes apply their delta to the two affected rows with atomic
+upserts in the writer's transaction, so the table is current as soon as
+the result is committed; the writer then re-ranks the pools it touched
+(see ``app.services.ranking``). ``rebuild_year`` recomputes and ranks a
+year from its fixtures and results in one pass, for backfills and after
+hand edits; ``rebuild_pool`` does the same for one pool whose teams
+changed::
+
+    python -m app.services.standings 12 13
+"""
+import asyncio
+import sys
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.upsert import upsert_increment
+from app.models.additional import PoolDetails
+from app.models.news import Standing
+from app.models.tournament import Fixture, MatchResult
+from app.services.ranking import (
+    POOL_STAGE, Match, PoolKey, Stage, in_pool, pool_complete, pool_matches, rank, team_tally
+)
+
+# Standing columns a result adds to
+TALLY_COLUMNS = ("match_played", "match_won", "match_draw", "match_lost",
+                 "goal_far", "goal_aginst", "goal_diffrence", "points")
+
+# (pool_id, pool_category_type)
+Pool = Tuple[int, int]
+
+
+def fixture_stage(fixture: Fixture) -> Stage:
+    """The columns telling which stage of the competition a fixture is in."""
+    return fixture.pool_type, fixture.pool_id_1, fixture.pool_id_2
+
+
+def match_pool(pools: Dict[int, Pool], stage: Stage,
+               team_id_1: int, team_id_2: int) -> Optional[Pool]:
+    """The pool a match is played in, or None outside the pool stage."""
+    pool = pools.get(team_id_1)
+    if pool is None or pools.get(team_id_2) != pool or not in_pool(stage, pool[0]):
+        return None
+    return pool
+
+
+def match_tallies(
+    pools: Dict[int, Pool],
+    stage: Stage,
+    team_id_1: int,
+    team_id_2: int,
+    score_1: Optional[int],
+    score_2: Optional[int]
+) -> Iterator[Tuple[int, Pool, Dict[str, int]]]:
+    """
+    ``(team_id, pool, tally)`` for both teams of a pool match; nothing for
+    a match without a score or outside the pool stage.
+    """
+    pool = match_pool(pools, stage, team_id_1, team_id_2)
+    if score_1 is None or score_2 is None or pool is None:
+        return
+    yield team_id_1, pool, team_tally(score_1, score_2)
+    yield team_id_2, pool, team_tally(score_2, score_1)
+
+
+async def team_pools(db: AsyncSession, year_id: int,
+                     team_ids: Sequence[int] = None) -> Dict[int, Pool]:
+    """Pool of each team (optionally only ``team_ids``) in a year."""
+    query = select(PoolDetails.team_id, PoolDetails.pool_id, PoolDetails.pool_category_type)\
+        .filter(PoolDetails.year_id == year_id, PoolDetails.status == 1)
+    if team_ids is not None:
+        query = query.filter(PoolDetails.team_id.in_(team_ids))
+    rows = await db.execute(query.order_by(PoolDetails.id))
+    return {team_id: (pool_id, category) for team_id, pool_id, category in rows}
+
+
+async def _add(db: AsyncSession, year_id: int, pool: Pool, team_id: int,
+               tally: Dict[str, int]) -> None:
+    """Increment a team's row in place, creating it on the team's first result."""
+    pool_id, category = pool
+    await upsert_increment(
+        db, Standing, ("year_id", "pool_id", "team_id"),
+        {"year_id": year_id, "pool_id": pool_id, "pool_category_type": category,
+         "team_id": team_id, "status_pool_winner": False},
+        tally)
+
+
+async def apply_result(db: AsyncSession, result: MatchResult, sign: int = 1) -> Optional[PoolKey]:
+    """
+    Add ``result`` to the standings, or take it back out with ``sign=-1``.
+
+    Call it in the transaction that writes the result: an update reverts
+    the old scores before changing them and applies the new ones after;
+    a delete only reverts. Then pass the returned pools to
+    ``ranking.rerank``. Nothing is committed here.
+
+    Args:
+        db: Session of the writing transaction
+        result: Match result; ignored until both scores are set
+        sign: 1 to apply, -1 to revert
+
+    Returns:
+        The pool whose standings changed, or None if the result does not
+        count towards a pool
+    """
+    if result.team1_score is None or result.team2_score is None:
+        return None
+    fixture = await db.get(Fixture, result.fixture_id)
+    if fixture is None:
+        return None
+
+    pools = await team_pools(db, fixture.year_id, (fixture.team_id_1, fixture.team_id_2))
+    tallies = list(match_tallies(pools, fixture_stage(fixture),
+                                 fixture.team_id_1, fixture.team_id_2,
+                                 result.team1_score, result.team2_score))
+    for team_id, pool, tally in tallies:
+        await _add(db, fixture.year_id, pool, team_id,
+                   {key: sign * value for key, value in tally.items()})
+    return (fixture.year_id, tallies[0][1][0]) if tallies else None
+
+
+async def revert_result(db: AsyncSession, result: MatchResult) -> Optional[PoolKey]:
+    """Take ``result`` out of the standings (see ``apply_result``)."""
+    return await apply_result(db, result, sign=-1)
+
+
+async def fixture_pool(db: AsyncSession, fixture: Fixture) -> Optional[PoolKey]:
+    """
+    The pool a fixture is played in, or None outside the pool stage.
+    Adding, moving or removing a fixture changes whether its pool is
+    complete, so pass this to ``ranking.rerank`` even without results.
+    """
+    pools = await team_pools(db, fixture.year_id, (fixture.team_id_1, fixture.team_id_2))
+    pool = match_pool(pools, fixture_stage(fixture), fixture.team_id_1, fixture.team_id_2)
+    return None if pool is None else (fixture.year_id, pool[0])
+
+
+async def fixture_results(db: AsyncSession, fixture_id: int) -> List[MatchResult]:
+    """Results recorded for a fixture, to revert and reapply when it changes."""
+    rows = await db.execute(select(MatchResult).filter(MatchResult.fixture_id == fixture_id))
+    return list(rows.scalars().all())
+
+
+async def _year_fixtures(db: AsyncSession, year_id: int) -> List[Tuple[Stage, Match]]:
+    """Every pool stage fixture of a year with its result, in one query."""
+    rows = await db.execute(
+        select(Fixture.pool_type, Fixture.pool_id_1, Fixture.pool_id_2,
+               Fixture.team_id_1, Fixture.team_id_2,
+               MatchResult.team1_score, MatchResult.team2_score)
+        .outerjoin(MatchResult, MatchResult.fixture_id == Fixture.id)
+        .filter(Fixture.year_id == year_id, Fixture.pool_type == POOL_STAGE))
+    return [(tuple(row[:3]), tuple(row[3:])) for row in rows]
+
+
+def _pool_rows(year_id: int, pool: Pool, team_ids: Sequence[int],
+               fixtures: Sequence[Tuple[Stage, Match]]) -> List[Dict[str, int]]:
+    """Ranked standing rows of a pool, one for every team whether it has played or not."""
+    members = dict.fromkeys(team_ids, pool)
+    standings = {team_id: dict.fromkeys(TALLY_COLUMNS, 0) for team_id in members}
+    for stage, match in fixtures:
+        for team_id, _, tally in match_tallies(members, stage, *match):
+            for key, value in tally.items():
+                standings[team_id][key] += value
+
+    played = pool_matches(pool[0], members, fixtures)
+    complete = pool_complete(played)
+    pool_id, category = pool
+    return [{"year_id": year_id, "pool_id": pool_id, "pool_category_type": category,
+             "team_id": team_id, **standings[team_id], "position": position,
+             "status_pool_winner": complete and position == 1}
+            for position, team_id in enumerate(rank(standings, played), start=1)]
+
+
+async def rebuild_year(db: AsyncSession, year_id: int) -> int:
+    """
+    Recompute and rank a year's standings from its fixtures and results.
+
+    One query reads the pools and one every fixture of the year with its
+    result; the year's rows are then replaced, with a row for every pool
+    team whether it has played or not. Nothing is committed here.
+
+    Returns:
+        Number of standing rows written
+    """
+    by_pool = defaultdict(list)
+    for team_id, pool in (await team_pools(db, year_id)).items():
+        by_pool[pool].append(team_id)
+    fixtures = await _year_fixtures(db, year_id)
+    rows = [row for pool, team_ids in by_pool.items()
+            for row in _pool_rows(year_id, pool, team_ids, fixtures)]
+
+    await db.execute(delete(Standing).where(Standing.year_id == year_id))
+    if rows:
+        await db.execute(insert(Standing), rows)
+    return len(rows)
+
+
+async def rebuild_pool(db: AsyncSession, year_id: int, pool_id: int,
+                       former_team_ids: Sequence[int] = ()) -> Optional[int]:
+    """
+    Recompute and rank one pool's standings after its teams changed.
+
+    Only a pool whose results drive its table is rebuilt: one with a
+    scored fixture between two of its teams, current or
+    ``former_team_ids``. A table kept by hand has no results to rebuild
+    it from, so its rows, tallies and winner flag are left alone, as are
+    every other pool's. Nothing is committed here.
+
+    Returns:
+        Number of standing rows written, or None if the pool was left alone
+    """
+    pools = await team_pools(db, year_id)
+    team_ids = [team_id for team_id, pool in pools.items() if pool[0] == pool_id]
+    fixtures = await _year_fixtures(db, year_id)
+    involved = pool_matches(pool_id, [*team_ids, *former_team_ids], fixtures)
+    if not any(score_1 is not None and score_2 is not None
+               for _, _, score_1, score_2 in involved):
+        return None
+
+    rows = _pool_rows(year_id, pools[team_ids[0]] if team_ids else (pool_id, None),
+                      team_ids, fixtures)
+    await db.execute(delete(Standing).where(Standing.year_id == year_id,
+                                            Standing.pool_id == pool_id))
+    if rows:
+        await db.execute(insert(Standing), rows)
+    return len(rows)
+
+
+async def _rebuild(year_ids: List[int]) -> None:
+    from app.core.database import AsyncSessionLocal
+    from app.core.invalidation import publish
+
+    async with AsyncSessionLocal() as db:
+        for year_id in year_ids:
+            rows = await rebuild_year(db, year_id)
+            print(f"year {year_id}: {rows} standings")
+        await db.commit()
+    await publish("standing")
+
+
+def main(argv: List[str]) -> int:
+    if not argv:
+        print("usage: python -m app.services.standings YEAR_ID [YEAR_ID ...]")
+        return 2
+    asyncio.run(_rebuild([int(year_id) for year_id in argv]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,7 +1,8 @@
-from app.core import get_db, get_password_hash
+from app.core import get_password_hash
+from app.core.database import SessionLocal
 from app.models.user import User, UserProfile
 
-db = next(get_db())
+db = SessionLocal()
 
 # Check if admin exists
 existing = db.query(User).filter(User.username == 'admin').first()
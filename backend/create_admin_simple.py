@@ -1,6 +1,6 @@
 import bcrypt
 from datetime import datetime
-from app.core.database import get_db
+from app.core.database import SessionLocal
 from app.models.user import User, UserProfile
 
 # Hash password directly with bcrypt
@@ -8,7 +8,7 @@ password = "admin123"
 hashed = bcrypt.hashpw(password.encode(
     'utf-8'), bcrypt.gensalt()).decode('utf-8')
 
-db = next(get_db())
+db = SessionLocal()
 
 # Check if admin exists
 existing = db.query(User).filter(User.username == 'admin').first()
@@ -0,0 +1,69 @@
+"""Composite indexes for hot query shapes
+
+The tables predate these migrations, so each index is only created when the
+table exists and has no index on the same leading columns yet; downgrade
+drops only indexes with the names used here.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns); names match the models' declarations
+INDEXES = [
+    ("ix_news_status_created", "hockey_news_master", ["status", "date_created", "id"]),
+    ("ix_hockey_news_images_news_id", "hockey_news_images", ["news_id"]),
+    ("ix_gallery_status_parent_created", "hockey_gallery",
+     ["status", "parent_image", "date_created", "id"]),
+    ("ix_ticker_status_created", "hockey_ticker_master", ["status", "date_created"]),
+    ("ix_fixture_year_date", "hockey_fixture_master", ["year_id", "date_match"]),
+    ("ix_hockey_match_results_fixture_id", "hockey_match_results", ["fixture_id"]),
+    ("ix_standing_year_pool_points", "hockey_standing_master", ["year_id", "pool_id", "points"]),
+    ("ix_honour_year", "hockey_honour", ["year", "id"]),
+    ("ix_identity_status_name", "hockey_identity_master", ["status", "name", "id"]),
+    ("ix_match_details_match_player", "hockey_fixture_match_details",
+     ["match_id", "player_id", "id"]),
+    ("ix_team_player_details_match_time", "hockey_team_player_details",
+     ["match_id", "time", "id"]),
+]
+
+
+def _existing_indexes(table: str):
+    """Indexes on ``table``, or None if it does not exist."""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    return inspector.get_indexes(table)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        if not context.is_offline_mode():
+            existing = _existing_indexes(table)
+            if existing is None:
+                continue
+            if any(index["name"] == name or index["column_names"][:len(columns)] == columns
+                   for index in existing):
+                continue
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, columns in reversed(INDEXES):
+        if not context.is_offline_mode():
+            existing = _existing_indexes(table)
+            if not existing or all(index["name"] != name for index in existing):
+                continue
+        op.drop_index(name, table_name=table)
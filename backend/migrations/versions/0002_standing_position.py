@@ -0,0 +1,42 @@
+"""Rank position on standings
+
+Adds hockey_standing_master.position, written by the ranking together with
+status_pool_winner. Skipped when the table is missing or already has it.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "hockey_standing_master"
+COLUMN = "position"
+
+
+def _has_column() -> Union[bool, None]:
+    """Whether the table has the column, or None if the table does not exist."""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(TABLE):
+        return None
+    return any(column["name"] == COLUMN for column in inspector.get_columns(TABLE))
+
+
+def upgrade() -> None:
+    if context.is_offline_mode() or _has_column() is False:
+        op.add_column(TABLE, sa.Column(COLUMN, sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    if context.is_offline_mode() or _has_column():
+        op.drop_column(TABLE, COLUMN)
@@ -0,0 +1,58 @@
+"""Per-year player statistics for the leaderboards
+
+Creates hockey_player_year_stats, the totals of hockey_fixture_match_details
+per year, team and player, kept up to date by app.services.leaderboards.
+Skipped when the table already exists; fill it afterwards with
+``python -m app.services.leaderboards --all``.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 15:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "hockey_player_year_stats"
+
+# (index, columns, unique); names match the model's declarations
+INDEXES = [
+    ("ix_player_year_stats_key", ["year_id", "team_id", "player_id"], True),
+    ("ix_player_year_stats_goals", ["year_id", "goals"], False),
+    ("ix_player_year_stats_cards", ["year_id", "red_card", "yellow_card", "green_card"], False),
+]
+
+
+def _has_table() -> bool:
+    return sa.inspect(op.get_bind()).has_table(TABLE)
+
+
+def upgrade() -> None:
+    if not context.is_offline_mode() and _has_table():
+        return
+    op.create_table(
+        TABLE,
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("year_id", sa.Integer(), nullable=False),
+        sa.Column("team_id", sa.Integer(), nullable=False),
+        sa.Column("player_id", sa.Integer(), nullable=False),
+        *(sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+          for name in ("matches_played", "goals", "green_card", "yellow_card", "red_card")),
+    )
+    op.create_index(f"ix_{TABLE}_id", TABLE, ["id"])
+    for name, columns, unique in INDEXES:
+        op.create_index(name, TABLE, columns, unique=unique)
+
+
+def downgrade() -> None:
+    if context.is_offline_mode() or _has_table():
+        op.drop_table(TABLE)
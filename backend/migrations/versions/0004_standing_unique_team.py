@@ -0,0 +1,64 @@
+"""Unique standing row per year, pool and team
+
+Result writes upsert hockey_standing_master rows on (year_id, pool_id,
+team_id); without a unique index two concurrent first results for a team
+could insert two rows. Skipped when the table is missing or already has a
+unique index on those columns. Fails, listing them, when duplicate rows
+exist: merge them, or rebuild those years with
+``python -m app.services.standings YEAR_ID``, and upgrade again.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "hockey_standing_master"
+INDEX = "ix_standing_year_pool_team"
+COLUMNS = ["year_id", "pool_id", "team_id"]
+
+
+def _existing_indexes():
+    """Indexes on the table, or None if it does not exist."""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(TABLE):
+        return None
+    return inspector.get_indexes(TABLE)
+
+
+def upgrade() -> None:
+    if not context.is_offline_mode():
+        existing = _existing_indexes()
+        if existing is None or any(
+                index["name"] == INDEX or (index["unique"] and index["column_names"] == COLUMNS)
+                for index in existing):
+            return
+        duplicates = op.get_bind().execute(sa.text(
+            f"SELECT {', '.join(COLUMNS)}, COUNT(*) FROM {TABLE} "
+            f"GROUP BY {', '.join(COLUMNS)} HAVING COUNT(*) > 1"
+        )).all()
+        if duplicates:
+            listed = ", ".join(
+                f"year {year_id} pool {pool_id} team {team_id} ({count} rows)"
+                for year_id, pool_id, team_id, count in duplicates)
+            raise RuntimeError(f"Duplicate standing rows, resolve them first: {listed}")
+    op.create_index(INDEX, TABLE, COLUMNS, unique=True)
+
+
+def downgrade() -> None:
+    if not context.is_offline_mode():
+        existing = _existing_indexes()
+        if not existing or all(index["name"] != INDEX for index in existing):
+            return
+    op.drop_index(INDEX, table_name=TABLE)
@@ -0,0 +1,95 @@
+"""Tests for the in-process response cache."""
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, select
+
+from app.core.cache import cache_key, count_query
+from app.models.additional import Ticker
+from app.core.cache_backends import ResponseCache
+
+
+def make_cache(**overrides):
+    options = dict(max_entries=3, max_bytes=1024, stale_seconds=60, replica_lag=0)
+    options.update(overrides)
+    return ResponseCache(**options)
+
+
+def test_hit_miss_and_ttl_expiry():
+    cache = make_cache()
+    cache.set("/news?", "news", b"[1]", ttl=0.05)
+
+    assert cache.get("/news?") == b"[1]"
+    time.sleep(0.06)
+    assert cache.get("/news?") is None
+    # Still available to the load shedder inside the stale window
+    assert cache.get_stale("/news?") == b"[1]"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = make_cache()
+    for key in ("a", "b", "c"):
+        cache.set(key, "news", b"x", ttl=60)
+    cache.get("a")
+    cache.set("d", "news", b"x", ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"x"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_byte_budget_is_enforced():
+    cache = make_cache(max_bytes=10)
+    cache.set("a", "news", b"123456", ttl=60)
+    cache.set("b", "news", b"123456", ttl=60)
+
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 6
+
+
+def test_invalidate_drops_only_that_namespace():
+    cache = make_cache()
+    cache.set("/news?", "news", b"n", ttl=60)
+    cache.set("/sponsors?", "sponsors", b"s", ttl=60)
+    cache.invalidate("news")
+
+    assert cache.get("/news?") is None
+    assert cache.get_stale("/news?") is None
+    assert cache.get("/sponsors?") == b"s"
+
+
+def test_load_racing_a_write_is_not_stored():
+    cache = make_cache()
+    generation = cache.generation("news")
+    cache.invalidate("news")
+    cache.set("/news?", "news", b"old", ttl=60, generation=generation)
+
+    assert cache.get("/news?") is None
+
+
+def test_cache_key_ignores_query_parameter_order():
+    assert cache_key("/news", "limit=5&skip=0") == cache_key("/news", "skip=0&limit=5")
+
+
+def test_not_found_entries_keep_their_status():
+    cache = make_cache()
+    cache.set("/timer?", "timer", b'{"detail":"No timer found"}', ttl=30, status=404)
+
+    assert cache.lookup("/timer?").status == 404
+    cache.invalidate("timer")
+    assert cache.lookup("/timer?") is None
+
+
+def test_count_query_counts_all_matching_rows():
+    engine = create_engine("sqlite://")
+    Ticker.__table__.create(engine)
+    with engine.begin() as connection:
+        connection.execute(Ticker.__table__.insert(), [
+            {"title": str(i), "date_created": datetime(2026, 1, 1), "status": i % 2 == 0}
+            for i in range(5)])
+        active = select(Ticker).filter(Ticker.status == True).order_by(Ticker.title)
+        total = connection.execute(count_query(active)).scalar_one()
+
+    assert total == 3
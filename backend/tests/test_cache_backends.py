@@ -0,0 +1,76 @@
+"""Tests for the shared Redis cache backend, run against fakeredis."""
+import asyncio
+
+import fakeredis
+
+from app.core.cache_backends import RedisCacheBackend
+
+
+def make_backend(client, **overrides):
+    options = dict(url="redis://unused", prefix="test", max_bytes=1024,
+                   stale_seconds=60, replica_lag=0, client=client)
+    options.update(overrides)
+    return RedisCacheBackend(**options)
+
+
+def test_entries_round_trip_with_validators():
+    async def run():
+        backend = make_backend(fakeredis.FakeAsyncRedis())
+        generation = await backend.generation("news")
+        await backend.store("/news?", "news", b'[{"id":1}]', 60, generation,
+                            '"etag"', "Thu, 01 Jan 2026 00:00:00 GMT")
+        await backend.store("/timer?", "timer", b"{}", 30, await backend.generation("timer"),
+                            status=404)
+        return await backend.lookup("/news?"), await backend.lookup("/timer?")
+
+    entry, not_found = asyncio.run(run())
+    assert entry.status == 200
+    assert not_found.status == 404
+    assert entry.body == b'[{"id":1}]'
+    assert entry.etag == '"etag"'
+    assert entry.last_modified == "Thu, 01 Jan 2026 00:00:00 GMT"
+
+
+def test_invalidation_is_visible_to_every_worker():
+    async def run():
+        server = fakeredis.FakeServer()
+        worker_a = make_backend(fakeredis.FakeAsyncRedis(server=server))
+        worker_b = make_backend(fakeredis.FakeAsyncRedis(server=server))
+        await worker_a.store("/news?", "news", b"[]", 60, await worker_a.generation("news"))
+        shared = await worker_b.lookup("/news?")
+        await worker_b.invalidate("news")
+        return shared, await worker_a.lookup("/news?"), await worker_a.lookup_stale("/news?")
+
+    shared, after, stale = asyncio.run(run())
+    assert shared.body == b"[]"
+    assert after is None
+    assert stale is None
+
+
+def test_load_racing_a_write_is_never_served():
+    async def run():
+        backend = make_backend(fakeredis.FakeAsyncRedis())
+        generation = await backend.generation("fixtures")
+        await backend.invalidate("fixtures")
+        await backend.store("/fixtures?", "fixtures", b"old", 60, generation)
+        return await backend.lookup("/fixtures?")
+
+    assert asyncio.run(run()) is None
+
+
+def test_redis_outage_degrades_to_a_miss():
+    class BrokenRedis:
+        async def get(self, key):
+            raise ConnectionError("down")
+
+        async def set(self, *args, **kwargs):
+            raise ConnectionError("down")
+
+    async def run():
+        backend = make_backend(BrokenRedis())
+        await backend.store("/news?", "news", b"[]", 60, await backend.generation("news"))
+        return await backend.lookup("/news?"), backend.stats()["errors"]
+
+    entry, errors = asyncio.run(run())
+    assert entry is None
+    assert errors == 2
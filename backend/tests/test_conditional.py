@@ -0,0 +1,47 @@
+"""Tests for ETag / Last-Modified evaluation."""
+from datetime import datetime
+
+from starlette.requests import Request
+
+from app.core.conditional import http_date, latest, make_etag, not_modified
+
+
+def request_with(**headers):
+    raw = [(k.replace("_", "-").lower().encode(), v.encode()) for k, v in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_etag_is_stable_and_content_derived():
+    assert make_etag(b"[1]") == make_etag(b"[1]")
+    assert make_etag(b"[1]") != make_etag(b"[2]")
+
+
+def test_if_none_match_accepts_lists_weak_tags_and_star():
+    etag = make_etag(b"body")
+    assert not_modified(request_with(if_none_match=f'"other", W/{etag}'), etag, None)
+    assert not_modified(request_with(if_none_match="*"), etag, None)
+    assert not not_modified(request_with(if_none_match='"other"'), etag, None)
+
+
+def test_if_modified_since_is_ignored_when_if_none_match_is_sent():
+    modified = http_date(datetime(2026, 1, 1, 12, 0, 0))
+    assert not_modified(request_with(if_modified_since=modified), '"a"', modified)
+    assert not not_modified(
+        request_with(if_none_match='"b"', if_modified_since=modified), '"a"', modified)
+
+
+def test_if_modified_since_compares_at_second_precision():
+    modified = http_date(datetime(2026, 1, 1, 12, 0, 0, 900000))
+    earlier = http_date(datetime(2026, 1, 1, 11, 59, 59))
+    assert not_modified(request_with(if_modified_since=modified), '"a"', modified)
+    assert not not_modified(request_with(if_modified_since=earlier), '"a"', modified)
+    assert not not_modified(request_with(if_modified_since="garbage"), '"a"', modified)
+
+
+def test_latest_skips_invalid_dates():
+    items = [
+        {"date_updated": "0000-00-00 00:00:00", "date_created": datetime(2026, 1, 1)},
+        {"date_updated": datetime(2026, 2, 1), "date_created": None},
+    ]
+    assert latest(items, "date_updated", "date_created") == datetime(2026, 2, 1)
+    assert latest(None, "date_updated") is None
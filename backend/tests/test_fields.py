@@ -0,0 +1,34 @@
+"""Tests for ?fields= sparse fieldsets."""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.core.fields import column_options, parse_fields, sparse_schema
+from app.models.news import Sponsor
+from app.schemas.news import NewsResponse, SponsorResponse
+
+
+def test_unknown_field_is_rejected_and_id_always_returned():
+    assert parse_fields(None, NewsResponse) is None
+    assert parse_fields("title, ", NewsResponse) == {"id", "title"}
+    with pytest.raises(HTTPException) as error:
+        parse_fields("title,secret", NewsResponse)
+    assert error.value.status_code == 400
+
+
+def test_computed_field_reads_its_hidden_source():
+    selected = parse_fields("news_image_url", NewsResponse)
+    schema = sparse_schema(NewsResponse, selected)
+
+    data = schema.model_validate({"id": 1, "news_image": "a.jpg", "title": "t"}).model_dump()
+
+    assert data == {"id": 1, "news_image_url": "/uploads/news/a.jpg"}
+
+
+def test_only_needed_columns_are_loaded():
+    selected = parse_fields("sponser_image_url", SponsorResponse)
+
+    sql = str(select(Sponsor).options(*column_options(Sponsor, SponsorResponse, selected)))
+
+    assert "sponser_image" in sql
+    assert "detail" not in sql
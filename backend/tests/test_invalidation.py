@@ -0,0 +1,78 @@
+"""Tests for the cross-worker invalidation bus."""
+import asyncio
+
+import fakeredis
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.invalidation import (
+    DatabaseTransport, InvalidationBus, LocalTransport, RedisTransport
+)
+
+
+def recording_bus(transport):
+    bus = InvalidationBus(transport)
+    seen = []
+
+    async def subscriber(entities, remote):
+        seen.append((set(entities), remote))
+
+    bus.subscribe(subscriber)
+    return bus, seen
+
+
+def test_publish_applies_locally_first():
+    bus, seen = recording_bus(LocalTransport())
+    asyncio.run(bus.publish("news", "team"))
+
+    assert seen == [({"news", "team"}, False)]
+    assert bus.stats()["published"] == 1
+
+
+def test_database_transport_delivers_other_workers_changes_once():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        worker_a, seen_a = recording_bus(DatabaseTransport(3600, sessions))
+        worker_b, seen_b = recording_bus(DatabaseTransport(3600, sessions))
+        await worker_a.start()
+        await worker_b.start()
+
+        await worker_a.publish("result")
+        await worker_a.transport.poll_once(worker_a._receive)
+        await worker_b.transport.poll_once(worker_b._receive)
+        await worker_b.transport.poll_once(worker_b._receive)
+
+        await worker_a.stop()
+        await worker_b.stop()
+        await engine.dispose()
+        return seen_a, seen_b
+
+    seen_a, seen_b = asyncio.run(run())
+    assert seen_a == [({"result"}, False)]
+    assert seen_b == [({"result"}, True)]
+
+
+def test_redis_transport_broadcasts_to_other_workers_only():
+    async def run():
+        server = fakeredis.FakeServer()
+        worker_a, seen_a = recording_bus(
+            RedisTransport("redis://unused", "test", fakeredis.FakeAsyncRedis(server=server)))
+        worker_b, seen_b = recording_bus(
+            RedisTransport("redis://unused", "test", fakeredis.FakeAsyncRedis(server=server)))
+        await worker_a.start()
+        await worker_b.start()
+        await asyncio.sleep(0.05)
+
+        await worker_a.publish("fixture")
+        for _ in range(50):
+            if seen_b:
+                break
+            await asyncio.sleep(0.01)
+
+        await worker_a.stop()
+        await worker_b.stop()
+        return seen_a, seen_b
+
+    seen_a, seen_b = asyncio.run(run())
+    assert seen_a == [({"fixture"}, False)]
+    assert seen_b == [({"fixture"}, True)]
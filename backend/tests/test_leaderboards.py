@@ -0,0 +1,106 @@
+"""Tests for the leaderboard aggregate."""
+import pytest
+
+from app.models.additional import MatchScoringDetail, PlayerYearStats
+from app.models.team import TeamPlayer
+from app.services.leaderboards import apply_detail, rebuild, revert_detail
+
+YEAR = 7
+
+
+def detail(match_id, team_id, player_id, goals=0, green=0, yellow=0, red=0, year_id=YEAR):
+    return MatchScoringDetail(
+        year_id=year_id, match_id=match_id, match_type=1, team_id=team_id,
+        pool_category_type=1, player_id=player_id, green_card=green, yellow_card=yellow,
+        red_card=red, total_score=goals, fouled_point=0, status=3)
+
+
+@pytest.fixture
+def run(run_in_session):
+    return lambda scenario: run_in_session(
+        scenario, MatchScoringDetail, PlayerYearStats, TeamPlayer)
+
+
+@pytest.fixture
+def table(read_table):
+    # (year, team, player): (matches, goals, green, yellow, red)
+    return lambda session: read_table(
+        session, PlayerYearStats, ("year_id", "team_id", "player_id"),
+        ("matches_played", "goals", "green_card", "yellow_card", "red_card"))
+
+
+def test_statistics_writes_update_the_aggregate_incrementally(run, table):
+    async def scenario(session):
+        details = [detail(1, 1, 10, goals=2, yellow=1),
+                   detail(2, 1, 10, goals=1, red=1),
+                   detail(2, 2, 20, green=1)]
+        session.add_all(details)
+        for row in details:
+            await apply_detail(session, row)
+        after_create = await table(session)
+
+        await revert_detail(session, details[0])
+        details[0].total_score = 3
+        await apply_detail(session, details[0])
+        await revert_detail(session, details[2])
+        return after_create, await table(session)
+
+    after_create, after_update = run(scenario)
+
+    assert after_create == {(YEAR, 1, 10): (2, 3, 0, 1, 1), (YEAR, 2, 20): (1, 0, 1, 0, 0)}
+    assert after_update == {(YEAR, 1, 10): (2, 4, 0, 1, 1), (YEAR, 2, 20): (0, 0, 0, 0, 0)}
+
+
+def test_rebuild_matches_the_incremental_aggregate_and_spares_other_years(run, table):
+    async def scenario(session):
+        details = [detail(1, 1, 10, goals=2, yellow=1), detail(2, 1, 10, goals=1),
+                   detail(2, 2, 20, goals=1, red=1), detail(3, 2, 21, green=2)]
+        session.add_all(details)
+        for row in details:
+            await apply_detail(session, row)
+        session.add(PlayerYearStats(year_id=YEAR + 1, team_id=1, player_id=10, goals=5))
+        await session.flush()
+        incremental = await table(session)
+
+        rows = await rebuild(session, [YEAR])
+        return rows, incremental, await table(session)
+
+    rows, incremental, rebuilt = run(scenario)
+
+    assert rows == 3
+    assert rebuilt == incremental
+    assert rebuilt[(YEAR + 1, 1, 10)] == (0, 5, 0, 0, 0)
+
+
+def test_leaderboards_read_from_the_aggregate(run, monkeypatch):
+    from app.api.v1.leaderboards import load_leaderboards
+    from app.core.reference import reference_data
+
+    async def scenario(session):
+        session.add_all([
+            TeamPlayer(id=10, team_id=1, full_name="Scorer", jersey_no=9, status=True),
+            PlayerYearStats(year_id=YEAR, team_id=1, player_id=10, matches_played=3, goals=4,
+                            yellow_card=1),
+            PlayerYearStats(year_id=YEAR, team_id=1, player_id=11, matches_played=2, goals=4,
+                            red_card=1),
+            PlayerYearStats(year_id=YEAR, team_id=2, player_id=20, matches_played=3, goals=1),
+            PlayerYearStats(year_id=YEAR, team_id=2, player_id=21, matches_played=3),
+        ])
+        await session.flush()
+        return await load_leaderboards(session, YEAR, limit=2)
+
+    class Snapshot:
+        team_summaries = {}
+
+    async def current():
+        return Snapshot
+
+    # Teams come from the snapshot, which would load from the configured database
+    monkeypatch.setattr(reference_data, "current", current)
+    boards = run(scenario)
+
+    # Level on goals: fewer matches first
+    assert [(row["player_id"], row["goals"]) for row in boards["top_scorers"]] == [(11, 4), (10, 4)]
+    assert boards["top_scorers"][1]["player_name"] == "Scorer"
+    assert [row["player_id"] for row in boards["cards"]] == [11, 10]
+    assert [(row["team_id"], row["goals"]) for row in boards["team_goals"]] == [(1, 8), (2, 1)]
@@ -0,0 +1,122 @@
+"""Tests for per-route-group concurrency limits and load shedding."""
+import asyncio
+import json
+
+import pytest
+
+from app.core.cache import JSON_MEDIA_TYPE, stale_lookup
+from app.core.cache_backends import MemoryCacheBackend, ResponseCache
+from app.core.limits import ConcurrencyLimiter, ConcurrencyLimitMiddleware, RouteGroup
+
+
+def limiter(limit=2, queue_timeout=0.0):
+    return ConcurrencyLimiter([RouteGroup("news", "/api/v1/news", limit)],
+                              queue_timeout=queue_timeout, retry_after=7)
+
+
+@pytest.mark.parametrize("queue_timeout", [0.0, 0.01])
+def test_slots_are_granted_up_to_the_limit_then_shed(queue_timeout):
+    async def scenario():
+        limits = limiter(limit=4, queue_timeout=queue_timeout)
+        state = limits.match("GET", "/api/v1/news")
+        granted = [await limits.acquire(state) for _ in range(5)]
+        limits.release(state)
+        return granted, await limits.acquire(state)
+
+    granted, after_release = asyncio.run(scenario())
+
+    assert granted == [True] * 4 + [False]
+    assert after_release
+
+
+class Call:
+    """One request through the middleware, recording what it sends."""
+
+    def __init__(self, middleware, method="GET", path="/api/v1/news", query=b""):
+        self.scope = {"type": "http", "method": method, "path": path, "query_string": query}
+        self.middleware = middleware
+        self.messages = []
+
+    async def __call__(self):
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            self.messages.append(message)
+
+        await self.middleware(self.scope, receive, send)
+        return self
+
+    @property
+    def status(self):
+        return self.messages[0]["status"]
+
+    @property
+    def headers(self):
+        return dict(self.messages[0]["headers"])
+
+    @property
+    def body(self):
+        return self.messages[1]["body"]
+
+
+def blocking_app(release: asyncio.Event):
+    async def app(scope, receive, send):
+        await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"fresh"})
+    return app
+
+
+def run_while_full(middleware_factory, *calls):
+    """Run ``calls`` while the group's two slots are held by blocked requests."""
+    async def scenario():
+        release = asyncio.Event()
+        middleware = middleware_factory(blocking_app(release))
+        holders = [asyncio.create_task(Call(middleware)()) for _ in range(2)]
+        await asyncio.sleep(0)
+        shed = [await call(middleware)() for call in calls]
+        release.set()
+        held = await asyncio.gather(*holders)
+        return middleware, held, shed
+
+    return asyncio.run(scenario())
+
+
+def test_middleware_sheds_with_503_and_retry_after():
+    limits = limiter()
+    _, held, (shed,) = run_while_full(
+        lambda app: ConcurrencyLimitMiddleware(app, limits),
+        lambda middleware: Call(middleware))
+
+    assert [call.body for call in held] == [b"fresh", b"fresh"]
+    assert shed.status == 503
+    assert shed.headers[b"retry-after"] == b"7"
+    assert json.loads(shed.body)["detail"]
+    assert limits.stats()["news"]["shed"] == 1
+    assert limits.stats()["news"]["in_flight"] == 0
+
+
+def test_shed_reads_fall_back_to_a_stale_cached_response(monkeypatch):
+    from app.core import cache
+
+    backend = MemoryCacheBackend(ResponseCache(
+        max_entries=8, max_bytes=1024, stale_seconds=60, replica_lag=0))
+    asyncio.run(backend.store("/api/v1/news?page=1", "news", b"[1]", ttl=-1, generation=0))
+    monkeypatch.setattr(cache, "cache_backend", backend)
+    limits = limiter()
+
+    _, _, (stale, miss, write) = run_while_full(
+        lambda app: ConcurrencyLimitMiddleware(app, limits, stale_lookup=stale_lookup),
+        lambda middleware: Call(middleware, query=b"page=1"),
+        lambda middleware: Call(middleware, query=b"page=2"),
+        lambda middleware: Call(middleware, method="POST"))
+
+    assert stale.status == 200
+    assert stale.body == b"[1]"
+    assert stale.headers[b"x-cache"] == b"STALE"
+    assert stale.headers[b"content-type"] == JSON_MEDIA_TYPE.encode()
+    # Nothing cached for this page, and writes are never served stale
+    assert miss.status == 503
+    assert write.status == 503
+    assert limits.stats()["news"]["served_stale"] == 1
@@ -0,0 +1,60 @@
+"""Tests for keyset (cursor) pagination."""
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.pagination import Keyset, keyset_page, slice_page
+from app.models.content import Gallery
+from app.models.team import Team
+from app.schemas.team import TeamResponse
+
+GALLERY_ORDER = Keyset(desc(Gallery.date_created), desc(Gallery.id))
+
+
+def test_pages_walk_every_row_once_across_tied_sort_keys():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Gallery.__table__.create)
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        async with sessions() as session:
+            for i in range(7):
+                # Pairs of albums share a timestamp
+                session.add(Gallery(
+                    image_name="x.jpg", title=str(i), parent_image=0,
+                    date_created=datetime(2020, 1, 1 + i // 2), date_updated=datetime(2020, 1, 1),
+                    user_created_by=1, user_updated_by=1, status=True))
+            await session.commit()
+
+            pages, cursor = [], ""
+            while cursor is not None:
+                rows, cursor = await keyset_page(session, select(Gallery), GALLERY_ORDER, cursor, 3)
+                pages.append([row.id for row in rows])
+        await engine.dispose()
+        return pages
+
+    assert asyncio.run(run()) == [[7, 6, 5], [4, 3, 2], [1]]
+
+
+def test_in_memory_pages_resume_after_the_cursor_row():
+    teams = [TeamResponse(id=i, team_name=name, team_name_short="", team_type=1, status=True)
+             for i, name in [(3, "Alpha"), (1, "beta"), (2, "Gamma")]]
+    order = Keyset(Team.team_name, Team.id)
+
+    first, cursor = slice_page(teams, order, "", 2)
+    second, last = slice_page(teams, order, cursor, 2)
+
+    assert [t.id for t in first] == [3, 1]
+    assert [t.id for t in second] == [2]
+    assert last is None
+
+
+def test_malformed_cursor_is_rejected():
+    for cursor in ("not base64!", "WzFd", "eyJhIjoxfQ"):
+        with pytest.raises(HTTPException) as error:
+            GALLERY_ORDER.decode(cursor)
+        assert error.value.status_code == 400
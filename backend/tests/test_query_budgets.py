@@ -0,0 +1,174 @@
+"""
+SQL statement budgets per endpoint.
+
+Each endpoint in BUDGETS is requested against a seeded SQLite database
+with the cache bypassed (as for a client inside its read-your-writes
+window), so the count covers the full load path. A test fails when the
+endpoint runs more statements than its budget; the statement count and
+the time spent in SQL are recorded as test properties (see
+``--junitxml``). Seed several rows per table so an N+1 shows up as a
+count that grows with the data.
+"""
+import asyncio
+import time
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+import app.models  # noqa: F401
+from app.core.database import (
+    READ_PRIMARY_HEADER, AsyncSessionLocal, Base, ReplicaSessionLocal, read_primary_marker
+)
+from app.models.additional import (
+    Dedicated, Honour, IdentityMaster, MatchReport, MatchScoringDetail, PlayerYearStats,
+    PoolDetails, TeamPlayerScoringDetail
+)
+from app.models.content import Gallery
+from app.models.news import News, NewsImage, Official, Sponsor, Standing
+from app.models.team import Team, TeamPlayer
+from app.models.tournament import Fixture, MatchResult, Tournament
+
+# Statements per request on an uncached read
+BUDGETS = {
+    "/api/v1/news": 3,
+    "/api/v1/news?cursor=": 3,
+    "/api/v1/news?fields=title": 2,
+    "/api/v1/news/1": 2,
+    "/api/v1/sponsors": 2,
+    "/api/v1/officials": 2,
+    "/api/v1/content/gallery": 2,
+    "/api/v1/teams/": 0,
+    "/api/v1/tournaments/": 2,
+    "/api/v1/tournaments/1/fixtures?expand=teams": 1,
+    "/api/v1/tournaments/1/results?expand=teams": 1,
+    "/api/v1/standings/1?expand=teams": 1,
+    "/api/v1/additional/honours?expand=teams": 2,
+    "/api/v1/additional/identities": 2,
+    "/api/v1/additional/pools/1/teams?expand=teams": 1,
+    "/api/v1/additional/matches/1/scoring": 1,
+    "/api/v1/additional/matches/1/goals": 1,
+    "/api/v1/matches/1": 4,
+    "/api/v1/leaderboards/1": 3,
+}
+
+ROWS = 4
+
+_PLACEHOLDERS = {
+    bool: True, int: 1, float: 0.0, str: "x",
+    datetime: datetime(2026, 1, 1), date: date(2026, 1, 1),
+}
+
+
+def make(model, **values):
+    """A ``model`` row with placeholder values for required columns not given."""
+    for column in model.__table__.columns:
+        if (column.key in values or column.primary_key or column.nullable
+                or column.default is not None or column.server_default is not None):
+            continue
+        values[column.key] = _PLACEHOLDERS[column.type.python_type]
+    return model(**values)
+
+
+def seed(session: Session) -> None:
+    for i in range(1, ROWS + 1):
+        other = i % ROWS + 1
+        session.add_all([
+            make(Team, team_name=f"Team {i}", team_name_short=f"T{i}"),
+            make(TeamPlayer, team_id=i, full_name=f"Player {i}", jersey_no=i),
+            make(News, title=f"News {i}", date_created=datetime(2026, 1, i)),
+            make(NewsImage, news_id=i, news_image=f"{i}a.jpg"),
+            make(NewsImage, news_id=i, news_image=f"{i}b.jpg"),
+            make(Sponsor, sponser_name=f"Sponsor {i}"),
+            make(Official),
+            make(Gallery, parent_image=0),
+            make(Dedicated),
+            make(Tournament, event_title=f"Event {i}"),
+            make(IdentityMaster, name=f"Identity {i}"),
+            make(Honour, year=2020 + i, team_id_1=i, team_id_2=other),
+            make(Fixture, team_id_1=i, team_id_2=other, date_match=datetime(2026, 2, i)),
+            make(MatchResult, fixture_id=i, team1_score=i, team2_score=0, winner_team_id=i),
+            make(Standing, year_id=1, pool_id=1, team_id=i, points=i),
+            make(PoolDetails, year_id=1, pool_id=1, team_id=i),
+            make(MatchScoringDetail, match_id=1, player_id=i, team_id=i),
+            make(TeamPlayerScoringDetail, match_id=1, player_id=i, time=10 * i),
+            make(MatchReport, match_id=1, image_name=f"report{i}.jpg"),
+            make(PlayerYearStats, year_id=1, team_id=i, player_id=i, goals=i, red_card=i),
+        ])
+    session.commit()
+
+
+class StatementCounter:
+    """Counts statements on an engine and the time they take."""
+
+    def __init__(self, engine):
+        self.statements = []
+        self.seconds = 0.0
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_started"] = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        self.seconds += time.perf_counter() - conn.info.pop("query_started")
+        self.statements.append(statement)
+
+    def reset(self) -> None:
+        self.statements = []
+        self.seconds = 0.0
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    from fastapi.testclient import TestClient
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from app.core.reference import reference_data
+    from app.main import app
+
+    path = tmp_path_factory.mktemp("budgets") / "hockey.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(sync_engine)
+    with Session(sync_engine) as session:
+        seed(session)
+    sync_engine.dispose()
+
+    # TestClient runs each request on its own event loop, so connections
+    # must not outlive a request
+    test_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    binds = AsyncSessionLocal.kw["bind"], ReplicaSessionLocal.kw["bind"]
+    AsyncSessionLocal.configure(bind=test_engine)
+    ReplicaSessionLocal.configure(bind=test_engine)
+    reference_data.bump()
+
+    # No lifespan: it would warm the configured MySQL pools
+    client = TestClient(app)
+    client.counter = StatementCounter(test_engine.sync_engine)
+    yield client
+
+    AsyncSessionLocal.configure(bind=binds[0])
+    ReplicaSessionLocal.configure(bind=binds[1])
+    asyncio.run(test_engine.dispose())
+    reference_data.bump()
+
+
+@pytest.mark.parametrize("url", BUDGETS)
+def test_endpoint_stays_within_its_statement_budget(client, url, record_property):
+    # A fresh read-your-writes marker bypasses the cache
+    client.headers[READ_PRIMARY_HEADER] = read_primary_marker()
+    # The first request also builds the reference snapshot
+    client.get(url)
+    client.counter.reset()
+
+    response = client.get(url)
+
+    statements = client.counter.statements
+    record_property("sql_statements", len(statements))
+    record_property("sql_ms", round(client.counter.seconds * 1000, 2))
+    assert response.status_code == 200, response.text
+    # An empty response would hide per-row queries
+    assert response.json(), "no seeded rows matched"
+    assert len(statements) <= BUDGETS[url], "\n\n".join(statements)
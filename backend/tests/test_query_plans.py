@@ -0,0 +1,37 @@
+"""Hot queries must be served by the indexes declared on the models."""
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+
+import app.models  # noqa: F401
+from app.core.database import Base
+from app.core.query_plans import full_scans
+from app.models.news import Official
+
+
+@pytest.fixture
+def connection():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.connect() as connection:
+        yield connection
+    engine.dispose()
+
+
+def test_no_hot_query_scans_a_whole_table(connection):
+    assert full_scans(connection) == {}
+
+
+def test_unindexed_filter_is_reported(connection):
+    queries = {"officials": lambda: select(Official).filter(Official.user_name == "x")}
+
+    assert full_scans(connection, queries) == {"officials": ["hockey_officials"]}
+
+
+def test_other_databases_are_rejected():
+    connection = SimpleNamespace(dialect=postgresql.dialect())
+
+    with pytest.raises(ValueError, match="postgresql"):
+        full_scans(connection)
@@ -0,0 +1,34 @@
+"""Tests for pool ranking and its tiebreakers."""
+from app.services.ranking import pool_complete, rank
+
+
+def tally(points, difference=0, scored=0, won=0):
+    return {"points": points, "goal_diffrence": difference, "goal_far": scored,
+            "match_won": won}
+
+
+def test_points_then_goal_difference_then_goals_scored():
+    tallies = {1: tally(3, 1, 2), 2: tally(3, 1, 4), 3: tally(3, 2, 1), 4: tally(6)}
+
+    assert rank(tallies, []) == [4, 3, 2, 1]
+
+
+def test_head_to_head_separates_teams_level_on_the_table():
+    tallies = {1: tally(6, 2, 5), 2: tally(6, 2, 5), 3: tally(0)}
+
+    assert rank(tallies, [(2, 1, 1, 0)]) == [2, 1, 3]
+
+
+def test_head_to_head_is_reapplied_to_the_teams_still_level():
+    # 3 wins the mini-league of the three; 1 and 2 drew, so their own
+    # mini-league is level and matches won decides
+    tallies = {1: tally(4, 0, 4, won=1), 2: tally(4, 0, 4, won=2), 3: tally(4, 0, 4)}
+    matches = [(1, 2, 1, 1), (3, 1, 2, 0), (3, 2, 2, 0)]
+
+    assert rank(tallies, matches) == [3, 2, 1]
+
+
+def test_pool_is_complete_once_every_fixture_has_a_score():
+    assert not pool_complete([])
+    assert not pool_complete([(1, 2, 1, 0), (1, 3, None, None)])
+    assert pool_complete([(1, 2, 1, 0), (1, 3, 0, 0)])
@@ -0,0 +1,80 @@
+"""Tests for read-your-writes routing between the primary and the replica."""
+import asyncio
+import time
+
+import pytest
+from starlette.requests import Request
+
+from app.core import database
+from app.core.config import settings
+from app.core.database import (
+    READ_PRIMARY_COOKIE, READ_PRIMARY_HEADER, get_read_db, read_primary_marker,
+    reads_from_primary
+)
+
+
+def request(header: str = None, cookie: str = None) -> Request:
+    headers = []
+    if header is not None:
+        headers.append((READ_PRIMARY_HEADER.lower().encode(), header.encode()))
+    if cookie is not None:
+        headers.append((b"cookie", f"{READ_PRIMARY_COOKIE}={cookie}".encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def signed(until: float) -> str:
+    value = f"{until:.3f}"
+    return f"{value}.{database._sign_read_primary(value)}"
+
+
+def test_a_fresh_marker_reads_from_the_primary():
+    marker = read_primary_marker()
+
+    assert reads_from_primary(request(header=marker))
+    assert reads_from_primary(request(cookie=marker))
+    assert not reads_from_primary(request())
+
+
+@pytest.mark.parametrize("marker", [
+    "inf",
+    "nan",
+    f"{time.time() + 3:.3f}",
+    # Signed for another value
+    f"{time.time() + 3:.3f}.{read_primary_marker().rpartition('.')[2]}",
+    "garbage.",
+])
+def test_unsigned_or_tampered_markers_are_ignored(marker):
+    assert not reads_from_primary(request(header=marker))
+    assert not reads_from_primary(request(cookie=marker))
+
+
+def test_signed_markers_outside_the_window_are_ignored():
+    assert not reads_from_primary(request(header=signed(time.time() - 1)))
+    assert not reads_from_primary(request(
+        header=signed(time.time() + settings.READ_YOUR_WRITES_SECONDS + 60)))
+    assert not reads_from_primary(request(header=signed(float("inf"))))
+
+
+def test_read_sessions_come_from_the_replica_outside_the_window(monkeypatch):
+    replica = object()
+
+    class Replica:
+        def __call__(self):
+            return self
+
+        async def __aenter__(self):
+            return replica
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(database, "ReplicaSessionLocal", Replica())
+
+    async def session_for(req):
+        dependency = get_read_db(req)
+        db = await dependency.__anext__()
+        await dependency.aclose()
+        return db
+
+    assert asyncio.run(session_for(request(header="inf"))) is replica
+    assert asyncio.run(session_for(request(header=read_primary_marker()))) is not replica
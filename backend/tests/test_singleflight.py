@@ -0,0 +1,88 @@
+"""Tests for single-flight request coalescing."""
+import asyncio
+
+import pytest
+
+from app.core.singleflight import SingleFlight
+
+
+def test_concurrent_callers_share_one_computation():
+    flight = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return ["fixture"]
+
+    async def run():
+        return await asyncio.gather(*(flight.do("fixtures:1", load) for _ in range(50)))
+
+    results = asyncio.run(run())
+
+    assert calls == 1
+    assert all(r == ["fixture"] for r in results)
+    assert flight.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 49}
+
+
+def test_distinct_keys_and_later_calls_run_again():
+    flight = SingleFlight()
+    calls = []
+
+    async def load(key):
+        calls.append(key)
+        await asyncio.sleep(0)
+        return key
+
+    async def run():
+        first = await asyncio.gather(
+            flight.do("a", lambda: load("a")), flight.do("b", lambda: load("b")))
+        second = await flight.do("a", lambda: load("a"))
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == ["a", "b"]
+    assert second == "a"
+    assert calls == ["a", "b", "a"]
+
+
+def test_errors_reach_every_waiter_and_are_not_cached():
+    flight = SingleFlight()
+
+    async def boom():
+        await asyncio.sleep(0)
+        raise RuntimeError("db down")
+
+    async def run():
+        return await asyncio.gather(
+            flight.do("k", boom), flight.do("k", boom), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def ok():
+        return 1
+
+    assert asyncio.run(flight.do("k", ok)) == 1
+
+
+def test_cancelled_leader_does_not_cancel_followers():
+    flight = SingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def run():
+        leader = asyncio.ensure_future(flight.do("k", load))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", load))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(run()) == "done"
@@ -0,0 +1,289 @@
+"""Tests for the incremental standings engine."""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from app.models.additional import PoolDetails, PoolMaster
+from app.models.news import Standing
+from app.models.tournament import Fixture, MatchResult
+from app.api.v1 import additional, tournaments
+from app.services.ranking import rank_standings, rerank
+from app.services.standings import TALLY_COLUMNS, apply_result, rebuild_year, revert_result
+
+YEAR = 7
+
+
+def fixture(team_id_1, team_id_2, pool_type=1, pool_id_1=0, pool_id_2=0):
+    return Fixture(
+        year_id=YEAR, date_match=datetime(2026, 1, 1), match_name="m", pool_category_type=1,
+        match_no=1, pool_type=pool_type, team_id_1=team_id_1, team_id_2=team_id_2,
+        pool_id_1=pool_id_1, match_id_1=0, pool_id_2=pool_id_2, match_id_2=0, winner_id=0,
+        match_status=True, match_report_file="")
+
+
+async def seed(session):
+    session.add_all([PoolMaster(id=pool_id, pool_name=name, pool_category_type=1)
+                     for pool_id, name in ((1, "A"), (2, "B"))])
+    # Teams 1-3 play in pool 1, team 4 in pool 2
+    for team_id, pool_id in ((1, 1), (2, 1), (3, 1), (4, 2)):
+        session.add(PoolDetails(year_id=YEAR, pool_id=pool_id, pool_category_type=1,
+                                team_id=team_id, date_created=datetime(2026, 1, 1),
+                                user_created="1", status=1))
+    session.add_all([fixture(1, 2), fixture(2, 3), fixture(1, 4)])
+
+
+@pytest.fixture
+def run(run_in_session):
+    return lambda scenario: run_in_session(
+        scenario, Fixture, MatchResult, PoolDetails, PoolMaster, Standing, seed=seed)
+
+
+@pytest.fixture
+def table(read_table):
+    return lambda session: read_table(session, Standing, "team_id", TALLY_COLUMNS)
+
+
+def test_results_update_only_the_pool_rows_incrementally(run, table):
+    async def scenario(session):
+        results = [MatchResult(fixture_id=1, team1_score=3, team2_score=1),
+                   MatchResult(fixture_id=2, team1_score=2, team2_score=2),
+                   # Cross-pool match: not part of any pool table
+                   MatchResult(fixture_id=3, team1_score=1, team2_score=0)]
+        session.add_all(results)
+        counted = [await apply_result(session, result) for result in results]
+        after_create = await table(session)
+
+        await revert_result(session, results[0])
+        results[0].team1_score, results[0].team2_score = 0, 1
+        await apply_result(session, results[0])
+        return counted, after_create, await table(session)
+
+    counted, after_create, after_update = run(scenario)
+
+    assert counted == [(YEAR, 1), (YEAR, 1), None]
+    # played, won, drawn, lost, for, against, difference, points
+    assert after_create == {1: (1, 1, 0, 0, 3, 1, 2, 3),
+                            2: (2, 0, 1, 1, 3, 5, -2, 1),
+                            3: (1, 0, 1, 0, 2, 2, 0, 1)}
+    assert after_update[1] == (1, 0, 0, 1, 0, 1, -1, 0)
+    assert after_update[2] == (2, 1, 1, 0, 3, 2, 1, 4)
+
+
+def test_rebuild_matches_the_incremental_table(run, table):
+    async def scenario(session):
+        results = [MatchResult(fixture_id=1, team1_score=3, team2_score=1),
+                   MatchResult(fixture_id=2, team1_score=0, team2_score=4),
+                   MatchResult(fixture_id=3, team1_score=1, team2_score=0)]
+        session.add_all(results)
+        for result in results:
+            await apply_result(session, result)
+        await session.flush()
+        incremental = await table(session)
+
+        await rebuild_year(session, YEAR)
+        return incremental, await table(session)
+
+    incremental, rebuilt = run(scenario)
+
+    # Team 4 has not played a pool match but gets its row
+    assert rebuilt == {**incremental, 4: (0,) * len(TALLY_COLUMNS)}
+
+
+def test_rebuild_ranks_each_pool_and_flags_a_finished_pools_winner(run):
+    async def scenario(session):
+        session.add_all([MatchResult(fixture_id=1, team1_score=0, team2_score=2),
+                         MatchResult(fixture_id=2, team1_score=1, team2_score=0)])
+        await session.flush()
+        await rebuild_year(session, YEAR)
+        rows = await session.execute(select(Standing).order_by(Standing.team_id))
+        return [(row.team_id, row.position, row.status_pool_winner) for row in rows.scalars()]
+
+    # Pool 1 has played both its fixtures; pool 2 has none
+    assert run(scenario) == [(1, 3, False), (2, 1, True), (3, 2, False), (4, 1, False)]
+
+
+def test_knockout_rematches_of_pool_teams_do_not_count(run, table):
+    async def scenario(session):
+        # Teams 1 and 2 meet again in a knockout round, and in a fixture
+        # between the winners of pools 1 and 2
+        session.add_all([fixture(1, 2, pool_type=2), fixture(2, 1, pool_id_1=1, pool_id_2=2)])
+        await session.flush()
+        counted = []
+        for fixture_id, scores in ((1, (1, 0)), (2, (0, 0)), (4, (0, 5)), (5, (5, 0))):
+            result = MatchResult(fixture_id=fixture_id, team1_score=scores[0],
+                                 team2_score=scores[1])
+            session.add(result)
+            counted.append(await apply_result(session, result))
+        await rerank(session, *counted)
+        incremental = await table(session)
+        winners = (await session.execute(
+            select(Standing.team_id).filter(Standing.status_pool_winner))).scalars().all()
+
+        await rebuild_year(session, YEAR)
+        return counted, incremental, winners, await table(session)
+
+    counted, incremental, winners, rebuilt = run(scenario)
+
+    assert counted == [(YEAR, 1), (YEAR, 1), None, None]
+    assert incremental[1] == (1, 1, 0, 0, 1, 0, 1, 3)
+    assert incremental[2] == (2, 0, 1, 1, 0, 1, -1, 1)
+    # Both pool 1 fixtures are played; the knockouts leave the winner alone
+    assert winners == [1]
+    assert rebuilt == {**incremental, 4: (0,) * len(TALLY_COLUMNS)}
+
+
+def test_moving_a_fixture_out_of_the_pool_stage_takes_its_result_out(run, table):
+    async def scenario(session):
+        await tournaments.create_result(
+            tournaments.MatchResultCreate(fixture_id=1, team1_score=2, team2_score=0), db=session)
+        await tournaments.update_fixture(1, tournaments.FixtureUpdate(pool_type=2), db=session)
+        return await table(session)
+
+    assert run(scenario) == {1: (0,) * len(TALLY_COLUMNS), 2: (0,) * len(TALLY_COLUMNS)}
+
+
+def test_rows_kept_under_another_category_are_still_ranked(run):
+    async def scenario(session):
+        # Hand-kept rows predating the pool category
+        session.add_all([Standing(year_id=YEAR, pool_id=1, team_id=team_id)
+                         for team_id in (1, 2)])
+        await session.flush()
+        result = MatchResult(fixture_id=1, team1_score=0, team2_score=2)
+        session.add(result)
+        await rerank(session, await apply_result(session, result))
+        rows = await session.execute(select(Standing).order_by(Standing.team_id))
+        return [(row.team_id, row.pool_category_type, row.points, row.position)
+                for row in rows.scalars()]
+
+    assert run(scenario) == [(1, None, 0, 2), (2, None, 3, 1)]
+
+
+def test_ranking_keeps_the_winner_flags_of_tables_kept_by_hand(run):
+    async def scenario(session):
+        # No fixtures recorded for that year; the winner was set by hand
+        session.add_all([
+            Standing(year_id=YEAR - 1, pool_id=1, team_id=1, points=3, status_pool_winner=False),
+            Standing(year_id=YEAR - 1, pool_id=1, team_id=2, points=6, status_pool_winner=False),
+            Standing(year_id=YEAR - 1, pool_id=1, team_id=3, points=1, status_pool_winner=True),
+        ])
+        await rank_standings(session, [YEAR - 1])
+        rows = await session.execute(select(Standing).order_by(Standing.team_id))
+        return [(row.team_id, row.position, row.status_pool_winner) for row in rows.scalars()]
+
+    assert run(scenario) == [(1, 2, False), (2, 1, False), (3, 3, True)]
+
+
+def test_result_and_fixture_writes_keep_the_ranked_table_current(run):
+    async def scenario(session):
+        async def ranked():
+            rows = await session.execute(select(Standing).order_by(Standing.team_id))
+            return [(row.team_id, row.points, row.position, row.status_pool_winner)
+                    for row in rows.scalars()]
+
+        steps = []
+        await tournaments.create_result(
+            tournaments.MatchResultCreate(fixture_id=1, team1_score=2, team2_score=0), db=session)
+        steps.append(await ranked())
+        second = await tournaments.create_result(
+            tournaments.MatchResultCreate(fixture_id=2, team1_score=0, team2_score=0), db=session)
+        steps.append(await ranked())
+        await tournaments.update_result(
+            1, tournaments.MatchResultUpdate(team1_score=0, team2_score=1), db=session)
+        steps.append(await ranked())
+        await tournaments.delete_result(second.id, db=session)
+        steps.append(await ranked())
+        # Team 3 takes team 2's place in the fixture, and its result
+        await tournaments.update_fixture(1, tournaments.FixtureUpdate(team_id_2=3), db=session)
+        steps.append(await ranked())
+        await tournaments.delete_fixture(1, db=session)
+        steps.append(await ranked())
+        return steps
+
+    created, completed, updated, deleted, moved, fixture_deleted = run(scenario)
+
+    # (team, points, position, pool winner)
+    assert created == [(1, 3, 1, False), (2, 0, 2, False)]
+    # Both pool 1 fixtures played: the leader wins the pool
+    assert completed == [(1, 3, 1, True), (2, 1, 3, False), (3, 1, 2, False)]
+    assert updated == [(1, 0, 3, False), (2, 4, 1, True), (3, 1, 2, False)]
+    # A fixture is unplayed again, so the pool has no winner yet
+    assert deleted == [(1, 0, 3, False), (2, 3, 1, False), (3, 0, 2, False)]
+    assert moved == [(1, 0, 3, False), (2, 0, 2, False), (3, 3, 1, False)]
+    assert fixture_deleted == [(1, 0, 1, False), (2, 0, 2, False), (3, 0, 3, False)]
+
+
+def test_fixture_writes_open_and_close_a_pool(run):
+    async def scenario(session):
+        async def winners():
+            rows = await session.execute(
+                select(Standing.status_pool_winner).order_by(Standing.team_id))
+            return rows.scalars().all()
+
+        steps = []
+        result = await tournaments.create_result(
+            tournaments.MatchResultCreate(fixture_id=1, team1_score=1, team2_score=0), db=session)
+        # Fixture 1 is now the pool's only fixture, and it is played
+        await tournaments.delete_fixture(2, db=session)
+        steps.append(await winners())
+        added = await tournaments.create_fixture(tournaments.FixtureCreate(
+            year_id=YEAR, date_match=datetime(2026, 1, 2), match_name="m", pool_category_type=1,
+            match_no=2, pool_type=1, team_id_1=2, team_id_2=3), db=session)
+        steps.append(await winners())
+        # Moved out of the pool stage
+        await tournaments.update_fixture(
+            added.id, tournaments.FixtureUpdate(team_id_2=4), db=session)
+        steps.append(await winners())
+        await tournaments.delete_result(result.id, db=session)
+        steps.append(await winners())
+        return steps
+
+    closed, reopened, moved_out, result_deleted = run(scenario)
+
+    assert closed == [True, False]
+    assert reopened == [False, False]
+    assert moved_out == [True, False]
+    assert result_deleted == [False, False]
+
+
+def test_editing_a_pool_kept_by_hand_leaves_its_year_alone(run, read_table):
+    async def scenario(session):
+        # No results recorded; tallies and winners were entered by hand
+        session.add_all([
+            Standing(year_id=YEAR, pool_id=1, team_id=1, points=4, position=2),
+            Standing(year_id=YEAR, pool_id=1, team_id=2, points=6, position=1,
+                     status_pool_winner=True),
+            Standing(year_id=YEAR, pool_id=1, team_id=3, points=1, position=3),
+            Standing(year_id=YEAR, pool_id=2, team_id=4, points=9, position=1,
+                     status_pool_winner=True),
+        ])
+        await session.commit()
+        before = await ranked(session)
+        await additional.update_pool_teams(
+            1, additional.PoolTeamsUpdate(team_ids=[1, 2], year_id=YEAR), db=session)
+        return before, await ranked(session)
+
+    async def ranked(session):
+        return await read_table(session, Standing, "team_id",
+                                ("pool_id", "points", "position", "status_pool_winner"))
+
+    before, after = run(scenario)
+
+    assert after == before
+
+
+def test_editing_a_pool_with_results_rebuilds_only_that_pool(run, read_table):
+    async def scenario(session):
+        session.add(Standing(year_id=YEAR, pool_id=2, team_id=4, points=9, position=1,
+                             status_pool_winner=True))
+        await tournaments.create_result(
+            tournaments.MatchResultCreate(fixture_id=1, team1_score=3, team2_score=1), db=session)
+        await tournaments.create_result(
+            tournaments.MatchResultCreate(fixture_id=2, team1_score=2, team2_score=0), db=session)
+        # Team 3 leaves pool 1: its match against team 2 no longer counts
+        await additional.update_pool_teams(
+            1, additional.PoolTeamsUpdate(team_ids=[1, 2], year_id=YEAR), db=session)
+        return await read_table(session, Standing, "team_id",
+                                ("pool_id", "points", "position", "status_pool_winner"))
+
+    assert run(scenario) == {1: (1, 3, 1, True), 2: (1, 0, 2, False), 4: (2, 9, 1, True)}
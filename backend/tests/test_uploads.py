@@ -0,0 +1,45 @@
+"""Tests for content-addressed upload storage and serving."""
+import io
+import os
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.uploads import (
+    _FILE_MODE, IMMUTABLE, UPLOAD_REVALIDATE, UploadFiles, _extension, _store_file,
+    is_content_addressed
+)
+
+
+def test_identical_content_is_stored_once(tmp_path):
+    first = _store_file(io.BytesIO(b"logo"), str(tmp_path), ".png")
+    second = _store_file(io.BytesIO(b"logo"), str(tmp_path), ".png")
+    other = _store_file(io.BytesIO(b"other"), str(tmp_path), ".png")
+
+    assert first == second != other
+    assert is_content_addressed(first)
+    assert sorted(os.listdir(tmp_path)) == sorted({first, other})
+
+
+def test_stored_files_get_the_default_file_mode(tmp_path):
+    stored = _store_file(io.BytesIO(b"logo"), str(tmp_path), ".png")
+
+    # Not the 0600 of the temp file it was written to
+    assert os.stat(tmp_path / stored).st_mode & 0o777 == _FILE_MODE
+
+
+def test_extension_is_normalised():
+    assert _extension("Team Logo.JPG") == ".jpg"
+    assert _extension("../../etc/passwd") == ""
+    assert _extension(None) == ""
+
+
+def test_cache_control_depends_on_filename(tmp_path):
+    hashed = _store_file(io.BytesIO(b"photo"), str(tmp_path), ".jpg")
+    (tmp_path / "1700000000_photo.jpg").write_bytes(b"legacy")
+    app = FastAPI()
+    app.mount("/uploads", UploadFiles(directory=str(tmp_path)))
+    client = TestClient(app)
+
+    assert client.get(f"/uploads/{hashed}").headers["cache-control"] == IMMUTABLE
+    assert client.get("/uploads/1700000000_photo.jpg").headers["cache-control"] == UPLOAD_REVALIDATE